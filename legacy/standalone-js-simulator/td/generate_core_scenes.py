@@ -23,6 +23,85 @@ Date: 2025
 
 import td
 
+# Wireframe shape table:
+# (name, SOP type, node X, geo SOP pars, params CHOP channels, orient rx, resample segment length)
+# The segment length is evaluated inside the resample script, where `params` is the params CHOP
+SHAPE_TABLE = [
+    ('sphere', sphereSOP, -400,
+     [('type', 'poly'), ('rad', "5 + chf('../params/size') * 5"), ('divsu', 20), ('divst', 20)],
+     [('size', 1.0), ('thickness', 0.5)],
+     None, "1.0 / params['thickness'][0]"),
+    ('torus', torusSOP, 0,
+     [('type', 'poly'), ('rady', "10 * chf('../params/size')"), ('radx', "3 * chf('../params/size')"),
+      ('divsu', 30), ('divst', 15)],
+     [('size', 1.0), ('thickness', 0.5)],
+     90, "1.0 / params['thickness'][0]"),
+    ('cube', boxSOP, 200,
+     [('type', 'poly'), ('sizex', "15 * chf('../params/size')"), ('sizey', "15 * chf('../params/size')"),
+      ('sizez', "15 * chf('../params/size')")],
+     [('size', 1.0)],
+     None, 1.0),
+    ('plane', gridSOP, 600,
+     [('rows', "int(15 * chf('../params/size'))"), ('cols', "int(15 * chf('../params/size'))"),
+      ('sizex', "20 * chf('../params/size')"), ('sizey', "20 * chf('../params/size')"), ('orient', 'xy')],
+     [('size', 1.0)],
+     None, None),
+]
+
+# Wrangle VEX snippets, written into a Text DAT next to each wrangle
+RESPAWN_VEX = """
+if (@P.y < -25) {
+    @P.y = 25;
+    @P.x = fit01(rand(@id * 0.1), -15, 15);
+    @P.z = fit01(rand(@id * 0.2), -15, 15);
+}
+"""
+
+RIPPLE_VEX = """
+float time = chop('../../utilities/time_control/TIME_OUT')[0];
+float freq = chf('frequency');
+float amp = chf('amplitude');
+
+float dist = length(set(@P.x, @P.z));
+float wave = sin(dist * freq - time * 5) * amp * 5;
+
+@P.y = wave;
+"""
+
+PLANE_WAVE_VEX = """
+float time = chop('../../utilities/time_control/TIME_OUT')[0];
+float freq = chf('frequency');
+float amp = chf('amplitude');
+
+float wave = sin(@P.z * freq - time * 5) * amp * 5;
+@P.y = wave;
+"""
+
+STANDING_WAVE_VEX = """
+float time = chop('../../utilities/time_control/TIME_OUT')[0];
+float freq = chf('frequency');
+float amp = chf('amplitude');
+
+float waveX = sin(@P.x * freq);
+float waveZ = sin(@P.z * freq);
+float timeWave = sin(time * 3);
+
+@P.y = waveX * waveZ * timeWave * amp * 5;
+"""
+
+PERLIN_DENSITY_VEX = """
+float time = chop('../../utilities/time_control/TIME_OUT')[0];
+float scale = chf('scale');
+vector pos = @P / (10.0 / scale);
+pos.z += time;
+
+f@density = noise(pos);
+"""
+
+# Switch index order for the shape selector
+SHAPE_ORDER = ('sphere', 'helix', 'torus', 'cube', 'pyramid', 'plane')
+
+
 class CoreScenesGenerator:
     """Generator for core volumetric display scenes"""
 
@@ -116,6 +195,7 @@ class CoreScenesGenerator:
         null.setInput(0, math)
         null.nodeX = math.nodeX + 150
         null.color = (0.5, 1, 0.5)
+        self.time_out = null
 
     def create_noise_generator(self):
         """Create 3D noise generator (TOP-based)"""
@@ -138,9 +218,47 @@ class CoreScenesGenerator:
         noise.par.outputresolution = 'constant'
         noise.par.resolutionw = 256
         noise.par.resolutionh = 256
-        noise.par.period = "10 / chf('../params/scale')"
-        noise.par.harmonics = "int(chf('../params/octaves'))"
-        noise.par.posz = "chop('../../time_control/TIME_OUT')[0] * chf('../params/speed')"
+
+        # Scroll depth: time * speed, computed in CHOPs so it streams in on cook
+        time_in = container.create(selectCHOP, 'time_in')
+        time_in.par.chops = self.time_out
+        time_in.nodeX = params.nodeX
+        time_in.nodeY = params.nodeY - 100
+
+        speed = container.create(selectCHOP, 'speed')
+        speed.par.channames = 'speed'
+        speed.setInput(0, params)
+        speed.nodeX = params.nodeX
+        speed.nodeY = params.nodeY - 200
+
+        posz = container.create(mathCHOP, 'posz')
+        posz.par.combine = 'mult'
+        posz.setInput(0, time_in)
+        posz.setInput(1, speed)
+        posz.nodeX = time_in.nodeX + 200
+        posz.nodeY = time_in.nodeY - 50
+
+        # Period: 10 / scale, computed in CHOPs so the parameter binds to a channel
+        scale = container.create(selectCHOP, 'scale')
+        scale.par.channames = 'scale'
+        scale.setInput(0, params)
+        scale.nodeX = params.nodeX
+        scale.nodeY = params.nodeY - 300
+
+        period = container.create(expressionCHOP, 'period')
+        period.par.expr0.expr = '10 / me.inputVal'
+        period.par.outputname0 = 'period'
+        period.setInput(0, scale)
+        period.nodeX = scale.nodeX + 200
+        period.nodeY = scale.nodeY
+
+        # Bind to the channels rather than re-evaluating Python expressions every frame
+        noise.par.period.bindExpr = "op('period')[0]"
+        noise.par.period.mode = ParMode.BIND
+        noise.par.harmonics.bindExpr = "op('params')['octaves']"
+        noise.par.harmonics.mode = ParMode.BIND
+        noise.par.posz.bindExpr = "op('posz')[0]"
+        noise.par.posz.mode = ParMode.BIND
 
         # Output
         null = container.create(nullTOP, 'NOISE_OUT')
@@ -148,6 +266,14 @@ class CoreScenesGenerator:
         null.nodeX = noise.nodeX + 200
         null.color = (0.5, 1, 0.5)
 
+    def _set_vex_snippet(self, wrangle, code):
+        """Store VEX code in a Text DAT beside the wrangle and point the snippet at it"""
+        src = wrangle.parent().create(textDAT, wrangle.name + '_vex')
+        src.text = code
+        src.nodeX = wrangle.nodeX
+        src.nodeY = wrangle.nodeY - 100
+        wrangle.par.snippet.expr = "op('%s').text" % src.name
+
     # ========================================================================
     # SHAPE MORPH SCENES
     # ========================================================================
@@ -160,55 +286,119 @@ class CoreScenesGenerator:
         container = self.core_scenes.create(baseCOMP, 'shape_morph')
         container.nodeX = -600
 
-        self.create_sphere_shape(container)
-        self.create_helix_shape(container)
-        self.create_torus_shape(container)
-        self.create_cube_shape(container)
-        self.create_pyramid_shape(container)
-        self.create_plane_shape(container)
+        # Sphere, torus, cube and plane share one table-driven construction path
+        outs = {name: self._make_wireframe_shape(container, name, *spec)
+                for name, *spec in SHAPE_TABLE}
 
-        # Shape selector switch
-        self.create_shape_selector(container)
+        # Script-generated shapes
+        outs['helix'] = self.create_helix_shape(container)
+        outs['pyramid'] = self.create_pyramid_shape(container)
 
-    def create_sphere_shape(self, parent):
-        """Create sphere shape"""
-        container = parent.create(baseCOMP, 'sphere')
-        container.nodeX = -400
+        # Keep the OUT nulls in switch-index order
+        self.shape_outs = [outs[name] for name in SHAPE_ORDER]
+
+        # Shape selector switch
+        self.create_shape_selector(container, self.shape_outs)
+
+    def _make_wireframe_shape(self, parent, name, sop_type, node_x, geo_pars, params,
+                              orient_rx=None, max_seg_length=None):
+        """
+        Create a params -> geo SOP -> (orient) -> facet -> resample -> OUT chain.
+
+        The resample stage is a Script SOP that walks each edge by arc length
+        and caches the resulting points, so static shapes only resample again
+        when a params channel changes.
+
+        Args:
+            parent: Container COMP for the shape
+            name: Shape container name
+            sop_type: SOP type for the base geometry
+            node_x: Network X position of the shape container
+            geo_pars: List of (parameter, value) pairs for the geo SOP
+            params: List of (channel, default) pairs for the params CHOP
+            orient_rx: Optional X rotation applied before the wireframe
+            max_seg_length: Resample segment length (number or expression over
+                `params`), or None to skip the facet/resample stage and output
+                the geometry directly
+        """
+        container = parent.create(baseCOMP, name)
+        container.nodeX = node_x
         container.nodeY = 200
 
         # Parameters
-        params = container.create(constantCHOP, 'params')
-        params.par.name0 = 'size'
-        params.par.value0 = 1.0
-        params.par.name1 = 'thickness'
-        params.par.value1 = 0.5
+        params_chop = container.create(constantCHOP, 'params')
+        for i, (channel, default) in enumerate(params):
+            setattr(params_chop.par, 'name%d' % i, channel)
+            setattr(params_chop.par, 'value%d' % i, default)
 
-        # Sphere SOP
-        sphere = container.create(sphereSOP, 'sphere_geo')
-        sphere.par.type = 'poly'
-        sphere.par.rad = "5 + chf('../params/size') * 5"
-        sphere.par.divsu = 20
-        sphere.par.divst = 20
+        # Base geometry
+        geo = container.create(sop_type, name + '_geo')
+        for par, value in geo_pars:
+            setattr(geo.par, par, value)
+        last = geo
 
-        # Optional: Make wireframe
-        facet = container.create(facetSOP, 'wireframe')
-        facet.par.inlineu = True
-        facet.par.inlinev = True
-        facet.setInput(0, sphere)
-        facet.nodeX = sphere.nodeX + 150
-
-        # Resample to points
-        resample = container.create(resampleSOP, 'to_points')
-        resample.par.dosegs = True
-        resample.par.maxseglength = "1.0 / chf('../params/thickness')"
-        resample.setInput(0, facet)
-        resample.nodeX = facet.nodeX + 150
+        # Rotate to vertical
+        if orient_rx is not None:
+            xform = container.create(transformSOP, 'orient')
+            xform.par.rx = orient_rx
+            xform.setInput(0, last)
+            xform.nodeX = last.nodeX + 150
+            last = xform
+
+        if max_seg_length is not None:
+            # Wireframe
+            facet = container.create(facetSOP, 'wireframe')
+            facet.par.inlineu = True
+            facet.par.inlinev = True
+            facet.setInput(0, last)
+            facet.nodeX = last.nodeX + 150
+
+            # Resample to points, cached until params change
+            resample = container.create(scriptSOP, 'to_points')
+            resample.par.python = """
+import numpy as np
+
+params = op('../params')
+key = tuple(chan[0] for chan in params.chans())
+cache = scriptOp.storage
+
+if cache.get('key') != key:
+    seg = max(float(""" + str(max_seg_length) + """), 1e-3)
+
+    positions = []
+    for prim in scriptOp.inputs[0].geometry().prims():
+        verts = [v.point().position() for v in prim.vertices()]
+        if prim.isClosed():
+            verts.append(verts[0])
+        verts = np.array(verts, dtype=float)
+        if len(verts) < 2:
+            positions.extend(map(tuple, verts))
+            continue
+
+        # Evenly spaced samples along the edge arc length
+        arc = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(verts, axis=0), axis=1))))
+        samples = np.linspace(0.0, arc[-1], max(2, int(np.ceil(arc[-1] / seg)) + 1))
+        positions.extend(zip(np.interp(samples, arc, verts[:, 0]),
+                             np.interp(samples, arc, verts[:, 1]),
+                             np.interp(samples, arc, verts[:, 2])))
+
+    geo = hou.Geometry()
+    geo.createPoints(positions)
+    cache['key'] = key
+    cache['geo'] = geo
+
+scriptOp.setGeometry(cache['geo'])
+"""
+            resample.setInput(0, facet)
+            resample.nodeX = facet.nodeX + 150
+            last = resample
 
         # Output
         null = container.create(nullSOP, 'OUT')
-        null.setInput(0, resample)
-        null.nodeX = resample.nodeX + 150
+        null.setInput(0, last)
+        null.nodeX = last.nodeX + 150
         null.color = (1, 0.7, 0)
+        return null
 
     def create_helix_shape(self, parent):
         """Create helix/spiral shape"""
@@ -235,12 +425,11 @@ turns = parent().par.Turns
 radius = parent().par.Radius
 time = op('../../utilities/time_control/TIME_OUT')[0]
 
-geo = hou.Geometry()
-poly = geo.createPolygon()
-
 numPoints = 200
 gridY = 50
+r = 8 * size * radius
 
+positions = []
 for i in range(numPoints):
     t = float(i) / (numPoints - 1)
 
@@ -250,14 +439,12 @@ for i in range(numPoints):
     # Spiral angle
     angle = t * turns * math.pi * 2 + time
 
-    # Position
-    r = 8 * size * radius
-    x = math.cos(angle) * r
-    z = math.sin(angle) * r
+    positions.append((math.cos(angle) * r, y, math.sin(angle) * r))
 
-    pt = geo.createPoint()
-    pt.setPosition((x, y, z))
-    poly.addVertex(pt)
+# Create all points and the polyline in bulk
+geo = hou.Geometry()
+poly = geo.createPolygon()
+poly.addVertices(geo.createPoints(positions))
 
 scriptOp.setGeometry(geo)
 """
@@ -274,91 +461,7 @@ scriptOp.setGeometry(geo)
         null.setInput(0, resample)
         null.nodeX = resample.nodeX + 150
         null.color = (1, 0.7, 0)
-
-    def create_torus_shape(self, parent):
-        """Create torus shape"""
-        container = parent.create(baseCOMP, 'torus')
-        container.nodeX = 0
-        container.nodeY = 200
-
-        # Parameters
-        params = container.create(constantCHOP, 'params')
-        params.par.name0 = 'size'
-        params.par.value0 = 1.0
-        params.par.name1 = 'thickness'
-        params.par.value1 = 0.5
-
-        # Torus SOP
-        torus = container.create(torusSOP, 'torus_geo')
-        torus.par.type = 'poly'
-        torus.par.rady = "10 * chf('../params/size')"
-        torus.par.radx = "3 * chf('../params/size')"
-        torus.par.divsu = 30
-        torus.par.divst = 15
-
-        # Rotate to vertical
-        xform = container.create(transformSOP, 'orient')
-        xform.par.rx = 90
-        xform.setInput(0, torus)
-        xform.nodeX = torus.nodeX + 150
-
-        # Wireframe
-        facet = container.create(facetSOP, 'wireframe')
-        facet.par.inlineu = True
-        facet.par.inlinev = True
-        facet.setInput(0, xform)
-        facet.nodeX = xform.nodeX + 150
-
-        # Resample
-        resample = container.create(resampleSOP, 'to_points')
-        resample.par.dosegs = True
-        resample.par.maxseglength = "1.0 / chf('../params/thickness')"
-        resample.setInput(0, facet)
-        resample.nodeX = facet.nodeX + 150
-
-        # Output
-        null = container.create(nullSOP, 'OUT')
-        null.setInput(0, resample)
-        null.nodeX = resample.nodeX + 150
-        null.color = (1, 0.7, 0)
-
-    def create_cube_shape(self, parent):
-        """Create cube shape"""
-        container = parent.create(baseCOMP, 'cube')
-        container.nodeX = 200
-        container.nodeY = 200
-
-        # Parameters
-        params = container.create(constantCHOP, 'params')
-        params.par.name0 = 'size'
-        params.par.value0 = 1.0
-
-        # Box
-        box = container.create(boxSOP, 'box_geo')
-        box.par.type = 'poly'
-        box.par.sizex = "15 * chf('../params/size')"
-        box.par.sizey = "15 * chf('../params/size')"
-        box.par.sizez = "15 * chf('../params/size')"
-
-        # Wireframe
-        facet = container.create(facetSOP, 'wireframe')
-        facet.par.inlineu = True
-        facet.par.inlinev = True
-        facet.setInput(0, box)
-        facet.nodeX = box.nodeX + 150
-
-        # Resample
-        resample = container.create(resampleSOP, 'to_points')
-        resample.par.dosegs = True
-        resample.par.maxseglength = 1.0
-        resample.setInput(0, facet)
-        resample.nodeX = facet.nodeX + 150
-
-        # Output
-        null = container.create(nullSOP, 'OUT')
-        null.setInput(0, resample)
-        null.nodeX = resample.nodeX + 150
-        null.color = (1, 0.7, 0)
+        return null
 
     def create_pyramid_shape(self, parent):
         """Create pyramid shape"""
@@ -380,32 +483,22 @@ height = 20 * size
 
 geo = hou.Geometry()
 
-# Base vertices
-v0 = geo.createPoint()
-v0.setPosition((-base, -height/2, -base))
-v1 = geo.createPoint()
-v1.setPosition((base, -height/2, -base))
-v2 = geo.createPoint()
-v2.setPosition((base, -height/2, base))
-v3 = geo.createPoint()
-v3.setPosition((-base, -height/2, base))
-
-# Apex
-apex = geo.createPoint()
-apex.setPosition((0, height/2, 0))
+# Four base corners followed by the apex
+pts = geo.createPoints([
+    (-base, -height/2, -base),
+    (base, -height/2, -base),
+    (base, -height/2, base),
+    (-base, -height/2, base),
+    (0, height/2, 0),
+])
+apex = pts[4]
 
 # Create edges
-# Base edges
 for i in range(4):
-    poly = geo.createPolygon()
-    poly.addVertex(geo.points()[i])
-    poly.addVertex(geo.points()[(i+1)%4])
-
-# Side edges
-for i in range(4):
-    poly = geo.createPolygon()
-    poly.addVertex(geo.points()[i])
-    poly.addVertex(apex)
+    # Base edge
+    geo.createPolygon().addVertices((pts[i], pts[(i+1)%4]))
+    # Side edge
+    geo.createPolygon().addVertices((pts[i], apex))
 
 scriptOp.setGeometry(geo)
 """
@@ -422,33 +515,9 @@ scriptOp.setGeometry(geo)
         null.setInput(0, resample)
         null.nodeX = resample.nodeX + 150
         null.color = (1, 0.7, 0)
+        return null
 
-    def create_plane_shape(self, parent):
-        """Create plane shape"""
-        container = parent.create(baseCOMP, 'plane')
-        container.nodeX = 600
-        container.nodeY = 200
-
-        # Parameters
-        params = container.create(constantCHOP, 'params')
-        params.par.name0 = 'size'
-        params.par.value0 = 1.0
-
-        # Grid
-        grid = container.create(gridSOP, 'grid_geo')
-        grid.par.rows = "int(15 * chf('../params/size'))"
-        grid.par.cols = "int(15 * chf('../params/size'))"
-        grid.par.sizex = "20 * chf('../params/size')"
-        grid.par.sizey = "20 * chf('../params/size')"
-        grid.par.orient = 'xy'
-
-        # Output
-        null = container.create(nullSOP, 'OUT')
-        null.setInput(0, grid)
-        null.nodeX = grid.nodeX + 150
-        null.color = (1, 0.7, 0)
-
-    def create_shape_selector(self, parent):
+    def create_shape_selector(self, parent, outs):
         """Create shape selector switch"""
         # Shape index selector
         selector = parent.create(constantCHOP, 'shape_select')
@@ -459,12 +528,8 @@ scriptOp.setGeometry(geo)
         # Switch SOP
         switch = parent.create(switchSOP, 'shape_output')
         switch.par.index = 'int(chop("./shape_select")[0])'
-        switch.setInput(0, parent.op('sphere/OUT'))
-        switch.setInput(1, parent.op('helix/OUT'))
-        switch.setInput(2, parent.op('torus/OUT'))
-        switch.setInput(3, parent.op('cube/OUT'))
-        switch.setInput(4, parent.op('pyramid/OUT'))
-        switch.setInput(5, parent.op('plane/OUT'))
+        for i, out in enumerate(outs):
+            switch.setInput(i, out)
         switch.nodeX = selector.nodeX + 200
         switch.nodeY = selector.nodeY
 
@@ -486,12 +551,14 @@ scriptOp.setGeometry(geo)
         container = self.core_scenes.create(baseCOMP, 'particle_flow')
         container.nodeX = -300
 
-        self.create_particle_system_basic(container)
-        self.create_particle_spiral(container)
-        self.create_particle_tornado(container)
+        self.particle_outs = [
+            self.create_particle_system_basic(container),
+            self.create_particle_spiral(container),
+            self.create_particle_tornado(container),
+        ]
 
         # Particle pattern selector
-        self.create_particle_selector(container)
+        self.create_particle_selector(container, self.particle_outs)
 
     def create_particle_system_basic(self, parent):
         """Create basic particle system"""
@@ -521,15 +588,9 @@ scriptOp.setGeometry(geo)
 
         # POP Wrangle (respawn at top when hitting bottom)
         wrangle = pop.create(popWranglePOP, 'respawn')
-        wrangle.par.snippet = """
-if (@P.y < -25) {
-    @P.y = 25;
-    @P.x = fit01(rand(@id * 0.1), -15, 15);
-    @P.z = fit01(rand(@id * 0.2), -15, 15);
-}
-"""
         wrangle.setInput(0, force)
         wrangle.nodeX = force.nodeX + 150
+        self._set_vex_snippet(wrangle, RESPAWN_VEX)
 
         # Output
         output = pop.create(popOutputPOP, 'output')
@@ -542,114 +603,112 @@ if (@P.y < -25) {
         null.par.objpath = './pop_network/output'
         null.nodeX = pop.nodeX + 300
         null.color = (1, 0.7, 0)
+        return null
 
     def create_particle_spiral(self, parent):
         """Create spiral particle system"""
-        container = parent.create(baseCOMP, 'particles_spiral')
-        container.nodeX = -100
-
-        # Parameters
-        params = container.create(constantCHOP, 'params')
-        params.par.name0 = 'density'
-        params.par.value0 = 0.5
-        params.par.name1 = 'speed'
-        params.par.value1 = 1.0
-
-        # POP Network
-        pop = container.create(baseCOMP, 'pop_network')
-
-        # Source
-        source = pop.create(popSourcePOP, 'source')
-        source.par.birthrate = "50 * chf('../params/density')"
-        source.par.lifeexp = 10
-
-        # Spiral motion wrangle
-        wrangle = pop.create(popWranglePOP, 'spiral_motion')
-        wrangle.par.snippet = """
-float speed = chf('speed');
-float angle = @age * speed + @id * 0.1;
-float radius = 8 + @age * 0.5;
-
-@P.x = cos(angle) * radius;
-@P.z = sin(angle) * radius;
-@P.y = 25 - @age * 5 * speed;
-
-if (@P.y < -25) {
-    @dead = 1;
-}
-"""
-        wrangle.setInput(0, source)
-        wrangle.nodeX = source.nodeX + 150
-
-        # Output
-        output = pop.create(popOutputPOP, 'output')
-        output.setInput(0, wrangle)
-        output.nodeX = wrangle.nodeX + 150
-
-        # Convert to geometry
-        null = container.create(nullSOP, 'OUT')
-        null.par.createinputnode = False
-        null.par.objpath = './pop_network/output'
-        null.nodeX = pop.nodeX + 300
-        null.color = (1, 0.7, 0)
+        # Birthrate 50/s, life 10s; particles die once they fall below y = -25
+        return self._make_sampled_particles(parent, 'particles_spiral', -100, [
+            ('density', 0.5),
+            ('speed', 1.0),
+        ], """
+rate = max(50 * params['density'][0], 1e-3)
+speed = max(params['speed'][0], 1e-3)
+lifespan = min(10.0, 50.0 / (5 * speed))
+ids, age = sample_particles(rate, lifespan)
+
+angle = age * speed + ids * 0.1
+radius = 8 + age * 0.5
+
+tx = np.cos(angle) * radius
+ty = 25 - age * 5 * speed
+tz = np.sin(angle) * radius
+""")
 
     def create_particle_tornado(self, parent):
         """Create tornado/vortex particle system"""
-        container = parent.create(baseCOMP, 'particles_tornado')
-        container.nodeX = 100
+        # Birthrate 80/s, life 8s; particles die once they rise above y = 25
+        return self._make_sampled_particles(parent, 'particles_tornado', 100, [
+            ('density', 0.5),
+            ('speed', 1.0),
+            ('radius', 1.0),
+        ], """
+rate = max(80 * params['density'][0], 1e-3)
+speed = max(params['speed'][0], 1e-3)
+max_radius = params['radius'][0] * 10
+lifespan = min(8.0, 50.0 / (6 * speed))
+ids, age = sample_particles(rate, lifespan)
+
+# Spiral upward, narrowing from max_radius at the bottom to 2 at the top
+angle = age * speed * 2 + ids * 0.2
+height = -25 + age * 6 * speed
+radius = max_radius + (height + 25) / 50 * (2 - max_radius)
+
+tx = np.cos(angle) * radius
+ty = height
+tz = np.sin(angle) * radius
+""")
+
+    def _make_sampled_particles(self, parent, name, node_x, params, pattern):
+        """
+        Create a particle system whose positions are a pure function of age and id.
+
+        Instead of integrating a POP network, a Script CHOP evaluates the motion
+        formula for every live particle in one vectorized pass and a CHOP to SOP
+        turns the samples into points. Particle k is the one born k emissions
+        ago, so its id and age follow directly from the birthrate and time.
+
+        Args:
+            parent: Container COMP for the particle system
+            name: Particle system container name
+            node_x: Network X position of the container
+            params: List of (channel, default) pairs for the params CHOP
+            pattern: Python snippet computing tx, ty, tz arrays from ids/age
+        """
+        container = parent.create(baseCOMP, name)
+        container.nodeX = node_x
 
         # Parameters
-        params = container.create(constantCHOP, 'params')
-        params.par.name0 = 'density'
-        params.par.value0 = 0.5
-        params.par.name1 = 'speed'
-        params.par.value1 = 1.0
-        params.par.name2 = 'radius'
-        params.par.value2 = 1.0
+        params_chop = container.create(constantCHOP, 'params')
+        for i, (channel, default) in enumerate(params):
+            setattr(params_chop.par, 'name%d' % i, channel)
+            setattr(params_chop.par, 'value%d' % i, default)
 
-        # POP Network
-        pop = container.create(baseCOMP, 'pop_network')
+        # Sample the motion curve for all live particles
+        script = container.create(scriptCHOP, 'pattern')
+        script.par.python = """
+import numpy as np
 
-        # Source (scattered in volume)
-        source = pop.create(popSourcePOP, 'source')
-        source.par.birthrate = "80 * chf('../params/density')"
-        source.par.lifeexp = 8
-
-        # Tornado wrangle
-        wrangle = pop.create(popWranglePOP, 'tornado_motion')
-        wrangle.par.snippet = """
-float speed = chf('speed');
-float maxRadius = chf('radius') * 10;
-
-// Spiral upward
-float angle = @age * speed * 2 + @id * 0.2;
-float height = -25 + @age * 6 * speed;
-float radius = fit(height, -25, 25, maxRadius, 2);
-
-@P.x = cos(angle) * radius;
-@P.z = sin(angle) * radius;
-@P.y = height;
-
-if (@P.y > 25) {
-    @dead = 1;
-}
+params = op('../params')
+time = op('../../utilities/time_control/TIME_OUT')[0]
+
+def sample_particles(rate, lifespan):
+    # Particle k was born k emissions ago
+    n = max(1, int(rate * lifespan))
+    ids = np.floor(time * rate) - np.arange(n)
+    age = time - ids / rate
+    return ids, age
+""" + pattern + """
+scriptOp.clear()
+scriptOp.numSamples = len(tx)
+scriptOp.appendChan('tx').vals = tx.tolist()
+scriptOp.appendChan('ty').vals = ty.tolist()
+scriptOp.appendChan('tz').vals = tz.tolist()
 """
-        wrangle.setInput(0, source)
-        wrangle.nodeX = source.nodeX + 150
 
-        # Output
-        output = pop.create(popOutputPOP, 'output')
-        output.setInput(0, wrangle)
-        output.nodeX = wrangle.nodeX + 150
+        # Samples -> points
+        to_points = container.create(chopToSOP, 'to_points')
+        to_points.par.chop = script
+        to_points.nodeX = script.nodeX + 150
 
-        # Convert to geometry
+        # Output
         null = container.create(nullSOP, 'OUT')
-        null.par.createinputnode = False
-        null.par.objpath = './pop_network/output'
-        null.nodeX = pop.nodeX + 300
+        null.setInput(0, to_points)
+        null.nodeX = to_points.nodeX + 150
         null.color = (1, 0.7, 0)
+        return null
 
-    def create_particle_selector(self, parent):
+    def create_particle_selector(self, parent, outs):
         """Create particle pattern selector"""
         selector = parent.create(constantCHOP, 'pattern_select')
         selector.par.name0 = 'index'
@@ -659,9 +718,8 @@ if (@P.y > 25) {
         # Switch
         switch = parent.create(switchSOP, 'particle_output')
         switch.par.index = 'int(chop("./pattern_select")[0])'
-        switch.setInput(0, parent.op('particles_basic/OUT'))
-        switch.setInput(1, parent.op('particles_spiral/OUT'))
-        switch.setInput(2, parent.op('particles_tornado/OUT'))
+        for i, out in enumerate(outs):
+            switch.setInput(i, out)
         switch.nodeX = selector.nodeX + 200
         switch.nodeY = selector.nodeY
 
@@ -682,12 +740,14 @@ if (@P.y > 25) {
         container = self.core_scenes.create(baseCOMP, 'wave_field')
         container.nodeX = 0
 
-        self.create_wave_ripple(container)
-        self.create_wave_plane(container)
-        self.create_wave_standing(container)
+        self.wave_outs = [
+            self.create_wave_ripple(container),
+            self.create_wave_plane(container),
+            self.create_wave_standing(container),
+        ]
 
         # Wave selector
-        self.create_wave_selector(container)
+        self.create_wave_selector(container, self.wave_outs)
 
     def create_wave_ripple(self, parent):
         """Create ripple wave effect"""
@@ -711,24 +771,16 @@ if (@P.y > 25) {
 
         # Ripple deformation
         wrangle = container.create(attribWrangleSOP, 'ripple')
-        wrangle.par.snippet = """
-float time = chop('../../utilities/time_control/TIME_OUT')[0];
-float freq = chf('frequency');
-float amp = chf('amplitude');
-
-float dist = length(set(@P.x, @P.z));
-float wave = sin(dist * freq - time * 5) * amp * 5;
-
-@P.y = wave;
-"""
         wrangle.setInput(0, grid)
         wrangle.nodeX = grid.nodeX + 200
+        self._set_vex_snippet(wrangle, RIPPLE_VEX)
 
         # Output
         null = container.create(nullSOP, 'OUT')
         null.setInput(0, wrangle)
         null.nodeX = wrangle.nodeX + 150
         null.color = (1, 0.7, 0)
+        return null
 
     def create_wave_plane(self, parent):
         """Create traveling plane wave"""
@@ -752,22 +804,16 @@ float wave = sin(dist * freq - time * 5) * amp * 5;
 
         # Plane wave
         wrangle = container.create(attribWrangleSOP, 'plane_wave')
-        wrangle.par.snippet = """
-float time = chop('../../utilities/time_control/TIME_OUT')[0];
-float freq = chf('frequency');
-float amp = chf('amplitude');
-
-float wave = sin(@P.z * freq - time * 5) * amp * 5;
-@P.y = wave;
-"""
         wrangle.setInput(0, grid)
         wrangle.nodeX = grid.nodeX + 200
+        self._set_vex_snippet(wrangle, PLANE_WAVE_VEX)
 
         # Output
         null = container.create(nullSOP, 'OUT')
         null.setInput(0, wrangle)
         null.nodeX = wrangle.nodeX + 150
         null.color = (1, 0.7, 0)
+        return null
 
     def create_wave_standing(self, parent):
         """Create standing wave"""
@@ -791,27 +837,18 @@ float wave = sin(@P.z * freq - time * 5) * amp * 5;
 
         # Standing wave
         wrangle = container.create(attribWrangleSOP, 'standing_wave')
-        wrangle.par.snippet = """
-float time = chop('../../utilities/time_control/TIME_OUT')[0];
-float freq = chf('frequency');
-float amp = chf('amplitude');
-
-float waveX = sin(@P.x * freq);
-float waveZ = sin(@P.z * freq);
-float timeWave = sin(time * 3);
-
-@P.y = waveX * waveZ * timeWave * amp * 5;
-"""
         wrangle.setInput(0, grid)
         wrangle.nodeX = grid.nodeX + 200
+        self._set_vex_snippet(wrangle, STANDING_WAVE_VEX)
 
         # Output
         null = container.create(nullSOP, 'OUT')
         null.setInput(0, wrangle)
         null.nodeX = wrangle.nodeX + 150
         null.color = (1, 0.7, 0)
+        return null
 
-    def create_wave_selector(self, parent):
+    def create_wave_selector(self, parent, outs):
         """Create wave selector"""
         selector = parent.create(constantCHOP, 'wave_select')
         selector.par.name0 = 'index'
@@ -821,9 +858,8 @@ float timeWave = sin(time * 3);
         # Switch
         switch = parent.create(switchSOP, 'wave_output')
         switch.par.index = 'int(chop("./wave_select")[0])'
-        switch.setInput(0, parent.op('wave_ripple/OUT'))
-        switch.setInput(1, parent.op('wave_plane/OUT'))
-        switch.setInput(2, parent.op('wave_standing/OUT'))
+        for i, out in enumerate(outs):
+            switch.setInput(i, out)
         switch.nodeX = selector.nodeX + 200
         switch.nodeY = selector.nodeY
 
@@ -874,16 +910,9 @@ float timeWave = sin(time * 3);
 
         # Volume Wrangle (noise generation)
         wrangle = container.create(volumeWrangleSOP, 'generate_noise')
-        wrangle.par.snippet = """
-float time = chop('../../utilities/time_control/TIME_OUT')[0];
-float scale = chf('scale');
-vector pos = @P / (10.0 / scale);
-pos.z += time;
-
-f@density = noise(pos);
-"""
         wrangle.setInput(0, volume)
         wrangle.nodeX = volume.nodeX + 200
+        self._set_vex_snippet(wrangle, PERLIN_DENSITY_VEX)
 
         # Convert to fog volume
         volume_vop = container.create(volumeVOP, 'to_fog')
@@ -938,13 +967,15 @@ f@density = noise(pos);
 spacing = parent().par.Spacing
 gridX, gridY, gridZ = 30, 50, 30
 
-geo = hou.Geometry()
+step = int(spacing)
 
-for x in range(0, int(gridX), int(spacing)):
-    for y in range(0, int(gridY), int(spacing)):
-        for z in range(0, int(gridZ), int(spacing)):
-            pt = geo.createPoint()
-            pt.setPosition((x - gridX/2, y - gridY/2, z - gridZ/2))
+geo = hou.Geometry()
+geo.createPoints([
+    (x - gridX/2, y - gridY/2, z - gridZ/2)
+    for x in range(0, int(gridX), step)
+    for y in range(0, int(gridY), step)
+    for z in range(0, int(gridZ), step)
+])
 
 scriptOp.setGeometry(geo)
 """
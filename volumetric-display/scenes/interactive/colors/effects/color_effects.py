@@ -5,6 +5,67 @@ ColorEffects - Refactored and Optimized
 
 import numpy as np
 from .color_utils import hsl_to_rgb, rgb_to_hsl
+from ...jit import NUMBA_AVAILABLE, njit, prange
+
+
+# ============================================================
+# PERLIN NOISE KERNEL (Numba)
+# ============================================================
+
+@njit(cache=True)
+def _perlin_grad_scalar(h, x, y, z):
+    h = h & 15
+    u = x if h < 8 else y
+    if h < 4:
+        v = y
+    elif h == 12 or h == 14:
+        v = x
+    else:
+        v = z
+    return (u if (h & 1) == 0 else -u) + (v if (h & 2) == 0 else -v)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _perlin_noise_3d_kernel(xs, ys, zs, p, out):
+    """Scalar Perlin noise per point, spread across cores with prange"""
+    for i in prange(xs.shape[0]):
+        fx = np.floor(xs[i])
+        fy = np.floor(ys[i])
+        fz = np.floor(zs[i])
+        X = int(fx) & 255
+        Y = int(fy) & 255
+        Z = int(fz) & 255
+        x = xs[i] - fx
+        y = ys[i] - fy
+        z = zs[i] - fz
+
+        u = x * x * x * (x * (x * 6 - 15) + 10)
+        v = y * y * y * (y * (y * 6 - 15) + 10)
+        w = z * z * z * (z * (z * 6 - 15) + 10)
+
+        A = (p[X] + Y) & 255
+        AA = (p[A] + Z) & 255
+        AB = (p[(A + 1) & 255] + Z) & 255
+        B = (p[(X + 1) & 255] + Y) & 255
+        BA = (p[B] + Z) & 255
+        BB = (p[(B + 1) & 255] + Z) & 255
+
+        g0 = _perlin_grad_scalar(p[AA], x, y, z)
+        g1 = _perlin_grad_scalar(p[BA], x - 1, y, z)
+        g2 = _perlin_grad_scalar(p[AB], x, y - 1, z)
+        g3 = _perlin_grad_scalar(p[BB], x - 1, y - 1, z)
+        g4 = _perlin_grad_scalar(p[(AA + 1) & 255], x, y, z - 1)
+        g5 = _perlin_grad_scalar(p[(BA + 1) & 255], x - 1, y, z - 1)
+        g6 = _perlin_grad_scalar(p[(AB + 1) & 255], x, y - 1, z - 1)
+        g7 = _perlin_grad_scalar(p[(BB + 1) & 255], x - 1, y - 1, z - 1)
+
+        l0 = g0 + u * (g1 - g0)
+        l1 = g2 + u * (g3 - g2)
+        l2 = g4 + u * (g5 - g4)
+        l3 = g6 + u * (g7 - g6)
+        m0 = l0 + v * (l1 - l0)
+        m1 = l2 + v * (l3 - l2)
+        out[i] = m0 + w * (m1 - m0)
 
 
 class ColorEffects:
@@ -215,7 +276,7 @@ class ColorEffects:
 
         # Generate full-spectrum hue (0-360°)
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 1.0, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -226,7 +287,7 @@ class ColorEffects:
 
         # Full spectrum hue
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 1.0, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -242,7 +303,7 @@ class ColorEffects:
 
         # Full spectrum
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 1.0, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -254,7 +315,7 @@ class ColorEffects:
 
         # Full spectrum sweep
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 1.0, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -277,7 +338,7 @@ class ColorEffects:
 
         # Full spectrum
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 1.0, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -302,7 +363,7 @@ class ColorEffects:
 
         # Saturation varies with radius for depth
         saturation = np.clip(0.7 + np.sin(radius * 0.2) * 0.3, 0, 1)
-        rainbow_color = hsl_to_rgb(hue, saturation, np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, saturation, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -327,7 +388,7 @@ class ColorEffects:
 
         # Brightness varies with radius (brighter at center)
         lightness = np.clip(0.3 + 0.5 / (1 + radius * 0.1), 0, 1)
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), lightness)
+        rainbow_color = hsl_to_rgb(hue, 1.0, lightness)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -350,7 +411,7 @@ class ColorEffects:
 
         # Full spectrum
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 1.0, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -372,7 +433,7 @@ class ColorEffects:
 
         # Full spectrum
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 1.0, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -391,7 +452,7 @@ class ColorEffects:
 
         # Full spectrum
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 1.0, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -413,7 +474,7 @@ class ColorEffects:
 
         # Full spectrum hue
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 0.8), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 0.8, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -436,7 +497,7 @@ class ColorEffects:
 
         # Full spectrum
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 1.0, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -457,7 +518,7 @@ class ColorEffects:
 
         # Full spectrum (map to 0-360°)
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 1.0, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -483,7 +544,7 @@ class ColorEffects:
 
         # Full spectrum
         hue = pattern_value
-        rainbow_color = hsl_to_rgb(hue, np.full(len(hue), 1.0), np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, 1.0, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -520,11 +581,7 @@ class ColorEffects:
         pulse = np.sin(time * self.speed * 3)
         lightness = 0.3 + ((pulse + 1) / 2) * 0.5  # 0.3 to 0.8
 
-        rainbow_color = hsl_to_rgb(
-            hue_array,
-            np.full(len(x), 1.0),
-            np.full(len(x), lightness)
-        )
+        rainbow_color = hsl_to_rgb(hue_array, 1.0, lightness)
 
         pattern_value = (pulse + 1) / 2
 
@@ -552,9 +609,9 @@ class ColorEffects:
         hue = pattern_value
 
         # Enhanced saturation for kaleidoscope effect
-        saturation = np.full(len(hue), 0.9)
+        saturation = 0.9
 
-        rainbow_color = hsl_to_rgb(hue, saturation, np.full(len(hue), 0.5))
+        rainbow_color = hsl_to_rgb(hue, saturation, 0.5)
 
         return self._apply_color_mode(colors, rainbow_color, pattern_value)
 
@@ -635,7 +692,7 @@ class ColorEffects:
         breath_cycle = (np.sin(time * self.speed * 1.5) + 1) / 2  # 0-1
         new_saturation = 0.3 + breath_cycle * 0.7  # 0.3-1.0
 
-        return hsl_to_rgb(h, np.full(len(h), new_saturation), l)
+        return hsl_to_rgb(h, new_saturation, l)
 
     # ============================================================
     # PERLIN NOISE HELPERS
@@ -654,7 +711,15 @@ class ColorEffects:
         return np.where((h & 1) == 0, u, -u) + np.where((h & 2) == 0, v, -v)
 
     def _perlin_noise_3d(self, x, y, z):
-        """3D Perlin noise - vectorized implementation"""
+        """3D Perlin noise - Numba kernel when available, vectorized NumPy otherwise"""
+        if NUMBA_AVAILABLE:
+            xs = np.ascontiguousarray(x, dtype=np.float64)
+            ys = np.ascontiguousarray(y, dtype=np.float64)
+            zs = np.ascontiguousarray(z, dtype=np.float64)
+            out = np.empty(xs.shape[0], dtype=np.float64)
+            _perlin_noise_3d_kernel(xs, ys, zs, self.perlin_perm, out)
+            return out
+
         X = np.floor(x).astype(int) & 255
         Y = np.floor(y).astype(int) & 255
         Z = np.floor(z).astype(int) & 255
@@ -3,6 +3,50 @@ Color Utilities - HSL/RGB Conversion matching JavaScript implementation
 """
 
 import numpy as np
+from ...jit import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(cache=True)
+def _hue2rgb_scalar(p, q, t):
+    t -= np.floor(t)  # Wrap to [0, 1)
+    if t < 1/6:
+        return p + (q - p) * 6 * t
+    if t < 1/2:
+        return q
+    if t < 2/3:
+        return p + (q - p) * (2/3 - t) * 6
+    return p
+
+
+@njit(cache=True)
+def _hsl_to_rgb_px(h, s, l, out, i):
+    if s == 0:
+        r = g = b = l
+    else:
+        q = l * (1 + s) if l < 0.5 else l + s - l * s
+        p = 2 * l - q
+        r = _hue2rgb_scalar(p, q, h + 1/3)
+        g = _hue2rgb_scalar(p, q, h)
+        b = _hue2rgb_scalar(p, q, h - 1/3)
+    out[i, 0] = np.uint8(round(r * 255))
+    out[i, 1] = np.uint8(round(g * 255))
+    out[i, 2] = np.uint8(round(b * 255))
+
+
+@njit('void(float64[::1], float64[::1], float64[::1], uint8[:, ::1])',
+      parallel=True, fastmath=True, cache=True)
+def _hsl_to_rgb_numba(h, s, l, out):
+    """Fused HSL to RGB kernel writing uint8 (N, 3) output in one pass"""
+    for i in prange(h.shape[0]):
+        _hsl_to_rgb_px(h[i], s[i], l[i], out, i)
+
+
+@njit('void(float64[::1], float64, float64, uint8[:, ::1])',
+      parallel=True, fastmath=True, cache=True)
+def _hsl_to_rgb_numba_scalar_sl(h, s, l, out):
+    """Fused HSL to RGB kernel for a fixed saturation/lightness"""
+    for i in prange(h.shape[0]):
+        _hsl_to_rgb_px(h[i], s, l, out, i)
 
 
 def hsl_to_rgb_single(h, s, l):
@@ -61,6 +105,22 @@ def hsl_to_rgb(h, s, l):
 
     shape = h.shape
     h = h.flatten()
+
+    if NUMBA_AVAILABLE:
+        rgb = np.empty((h.size, 3), dtype=np.uint8)
+        h = np.ascontiguousarray(h, dtype=np.float64)
+        if s_is_scalar and l_is_scalar:
+            # Keep fixed s/l scalar instead of inflating them to full arrays
+            _hsl_to_rgb_numba_scalar_sl(h, float(s), float(l), rgb)
+        else:
+            s = np.full(h.size, float(s)) if s_is_scalar else s.flatten()
+            l = np.full(h.size, float(l)) if l_is_scalar else l.flatten()
+            _hsl_to_rgb_numba(h,
+                              np.ascontiguousarray(s, dtype=np.float64),
+                              np.ascontiguousarray(l, dtype=np.float64),
+                              rgb)
+        return rgb.reshape(shape + (3,)) if len(shape) > 0 else rgb.squeeze()
+
     s = np.full_like(h, s.item()) if s_is_scalar else s.flatten()
     l = np.full_like(h, l.item()) if l_is_scalar else l.flatten()
 
@@ -144,28 +204,16 @@ def rgb_to_hsl(r, g, b):
         s_denom = np.where(l <= 0.5, max_val + min_val, 2 - max_val - min_val)
         s[chromatic] = chroma[chromatic] / s_denom[chromatic]
 
-        # Calculate hue
-        r_c = r[chromatic]
-        g_c = g[chromatic]
-        b_c = b[chromatic]
-        max_c = max_val[chromatic]
-        chroma_c = chroma[chromatic]
-
-        h_val = np.zeros_like(r_c)
-
-        # Red is max
-        mask_r = (r_c == max_c)
-        h_val[mask_r] = ((g_c[mask_r] - b_c[mask_r]) / chroma_c[mask_r] + (6 if np.any(g_c[mask_r] < b_c[mask_r]) else 0)) / 6
-
-        # Green is max
-        mask_g = (g_c == max_c)
-        h_val[mask_g] = ((b_c[mask_g] - r_c[mask_g]) / chroma_c[mask_g] + 2) / 6
+        # Calculate hue from whichever channel is max (blue wins ties, then green)
+        rgb_c = np.stack([r[chromatic], g[chromatic], b[chromatic]])
+        am = 2 - np.argmax(rgb_c[::-1], axis=0)
 
-        # Blue is max
-        mask_b = (b_c == max_c)
-        h_val[mask_b] = ((r_c[mask_b] - g_c[mask_b]) / chroma_c[mask_b] + 4) / 6
+        # Sector numerator is (next channel - previous channel), offset 0/2/4
+        nxt = np.take_along_axis(rgb_c, ((am + 1) % 3)[np.newaxis], axis=0)[0]
+        prv = np.take_along_axis(rgb_c, ((am + 2) % 3)[np.newaxis], axis=0)[0]
 
-        h[chromatic] = h_val % 1.0
+        # The modulo wraps negative red-sector hues per pixel
+        h[chromatic] = ((nxt - prv) / chroma[chromatic] + 2 * am) / 6 % 1.0
 
     return h, s, l
 
@@ -174,4 +222,6 @@ def apply_color_dict_to_array(color_dict, count):
     """
     Convert color dict {r, g, b} to numpy array
     """
-    return np.array([[color_dict['r'], color_dict['g'], color_dict['b']]] * count, dtype=np.uint8)
+    arr = np.empty((count, 3), dtype=np.uint8)
+    arr[:] = (color_dict['r'], color_dict['g'], color_dict['b'])
+    return arr
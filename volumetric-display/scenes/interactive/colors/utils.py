@@ -5,6 +5,79 @@ Fast color conversion and manipulation functions
 
 import numpy as np
 import re
+from functools import lru_cache
+from ..jit import NUMBA_AVAILABLE, njit, prange
+
+
+@njit('void(float64[::1], float64[::1], float64[::1], uint8[:, ::1])',
+      parallel=True, fastmath=True, cache=True)
+def _hsv_to_rgb_nb(h, s, v, out):
+    """Single-pass HSV (0-255) to RGB kernel, same math as the NumPy path"""
+    scale = np.float32(255.0)
+    for n in prange(h.shape[0]):
+        h_norm = h[n] / 255.0
+        s_norm = s[n] / 255.0
+        v_norm = v[n] / 255.0
+
+        i = int(np.floor(h_norm * 6))
+        f = h_norm * 6 - i
+        p = v_norm * (1 - s_norm)
+        q = v_norm * (1 - f * s_norm)
+        t = v_norm * (1 - (1 - f) * s_norm)
+
+        i = i % 6
+        if i == 0:
+            r, g, b = v_norm, t, p
+        elif i == 1:
+            r, g, b = q, v_norm, p
+        elif i == 2:
+            r, g, b = p, v_norm, t
+        elif i == 3:
+            r, g, b = p, q, v_norm
+        elif i == 4:
+            r, g, b = t, p, v_norm
+        else:
+            r, g, b = v_norm, p, q
+
+        out[n, 0] = np.uint8(np.float32(r) * scale)
+        out[n, 1] = np.uint8(np.float32(g) * scale)
+        out[n, 2] = np.uint8(np.float32(b) * scale)
+
+
+@njit('void(uint8[:, ::1], uint8[::1], uint8[::1], uint8[::1])',
+      parallel=True, cache=True)
+def _rgb_to_hsv_nb(rgb, h_out, s_out, v_out):
+    """
+    Single-pass RGB to HSV (0-255) kernel, same math as the NumPy path.
+
+    Compiled without fastmath: approximate float32 division shifts the
+    uint8 truncation by one step for some colors.
+    """
+    scale = np.float32(255.0)
+    for n in prange(rgb.shape[0]):
+        r = np.float32(rgb[n, 0]) / scale
+        g = np.float32(rgb[n, 1]) / scale
+        b = np.float32(rgb[n, 2]) / scale
+
+        maxc = max(max(r, g), b)
+        minc = min(min(r, g), b)
+        deltac = maxc - minc
+
+        h = np.float32(0.0)
+        if deltac != 0:
+            # Blue wins ties over green, green over red (matches mask order)
+            if maxc == b:
+                h = (r - g) / deltac + np.float32(4.0)
+            elif maxc == g:
+                h = (b - r) / deltac + np.float32(2.0)
+            else:
+                h = ((g - b) / deltac) % np.float32(6.0)
+
+        s = deltac / maxc if maxc != 0 else np.float32(0.0)
+
+        h_out[n] = np.uint8(h / np.float32(6.0) * scale)
+        s_out[n] = np.uint8(s * scale)
+        v_out[n] = np.uint8(maxc * scale)
 
 
 def vectorized_hsv_to_rgb(h, s, v):
@@ -19,6 +92,23 @@ def vectorized_hsv_to_rgb(h, s, v):
     Returns:
         RGB array of shape (..., 3) with dtype=uint8
     """
+    if NUMBA_AVAILABLE:
+        h, s, v = np.broadcast_arrays(h, s, v)
+        rgb = np.empty((h.size, 3), dtype=np.uint8)
+        _hsv_to_rgb_nb(np.ascontiguousarray(h, dtype=np.float64).reshape(-1),
+                       np.ascontiguousarray(s, dtype=np.float64).reshape(-1),
+                       np.ascontiguousarray(v, dtype=np.float64).reshape(-1),
+                       rgb)
+        return rgb.reshape(h.shape + (3,))
+
+    if all(np.asarray(a).dtype.kind in 'iu' for a in (h, s, v)):
+        return _hsv_lut_to_rgb(h, s, v)
+
+    return _vectorized_hsv_to_rgb_slow(h, s, v)
+
+
+def _vectorized_hsv_to_rgb_slow(h, s, v):
+    """Reference NumPy HSV to RGB conversion (used for float input and the LUTs)"""
     h_norm = h / 255.0
     s_norm = s / 255.0
     v_norm = v / 255.0
@@ -51,6 +141,41 @@ def vectorized_hsv_to_rgb(h, s, v):
     return (rgb * 255).astype(np.uint8)
 
 
+def _build_hsv_lut():
+    """(256, 256, 3) RGB table indexed by (h, s) at full value"""
+    h, s = np.meshgrid(np.arange(256), np.arange(256), indexing='ij')
+    lut = _vectorized_hsv_to_rgb_slow(h, s, np.full_like(h, 255)).astype(np.uint16)
+    lut.setflags(write=False)
+    return lut
+
+
+# 384 KiB, small enough to stay cache-resident
+_HSV_LUT = _build_hsv_lut()
+
+
+def _hsv_lut_to_rgb(h, s, v):
+    """
+    Integer HSV to RGB via one (h, s) gather and a uint16 rescale by value.
+
+    Matches the reference conversion to within 1 per channel.
+    """
+    rgb = _HSV_LUT[h, s] * np.asarray(v, dtype=np.uint16)[..., np.newaxis]
+    rgb += 127
+    rgb //= 255
+    return rgb.astype(np.uint8)
+
+
+@lru_cache(maxsize=None)
+def _rainbow_lut(saturation, value):
+    """Exact (256, 3) hue table for a fixed saturation/value pair"""
+    hue = np.arange(256)
+    lut = vectorized_hsv_to_rgb(hue.astype(np.float64),
+                                np.full(256, saturation, dtype=np.float64),
+                                np.full(256, value, dtype=np.float64))
+    lut.setflags(write=False)
+    return lut
+
+
 def vectorized_rgb_to_hsv(rgb):
     """
     Fast, NumPy-based conversion from RGB to HSV.
@@ -61,6 +186,15 @@ def vectorized_rgb_to_hsv(rgb):
     Returns:
         Tuple of (h, s, v) arrays with values 0-255
     """
+    if NUMBA_AVAILABLE and rgb.dtype == np.uint8:
+        shape = rgb.shape[:-1]
+        h = np.empty(shape, dtype=np.uint8)
+        s = np.empty(shape, dtype=np.uint8)
+        v = np.empty(shape, dtype=np.uint8)
+        _rgb_to_hsv_nb(np.ascontiguousarray(rgb).reshape(-1, 3),
+                       h.reshape(-1), s.reshape(-1), v.reshape(-1))
+        return h, s, v
+
     rgb = rgb.astype(np.float32) / 255.0
     r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
 
@@ -93,10 +227,14 @@ def vectorized_rgb_to_hsv(rgb):
     return h, s, v
 
 
+@lru_cache(maxsize=1024)
 def parse_hex_color(hex_color):
     """
     Parse hex color string to RGB tuple.
 
+    Results are cached and shared between callers, so the returned array
+    is read-only.
+
     Args:
         hex_color: String like '#FF0000' or '#F00'
 
@@ -108,11 +246,7 @@ def parse_hex_color(hex_color):
     if len(hex_color) == 3:
         hex_color = ''.join([c*2 for c in hex_color])
 
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-
-    return np.array([r, g, b], dtype=np.uint8)
+    return np.frombuffer(bytes.fromhex(hex_color[0:6]), dtype=np.uint8)
 
 
 def parse_gradient(gradient_str):
@@ -125,8 +259,13 @@ def parse_gradient(gradient_str):
     Returns:
         List of RGB arrays
     """
+    return list(_parse_gradient_cached(gradient_str))
+
+
+@lru_cache(maxsize=256)
+def _parse_gradient_cached(gradient_str):
     colors = gradient_str.split(',')
-    return [parse_hex_color(c.strip()) for c in colors]
+    return tuple(parse_hex_color(c.strip()) for c in colors)
 
 
 def interpolate_colors(colors, positions, t):
@@ -149,26 +288,26 @@ def interpolate_colors(colors, positions, t):
     colors = np.array(colors, dtype=np.float32)
     positions = np.array(positions, dtype=np.float32)
 
-    # Find which segment each t is in
-    result = np.zeros(t.shape + (3,), dtype=np.uint8)
+    if len(positions) == 1:
+        result = np.empty(t.shape + (3,), dtype=np.uint8)
+        result[:] = colors[0].astype(np.uint8)
+        return result[0] if is_scalar else result
 
-    for i in range(len(positions) - 1):
-        mask = (t >= positions[i]) & (t < positions[i+1])
-        if np.any(mask):
-            # Interpolate between colors[i] and colors[i+1]
-            local_t = (t[mask] - positions[i]) / (positions[i+1] - positions[i])
-            local_t = local_t[..., np.newaxis]
-            result[mask] = (
-                colors[i] * (1 - local_t) + colors[i+1] * local_t
-            ).astype(np.uint8)
+    # Clamp to the gradient ends: local_t then lands on exactly 0 or 1 there
+    t = np.clip(t, positions[0], positions[-1])
 
-    # Handle t >= last position
-    mask = t >= positions[-1]
-    result[mask] = colors[-1].astype(np.uint8)
+    # Find which segment each t is in (one binary search instead of a pass per segment)
+    idx = np.searchsorted(positions, t, side='right') - 1
+    np.clip(idx, 0, len(positions) - 2, out=idx)
 
-    # Handle t < first position
-    mask = t < positions[0]
-    result[mask] = colors[0].astype(np.uint8)
+    # Interpolate between colors[idx] and colors[idx + 1]
+    # A zero-width segment (duplicate end stop) resolves to its right color
+    left = positions[idx]
+    width = positions[idx + 1] - left
+    offset = t - left
+    local_t = np.divide(offset, width, out=np.ones_like(offset),
+                        where=width > 0)[..., np.newaxis]
+    result = (colors[idx] * (1 - local_t) + colors[idx + 1] * local_t).astype(np.uint8)
 
     if is_scalar:
         return result[0]
@@ -186,9 +325,18 @@ def create_gradient(colors, num_steps):
     Returns:
         Array of RGB colors, shape (num_steps, 3)
     """
-    positions = np.linspace(0, 1, len(colors))
+    colors = np.asarray(colors, dtype=np.float32)
+    return _create_gradient_cached(colors.tobytes(), len(colors), num_steps).copy()
+
+
+@lru_cache(maxsize=64)
+def _create_gradient_cached(colors_bytes, num_colors, num_steps):
+    colors = np.frombuffer(colors_bytes, dtype=np.float32).reshape(num_colors, 3)
+    positions = np.linspace(0, 1, num_colors)
     t_values = np.linspace(0, 1, num_steps)
-    return interpolate_colors(colors, positions, t_values)
+    table = interpolate_colors(colors, positions, t_values)
+    table.setflags(write=False)
+    return table
 
 
 def apply_color_to_mask(raster_data, mask, color):
@@ -220,12 +368,11 @@ def apply_gradient_to_mask(raster_data, mask, coords, gradient_colors, gradient_
     z_coords, y_coords, x_coords = coords
 
     # Get coordinate along gradient direction
-    if gradient_direction == 'x':
-        pos = x_coords[mask] / x_coords.max()
-    elif gradient_direction == 'y':
-        pos = y_coords[mask] / y_coords.max()
-    elif gradient_direction == 'z':
-        pos = z_coords[mask] / z_coords.max()
+    if isinstance(gradient_direction, str):
+        axis = {'x': x_coords, 'y': y_coords, 'z': z_coords}[gradient_direction]
+        # Normalize the (sparse) axis before broadcasting, so the max and the
+        # divide run over one axis instead of the full grid
+        pos = np.broadcast_to(axis / axis.max(), mask.shape)[mask]
     else:
         # Custom position array
         pos = gradient_direction[mask]
@@ -250,22 +397,50 @@ def hue_shift(rgb, shift_amount):
         RGB array with shifted hue
     """
     h, s, v = vectorized_rgb_to_hsv(rgb)
-    h = (h.astype(np.int32) + shift_amount) % 256
+    shift = np.asarray(shift_amount)
+    if shift.dtype.kind in 'iu':
+        # In-place uint8 add: wraparound is the same as % 256
+        h += shift.astype(np.uint8)
+    else:
+        h = (h.astype(np.int32) + shift) % 256
     return vectorized_hsv_to_rgb(h, s, v)
 
 
-def adjust_brightness(rgb, factor):
+def adjust_brightness(rgb, factor, out=None):
     """
     Adjust brightness of RGB colors.
 
+    Uses 8.8 fixed-point integer scaling, so results can differ from a
+    float multiply by 1.
+
     Args:
-        rgb: RGB array (..., 3)
+        rgb: RGB array (..., 3) uint8
         factor: Brightness multiplier (0-2)
+        out: Optional uint8 array to write into (may be rgb itself)
 
     Returns:
         RGB array with adjusted brightness
     """
-    return np.clip(rgb.astype(np.float32) * factor, 0, 255).astype(np.uint8)
+    f256 = max(0, int(round(factor * 256)))
+    if out is None:
+        out = np.empty(rgb.shape, dtype=np.uint8)
+
+    if NUMBA_AVAILABLE and rgb.dtype == np.uint8 and rgb.flags.c_contiguous and out.flags.c_contiguous:
+        _scale_u8(rgb.reshape(-1), f256, out.reshape(-1))
+        return out
+
+    scaled = rgb.astype(np.uint32)
+    scaled *= f256
+    scaled >>= 8
+    np.minimum(scaled, 255, out=scaled)
+    out[...] = scaled
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _scale_u8(rgb, f256, out):
+    for i in prange(rgb.shape[0]):
+        out[i] = min(255, (np.uint32(rgb[i]) * f256) >> 8)
 
 
 def rainbow_color(position, saturation=255, value=255):
@@ -283,6 +458,9 @@ def rainbow_color(position, saturation=255, value=255):
     position = np.asarray(position)
     hue = position % 256
 
+    if hue.dtype.kind in 'iu' and np.isscalar(saturation) and np.isscalar(value):
+        return _rainbow_lut(int(saturation), int(value))[hue]
+
     s = np.full_like(hue, saturation, dtype=np.uint8)
     v = np.full_like(hue, value, dtype=np.uint8)
 
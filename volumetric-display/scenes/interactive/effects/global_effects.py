@@ -4,6 +4,38 @@ Strobe, pulse, decay, and invert effects
 """
 
 import numpy as np
+from ..jit import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _apply_global_fused(prev, out, fade, pulse, invert, max_val, strobe_mask):
+    """
+    Decay, pulse, invert and strobe in one streaming pass over flat uint8 views.
+
+    Each stage truncates to uint8 exactly like the separate NumPy passes.
+    The strobe is a branchless AND with strobe_mask (0 in the off phase,
+    255 otherwise); since black stays black through pulse and invert it can
+    be applied last. prev and out may be the same array.
+    """
+    for i in prange(out.shape[0]):
+        v = np.uint8(prev[i] * fade)
+        v = np.uint8(v * pulse)
+        if invert and v > 10:
+            v = np.uint8(max_val - v)
+        out[i] = v & strobe_mask
+
+
+@njit(parallel=True, cache=True)
+def _invert_in_place(data):
+    """Invert voxels brighter than 10 against the frame max, without mask temporaries"""
+    max_val = 0
+    for i in prange(data.shape[0]):
+        max_val = max(max_val, data[i])
+    if max_val == 0:
+        return
+    for i in prange(data.shape[0]):
+        if data[i] > 10:
+            data[i] = max_val - data[i]
 
 
 class GlobalEffects:
@@ -21,11 +53,7 @@ class GlobalEffects:
             params: SceneParameters object with strobe setting
             time: Current animation time
         """
-        if params.strobe == 'off':
-            return
-
-        freq = {'slow': 2, 'medium': 5, 'fast': 10}[params.strobe]
-        if int(time * freq * 2) % 2 == 1:
+        if GlobalEffects._strobe_mask(params, time) == 0:
             raster.data.fill(0)
 
     @staticmethod
@@ -41,10 +69,33 @@ class GlobalEffects:
         if params.pulse == 'off':
             return
 
-        freq = {'slow': 0.5, 'medium': 1.0, 'fast': 2.0}[params.pulse]
-        factor = 0.65 + 0.35 * np.sin(time * freq * np.pi * 2)
+        factor = GlobalEffects._pulse_factor(params, time)
         raster.data[:] = (raster.data * factor).astype(np.uint8)
 
+    @staticmethod
+    def apply_strobe_pulse(raster, params, time):
+        """
+        Apply strobe then pulse, fused into one in-place pass when possible.
+
+        Args:
+            raster: Raster object to modify
+            params: SceneParameters object with strobe/pulse settings
+            time: Current animation time
+        """
+        if params.strobe == 'off' and params.pulse == 'off':
+            return
+
+        if not (NUMBA_AVAILABLE and raster.data.flags.c_contiguous):
+            GlobalEffects.apply_strobe(raster, params, time)
+            GlobalEffects.apply_pulse(raster, params, time)
+            return
+
+        flat = raster.data.reshape(-1)
+        _apply_global_fused(flat, flat, 1.0,
+                            GlobalEffects._pulse_factor(params, time),
+                            False, 0,
+                            GlobalEffects._strobe_mask(params, time))
+
     @staticmethod
     def apply_decay(raster, previous_frame, params):
         """
@@ -67,7 +118,7 @@ class GlobalEffects:
             # Higher decay = longer trails (slower fade)
             # Decay range: 0 to 3, map to fade factor
             # decay=1.0 -> 58% retention, decay=2.0 -> 76%, decay=3.0 -> 94%
-            fade_factor = 0.4 + (params.decay * 0.18)
+            fade_factor = GlobalEffects._fade_factor(params)
             raster.data[:] = (previous_frame * fade_factor).astype(np.uint8)
             return True
 
@@ -83,6 +134,10 @@ class GlobalEffects:
         if not params.invert:
             return
 
+        if NUMBA_AVAILABLE and raster.data.flags.c_contiguous:
+            _invert_in_place(raster.data.reshape(-1))
+            return
+
         max_val = np.max(raster.data)
         if max_val > 0:
             # Keep black pixels black, invert everything else
@@ -109,6 +164,22 @@ class GlobalEffects:
         Returns:
             Boolean indicating if decay was applied
         """
+        if (NUMBA_AVAILABLE and raster.data.flags.c_contiguous and
+                previous_frame.flags.c_contiguous):
+            # All four stages are pointwise, so run them as one fused pass.
+            # Every stage is monotone, so the invert reference (max of the
+            # pulsed frame) follows from the max of the previous frame.
+            fade = GlobalEffects._fade_factor(params)
+            strobe_mask = GlobalEffects._strobe_mask(params, time)
+            pulse = GlobalEffects._pulse_factor(params, time)
+            max_val = 0
+            if params.invert and strobe_mask:
+                max_val = int(np.uint8(np.uint8(previous_frame.max() * fade) * pulse))
+
+            _apply_global_fused(previous_frame.reshape(-1), raster.data.reshape(-1),
+                                fade, pulse, bool(params.invert), max_val, strobe_mask)
+            return params.decay != 0
+
         # Step 1: Apply decay (affects initial frame state)
         decay_active = GlobalEffects.apply_decay(raster, previous_frame, params)
 
@@ -122,3 +193,26 @@ class GlobalEffects:
         GlobalEffects.apply_invert(raster, params)
 
         return decay_active
+
+    @staticmethod
+    def _fade_factor(params):
+        """Decay retention factor (0 when decay is off)"""
+        if params.decay == 0:
+            return 0.0
+        return 0.4 + (params.decay * 0.18)
+
+    @staticmethod
+    def _strobe_mask(params, time):
+        """Strobe byte mask: 0 during the off phase, 255 otherwise"""
+        if params.strobe == 'off':
+            return np.uint8(255)
+        freq = {'slow': 2, 'medium': 5, 'fast': 10}[params.strobe]
+        return np.uint8(0 if int(time * freq * 2) % 2 == 1 else 255)
+
+    @staticmethod
+    def _pulse_factor(params, time):
+        """Pulse brightness multiplier (1.0 when pulse is off)"""
+        if params.pulse == 'off':
+            return 1.0
+        freq = {'slow': 0.5, 'medium': 1.0, 'fast': 2.0}[params.pulse]
+        return 0.65 + 0.35 * np.sin(time * freq * np.pi * 2)
@@ -4,6 +4,138 @@ Provides various masking patterns: axis-aligned, diagonal, radial, spiral, wave,
 """
 
 import numpy as np
+from ..jit import NUMBA_AVAILABLE, njit, prange
+
+# The kernels below walk z (parallel), y, x in memory order and read only the
+# 1D coordinate axes, so the output is written as one linear stream. Blocking
+# into 8x8x8 (Morton-style) tiles has no 3D reuse to recover and breaks the
+# contiguous inner x loop; it measured 5-6x slower at 32^3-256^3.
+
+@njit(cache=True)
+def _band_distance(coord, scroll_pos, max_dim, wrap):
+    """Distance from the scrolling band, toroidal when wrapping"""
+    dist = abs(coord - scroll_pos)
+    if wrap:
+        dist = min(dist, max_dim - dist)
+    return dist
+
+
+@njit(cache=True)
+def _emit(out, data, invert, z, y, x, hit):
+    """
+    Record one voxel's predicate.
+
+    Exactly one of out/data is an array: out receives the boolean mask,
+    while data (the uint8 raster) is cleared in place wherever hit != invert.
+    numba prunes the None branch at compile time.
+    """
+    if out is not None:
+        out[z, y, x] = hit
+    if data is not None:
+        if hit != invert:
+            for c in range(data.shape[3]):
+                data[z, y, x, c] = 0
+
+
+@njit(parallel=True, cache=True)
+def _linear_band_kernel(out, data, invert, zs, ys, xs, wz, wy, wx, norm,
+                        scroll_pos, max_dim, thickness, wrap):
+    """
+    Band along a weighted axis sum (wz*z + wy*y + wx*x) / norm.
+
+    Covers the axis-aligned (one unit weight) and diagonal (two unit
+    weights, norm sqrt(2)) masks in a single pass with no temporaries.
+    """
+    for z in prange(zs.shape[0]):
+        for y in range(ys.shape[0]):
+            for x in range(xs.shape[0]):
+                coord = (wz * zs[z] + wy * ys[y] + wx * xs[x]) / norm
+                hit = _band_distance(coord, scroll_pos, max_dim, wrap) < thickness
+                _emit(out, data, invert, z, y, x, hit)
+
+
+@njit(parallel=True, cache=True)
+def _radial_band_kernel(out, data, invert, zs, ys, xs, cz, cy, cx,
+                        scroll_pos, max_radius, thickness, wrap, lo_sq, hi_sq):
+    """
+    Spherical band around (cz, cy, cx).
+
+    Without wrapping the band is the open shell lo_sq < r^2 < hi_sq, so
+    the sqrt is only taken for the toroidal distance.
+    """
+    for z in prange(zs.shape[0]):
+        dz2 = (zs[z] - cz) ** 2
+        for y in range(ys.shape[0]):
+            dy2 = (ys[y] - cy) ** 2
+            for x in range(xs.shape[0]):
+                radius_sq = (xs[x] - cx) ** 2 + dy2 + dz2
+                if wrap:
+                    hit = _band_distance(np.sqrt(radius_sq), scroll_pos, max_radius, True) < thickness
+                else:
+                    hit = lo_sq < radius_sq < hi_sq
+                _emit(out, data, invert, z, y, x, hit)
+
+
+@njit(parallel=True, cache=True)
+def _spiral_kernel(out, data, invert, radius_xz, angle_xz, height, rotation, tightness, thickness):
+    """Archimedean spiral from cached (length, width) polar planes, extruded along Y"""
+    two_pi = 2 * np.pi
+    for z in prange(radius_xz.shape[0]):
+        for x in range(radius_xz.shape[1]):
+            angle = (angle_xz[z, x] + rotation) % two_pi
+            hit = abs(radius_xz[z, x] - angle * tightness) < thickness
+            for y in range(height):
+                _emit(out, data, invert, z, y, x, hit)
+
+
+@njit(parallel=True, cache=True)
+def _rings_kernel(out, data, invert, radius, offset, period, ring_thickness):
+    """
+    Concentric spherical shells from the cached radius field, in one pass.
+
+    The modulo is written as v - period * floor(v / period): the same
+    floored remainder as Python's %, which numba otherwise lowers to a
+    much slower fmod-and-fixup sequence.
+    """
+    inv_period = 1.0 / period
+    for z in prange(radius.shape[0]):
+        for y in range(radius.shape[1]):
+            for x in range(radius.shape[2]):
+                v = radius[z, y, x] + offset
+                ring_coord = v - period * np.floor(v * inv_period)
+                _emit(out, data, invert, z, y, x, ring_coord < ring_thickness)
+
+
+@njit(parallel=True, cache=True)
+def _clear_packed(voxels, packed):
+    """
+    Zero every voxel row whose bit is set in a np.packbits (big-endian) mask.
+
+    Reads one byte per eight voxels and skips empty bytes outright, so
+    sparse masks only touch the voxels they clear.
+    """
+    count = voxels.shape[0]
+    for i in prange(packed.shape[0]):
+        byte = packed[i]
+        if byte == 0:
+            continue
+        for bit in range(8):
+            v = i * 8 + bit
+            if v < count and (byte >> (7 - bit)) & 1:
+                for c in range(voxels.shape[1]):
+                    voxels[v, c] = 0
+
+
+def _squared_shell(scroll_pos, thickness):
+    """
+    Squared bounds of the shell |r - scroll_pos| < thickness.
+
+    A negative inner radius puts no lower bound on r, which -1 encodes
+    since r^2 is never negative.
+    """
+    inner = scroll_pos - thickness
+    lo_sq = inner * inner if inner >= 0 else -1.0
+    return lo_sq, (scroll_pos + thickness) ** 2
 
 
 class MaskingSystem:
@@ -22,9 +154,11 @@ class MaskingSystem:
         """
         self.coords_cache = coords_cache
         self.gap_regions = gap_regions or []
-        self.gap_mask_cache = None  # Static mask, computed once
+        self.gap_voxels_cache = None  # Static gap voxels (packed bits or indices), computed once
         self.mask_phase = 0
         self.last_frame_time = 0
+        self._geom_cache = {}  # Time-invariant coordinate fields, keyed by grid shape
+        self._buf_pool = {}  # Reusable full-grid buffers, keyed by (shape, dtype)
 
     def update_phase(self, time, params):
         """
@@ -41,7 +175,7 @@ class MaskingSystem:
 
     def _create_gap_mask(self, raster):
         """
-        Create boolean mask where True = valid voxel (not in gap).
+        Create boolean mask where True = gap voxel (must stay dark).
 
         Args:
             raster: Raster object with dimensions
@@ -54,27 +188,21 @@ class MaskingSystem:
 
         z_coords, y_coords, x_coords = self.coords_cache
 
-        # Start with all True (all voxels valid)
-        valid_mask = np.ones((raster.length, raster.height, raster.width), dtype=bool)
+        # Start with all False (no gap voxels)
+        gap_mask = np.zeros((raster.length, raster.height, raster.width), dtype=bool)
 
         for gap in self.gap_regions:
             axis = gap.get('axis', 'y')
             gap_min = gap.get('min', 0)
             gap_max = gap.get('max', 0)
 
-            # Broadcast sparse coordinates to full grid
-            if axis == 'x':
-                coords = x_coords + y_coords * 0 + z_coords * 0
-            elif axis == 'y':
-                coords = y_coords + x_coords * 0 + z_coords * 0
-            else:  # z
-                coords = z_coords + y_coords * 0 + x_coords * 0
+            coords = {'x': x_coords, 'y': y_coords, 'z': z_coords}.get(axis, z_coords)
 
-            # Mark gap voxels as invalid
+            # Test the sparse axis and broadcast it into the mask in place
             gap_region = (coords >= gap_min) & (coords < gap_max)
-            valid_mask = valid_mask & ~gap_region
+            np.logical_or(gap_mask, gap_region, out=gap_mask)
 
-        return valid_mask
+        return gap_mask
 
     def apply_mask(self, raster, params):
         """
@@ -86,23 +214,48 @@ class MaskingSystem:
         """
         # Apply gap mask first (always, regardless of scrolling settings)
         if self.gap_regions:
-            if self.gap_mask_cache is None:
-                self.gap_mask_cache = self._create_gap_mask(raster)
-            if self.gap_mask_cache is not None:
-                raster.data[~self.gap_mask_cache] = 0
+            if self.gap_voxels_cache is None:
+                gap_mask = self._create_gap_mask(raster)
+                if NUMBA_AVAILABLE:
+                    # One bit per voxel, walked by the _clear_packed kernel
+                    self.gap_voxels_cache = np.packbits(gap_mask.ravel())
+                else:
+                    # Index arrays of the gap voxels, so each frame is a plain scatter
+                    self.gap_voxels_cache = np.nonzero(gap_mask)
+            if NUMBA_AVAILABLE:
+                self._clear_packed_voxels(raster, self.gap_voxels_cache)
+            else:
+                raster.data[self.gap_voxels_cache] = 0
 
         # Apply scrolling mask if enabled
         if not params.scrolling_enabled or params.scrolling_thickness == 0:
             return
 
-        mask = self.get_mask(raster, params)
+        mask = self._scrolling_mask(raster, params, data=raster.data)
+        if mask is None:
+            # A fused kernel already cleared the voxels in place
+            return
 
         # Apply mask: normal mode masks out the band, inverted mode keeps only the band
         if params.scrolling_invert_mask:
-            # Invert mask: keep only the masked area, turn off everything else
-            raster.data[~mask] = 0
+            # Invert mask: keep only the masked area, turn off everything else.
+            # The mask is ours, so it can be inverted in place.
+            np.logical_not(mask, out=mask)
+        if NUMBA_AVAILABLE:
+            # Packing is a cheap 8:1 pass and the kernel then skips empty bytes
+            self._clear_packed_voxels(raster, np.packbits(mask.ravel()))
         else:
-            # Normal: mask out the scrolling band itself
+            raster.data[mask] = 0
+
+        self._release(raster, mask)
+
+    def _clear_packed_voxels(self, raster, packed):
+        """Zero the raster voxels flagged in a packed bit mask."""
+        if raster.data.flags.c_contiguous:
+            _clear_packed(raster.data.reshape(-1, raster.data.shape[-1]), packed)
+        else:
+            shape = (raster.length, raster.height, raster.width)
+            mask = np.unpackbits(packed, count=np.prod(shape)).view(bool).reshape(shape)
             raster.data[mask] = 0
 
     def get_mask(self, raster, params):
@@ -116,6 +269,16 @@ class MaskingSystem:
         Returns:
             Boolean mask array
         """
+        return self._scrolling_mask(raster, params)
+
+    def _scrolling_mask(self, raster, params, data=None):
+        """
+        Route to the mask generator for the current direction.
+
+        When data is given and the direction has a fused numba kernel, the
+        voxels are cleared in place (honouring scrolling_invert_mask) and
+        None is returned instead of a mask.
+        """
         z_coords, y_coords, x_coords = self.coords_cache
         direction = params.scrolling_direction
 
@@ -127,19 +290,19 @@ class MaskingSystem:
 
         # Route to appropriate mask generator based on direction
         if direction in ['x', 'y', 'z']:
-            return self._axis_aligned_mask(raster, params, direction, thickness)
+            return self._axis_aligned_mask(raster, params, direction, thickness, data)
         elif direction in ['diagonal-xz', 'diagonal-yz', 'diagonal-xy']:
-            return self._diagonal_mask(raster, params, direction, thickness)
+            return self._diagonal_mask(raster, params, direction, thickness, data)
         elif direction == 'radial':
-            return self._radial_mask(raster, params, thickness)
+            return self._radial_mask(raster, params, thickness, data)
         elif direction == 'spiral':
-            return self._spiral_mask(raster, params, thickness)
+            return self._spiral_mask(raster, params, thickness, data)
         elif direction == 'wave':
-            return self._wave_mask(params, thickness)
+            return self._wave_mask(raster, params, thickness)
         elif direction == 'rings':
-            return self._rings_mask(raster, params, thickness)
+            return self._rings_mask(raster, params, thickness, data)
         elif direction == 'noise':
-            return self._noise_mask(params, thickness)
+            return self._noise_mask(raster, params, thickness)
         else:
             # Fallback
             return np.ones_like(x_coords, dtype=bool)
@@ -185,7 +348,77 @@ class MaskingSystem:
             # Wrap around (default)
             return raw_pos % max_dim
 
-    def _axis_aligned_mask(self, raster, params, direction, thickness):
+    def _cached_field(self, raster, name, compute):
+        """
+        Return a time-invariant field for the current grid, computing it once.
+
+        The cache is dropped whenever the raster dimensions change.
+        """
+        key = (raster.length, raster.height, raster.width)
+        fields = self._geom_cache.get(key)
+        if fields is None:
+            fields = {}
+            self._geom_cache = {key: fields}
+        if name not in fields:
+            fields[name] = compute()
+        return fields[name]
+
+    def _axes(self, raster):
+        """1D (z, y, x) coordinate axes of the sparse coords_cache, for the kernels."""
+        return self._cached_field(raster, 'axes', lambda: tuple(
+            np.ascontiguousarray(c.ravel(), dtype=np.float64) for c in self.coords_cache))
+
+    def _radius_sq_field(self, raster):
+        """Squared distance of every voxel from the grid center."""
+        def compute():
+            z_coords, y_coords, x_coords = self.coords_cache
+            center_x = raster.width / 2
+            center_y = raster.height / 2
+            center_z = raster.length / 2
+            return (x_coords - center_x)**2 + (y_coords - center_y)**2 + (z_coords - center_z)**2
+        return self._cached_field(raster, 'radius_sq', compute)
+
+    def _radius_field(self, raster):
+        """Distance of every voxel from the grid center."""
+        return self._cached_field(raster, 'radius', lambda: np.sqrt(self._radius_sq_field(raster)))
+
+    def _borrow(self, raster, dtype=bool):
+        """Take an uninitialized full-grid buffer from the pool, allocating if empty."""
+        shape = (raster.length, raster.height, raster.width)
+        stack = self._buf_pool.get((shape, np.dtype(dtype)))
+        if stack:
+            return stack.pop()
+        return np.empty(shape, dtype=dtype)
+
+    def _release(self, raster, buf):
+        """Hand a full-grid buffer back to the pool once nothing references it."""
+        shape = (raster.length, raster.height, raster.width)
+        if buf.shape != shape or not (buf.flags.owndata and buf.flags.writeable):
+            return
+        self._buf_pool.setdefault((shape, buf.dtype), []).append(buf)
+
+    def _threshold(self, raster, values, limit):
+        """values < limit into a pooled boolean buffer (values may be broadcastable)."""
+        return np.less(values, limit, out=self._borrow(raster))
+
+    def _kernel_output(self, raster, data):
+        """Mask buffer for a fused kernel, or None when it clears data in place."""
+        if data is not None:
+            return None
+        return self._borrow(raster)
+
+    def _linear_band(self, raster, params, weights, norm, scroll_pos, max_dim, thickness, data):
+        """Run the fused band kernel for axis-aligned and diagonal scrolling."""
+        wrap = not params.scrolling_loop
+        if wrap:
+            # Cap thickness to prevent full scene masking before 100%
+            thickness = min(thickness, max_dim * 0.49)
+        out = self._kernel_output(raster, data)
+        _linear_band_kernel(out, data, params.scrolling_invert_mask, *self._axes(raster),
+                            *weights, norm, scroll_pos, max_dim, thickness, wrap)
+        return out
+
+    def _axis_aligned_mask(self, raster, params, direction, thickness, data=None):
         """Simple axis-aligned scrolling."""
         z_coords, y_coords, x_coords = self.coords_cache
 
@@ -197,14 +430,19 @@ class MaskingSystem:
 
         scroll_pos = self._get_scroll_pos(max_dim, params)
 
+        if NUMBA_AVAILABLE:
+            weights = {'z': (1.0, 0.0, 0.0), 'y': (0.0, 1.0, 0.0), 'x': (0.0, 0.0, 1.0)}[direction]
+            return self._linear_band(raster, params, weights, 1.0, scroll_pos, max_dim, thickness, data)
+
         axis_coords = {
             'x': x_coords,
             'y': y_coords,
             'z': z_coords
         }[direction]
 
-        # Force broadcast to full 3D grid
-        axis_coords_broadcast = axis_coords + y_coords * 0 + x_coords * 0 + z_coords * 0
+        # Zero-copy view of the axis coordinates over the full 3D grid
+        shape = (raster.length, raster.height, raster.width)
+        axis_coords_broadcast = np.broadcast_to(axis_coords, shape)
 
         # Calculate distance - use toroidal wrapping for smooth transitions
         if params.scrolling_loop:
@@ -217,21 +455,39 @@ class MaskingSystem:
             # Cap thickness to prevent full scene masking before 100%
             thickness = min(thickness, max_dim * 0.49)
 
-        return dist_from_band < thickness
+        return self._threshold(raster, dist_from_band, thickness)
 
-    def _diagonal_mask(self, raster, params, direction, thickness):
+    def _diagonal_mask(self, raster, params, direction, thickness, data=None):
         """Diagonal scrolling (moving along two axes simultaneously)."""
+        if NUMBA_AVAILABLE:
+            if direction == 'diagonal-xz':
+                max_dim = np.sqrt(raster.width**2 + raster.length**2)
+                weights = (1.0, 0.0, 1.0)
+            elif direction == 'diagonal-yz':
+                max_dim = np.sqrt(raster.height**2 + raster.length**2)
+                weights = (1.0, 1.0, 0.0)
+            else:  # diagonal-xy
+                max_dim = np.sqrt(raster.width**2 + raster.height**2)
+                weights = (0.0, 1.0, 1.0)
+            scroll_pos = self._get_scroll_pos(max_dim, params)
+            return self._linear_band(raster, params, weights, np.sqrt(2), scroll_pos, max_dim, thickness, data)
+
         z_coords, y_coords, x_coords = self.coords_cache
+        shape = (raster.length, raster.height, raster.width)
 
+        # Combine the two sparse axes first, then view the result over the full grid
         if direction == 'diagonal-xz':
             max_dim = np.sqrt(raster.width**2 + raster.length**2)
-            diagonal_coord = (x_coords + z_coords + y_coords * 0) / np.sqrt(2)
+            axis_a, axis_b = x_coords, z_coords
         elif direction == 'diagonal-yz':
             max_dim = np.sqrt(raster.height**2 + raster.length**2)
-            diagonal_coord = (y_coords + z_coords + x_coords * 0) / np.sqrt(2)
+            axis_a, axis_b = y_coords, z_coords
         else:  # diagonal-xy
             max_dim = np.sqrt(raster.width**2 + raster.height**2)
-            diagonal_coord = (x_coords + y_coords + z_coords * 0) / np.sqrt(2)
+            axis_a, axis_b = x_coords, y_coords
+        diagonal_coord = self._cached_field(
+            raster, direction,
+            lambda: np.broadcast_to((axis_a + axis_b) / np.sqrt(2), shape))
 
         scroll_pos = self._get_scroll_pos(max_dim, params)
 
@@ -242,46 +498,61 @@ class MaskingSystem:
             dist_from_band = np.minimum(linear_dist, max_dim - linear_dist)
             thickness = min(thickness, max_dim * 0.49)
 
-        return dist_from_band < thickness
+        return self._threshold(raster, dist_from_band, thickness)
 
-    def _radial_mask(self, raster, params, thickness):
+    def _radial_mask(self, raster, params, thickness, data=None):
         """Radial scrolling (expanding/contracting from center)."""
-        z_coords, y_coords, x_coords = self.coords_cache
-
         center_x = raster.width / 2
         center_y = raster.height / 2
         center_z = raster.length / 2
-
-        # Distance from center
-        radius = np.sqrt((x_coords - center_x)**2 + (y_coords - center_y)**2 + (z_coords - center_z)**2)
         max_radius = np.sqrt(center_x**2 + center_y**2 + center_z**2)
 
         scroll_pos = self._get_scroll_pos(max_radius, params)
 
-        if params.scrolling_loop:
-            dist_from_band = np.abs(radius - scroll_pos)
-        else:
-            linear_dist = np.abs(radius - scroll_pos)
-            dist_from_band = np.minimum(linear_dist, max_radius - linear_dist)
-            thickness = min(thickness, max_radius * 0.49)
-
-        return dist_from_band < thickness
+        if NUMBA_AVAILABLE:
+            wrap = not params.scrolling_loop
+            if wrap:
+                thickness = min(thickness, max_radius * 0.49)
+            out = self._kernel_output(raster, data)
+            _radial_band_kernel(out, data, params.scrolling_invert_mask, *self._axes(raster),
+                                center_z, center_y, center_x,
+                                scroll_pos, max_radius, thickness, wrap,
+                                *_squared_shell(scroll_pos, thickness))
+            return out
 
-    def _spiral_mask(self, raster, params, thickness):
+        if params.scrolling_loop:
+            # Compare squared radii against the shell so no sqrt is needed
+            lo_sq, hi_sq = _squared_shell(scroll_pos, thickness)
+            radius_sq = self._radius_sq_field(raster)
+            mask = self._threshold(raster, radius_sq, hi_sq)
+            mask &= radius_sq > lo_sq
+            return mask
+
+        # Wrap mode needs the true distance for the toroidal band
+        radius = self._radius_field(raster)
+        linear_dist = np.abs(radius - scroll_pos)
+        dist_from_band = np.minimum(linear_dist, max_radius - linear_dist)
+        thickness = min(thickness, max_radius * 0.49)
+
+        return self._threshold(raster, dist_from_band, thickness)
+
+    def _spiral_mask(self, raster, params, thickness, data=None):
         """Spiral masking (combines radial and angular components)."""
         z_coords, y_coords, x_coords = self.coords_cache
 
         center_x = raster.width / 2
-        center_y = raster.height / 2
         center_z = raster.length / 2
 
-        # Force broadcast sparse coordinates to full 3D arrays
-        x_full = x_coords + y_coords * 0 + z_coords * 0
-        z_full = z_coords + y_coords * 0 + x_coords * 0
-
-        # Calculate cylindrical coordinates (using Y as vertical axis)
-        radius_xz = np.sqrt((x_full - center_x)**2 + (z_full - center_z)**2)
-        angle = np.arctan2(z_full - center_z, x_full - center_x)
+        # Calculate cylindrical coordinates (using Y as vertical axis).
+        # They only vary in XZ and not in time, so they are cached once as
+        # (length, 1, width) planes; arctan2 is the expensive part.
+        radius_xz = self._cached_field(
+            raster, 'radius_xz',
+            lambda: np.sqrt((x_coords - center_x)**2 + (z_coords - center_z)**2))
+        # Shifted into [0, 2*pi] ahead of time
+        angle = self._cached_field(
+            raster, 'angle_xz',
+            lambda: np.arctan2(z_coords - center_z, x_coords - center_x) + np.pi)
 
         # Create an Archimedean spiral: r = a + b*theta
         max_radius_xz = np.sqrt(center_x**2 + center_z**2)
@@ -291,8 +562,20 @@ class MaskingSystem:
 
         # The spiral rotates over time
         time_rotation = self.mask_phase * 0.5
-        # Normalize angle to [0, 2*pi] and add time rotation
-        angle_normalized = (angle + np.pi + time_rotation) % (2 * np.pi)
+
+        if NUMBA_AVAILABLE:
+            out = self._kernel_output(raster, data)
+            _spiral_kernel(out, data, params.scrolling_invert_mask,
+                           radius_xz[:, 0, :], angle[:, 0, :], raster.height,
+                           time_rotation, spiral_tightness, thickness)
+            return out
+
+        # Add time rotation and wrap back into [0, 2*pi]. The rotation is
+        # reduced as a scalar first; the plane is then wrapped with
+        # floor/multiply, which vectorizes where the float remainder does not
+        two_pi = 2 * np.pi
+        angle_normalized = angle + time_rotation % two_pi
+        angle_normalized -= np.floor(angle_normalized * (1 / two_pi)) * two_pi
 
         # Spiral equation: for a given angle, we expect a certain radius
         spiral_radius_expected = angle_normalized * spiral_tightness
@@ -300,67 +583,82 @@ class MaskingSystem:
         # Distance from the spiral curve
         dist_from_band = np.abs(radius_xz - spiral_radius_expected)
 
-        return dist_from_band < thickness
+        # Extrude the XZ plane along Y
+        return self._threshold(raster, dist_from_band, thickness)
 
-    def _wave_mask(self, params, thickness):
+    def _wave_mask(self, raster, params, thickness):
         """Wave masking (3D sinusoidal wave)."""
         z_coords, y_coords, x_coords = self.coords_cache
+        phase = self.mask_phase * 2
+
+        # Coordinates are sparse, so each term is evaluated once per axis
+        sx = np.sin(x_coords * 0.3 + phase)
+        cy = np.cos(y_coords * 0.3 + phase)
+        sz = np.sin(z_coords * 0.3 + phase)
 
-        # Create a continuously flowing 3D wave
-        wave_value = (
-            np.sin(x_coords * 0.3 + self.mask_phase * 2) +
-            np.cos(y_coords * 0.3 + self.mask_phase * 2) +
-            np.sin(z_coords * 0.3 + self.mask_phase * 2)
-        )
         # Wave value ranges from -3 to 3
         # Map thickness (0-20) to threshold (-3 to 3) for gradual masking
         threshold = -3.0 + (thickness / 20.0) * 6.0
-        return wave_value < threshold
 
-    def _rings_mask(self, raster, params, thickness):
+        # Only the final sum and comparison touch the full grid
+        wave_value = np.add(sx + cy, sz, out=self._borrow(raster, np.float64))
+        mask = self._threshold(raster, wave_value, threshold)
+        self._release(raster, wave_value)
+        return mask
+
+    def _rings_mask(self, raster, params, thickness, data=None):
         """Rings masking (concentric spherical shells)."""
-        z_coords, y_coords, x_coords = self.coords_cache
+        ring_period = 8  # Distance between rings
 
-        center_x = raster.width / 2
-        center_y = raster.height / 2
-        center_z = raster.length / 2
+        # Scale thickness relative to ring_period (not max_radius)
+        ring_thickness = (thickness / 20.0) * ring_period
 
         # Distance from center (same as radial but with multiple rings)
-        radius = np.sqrt((x_coords - center_x)**2 + (y_coords - center_y)**2 + (z_coords - center_z)**2)
+        radius = self._radius_field(raster)
+
+        if NUMBA_AVAILABLE:
+            out = self._kernel_output(raster, data)
+            _rings_kernel(out, data, params.scrolling_invert_mask, radius,
+                          self.mask_phase * 10, ring_period, ring_thickness)
+            return out
 
         # Create pulsing rings by using modulo
-        ring_period = 8  # Distance between rings
         ring_coord = (radius + self.mask_phase * 10) % ring_period
 
-        # Scale thickness relative to ring_period (not max_radius)
-        ring_thickness = (thickness / 20.0) * ring_period
-
         # Threshold creates the ring band
-        return ring_coord < ring_thickness
+        return self._threshold(raster, ring_coord, ring_thickness)
 
-    def _noise_mask(self, params, thickness):
+    def _noise_mask(self, raster, params, thickness):
         """Noise masking (Perlin-like noise pattern)."""
         z_coords, y_coords, x_coords = self.coords_cache
 
-        # Create organic, cloud-like masking using multiple octaves of noise
+        # Create organic, cloud-like masking using multiple octaves of noise.
+        # Each factor is evaluated on its sparse axis; octave weights are folded
+        # into the XY plane so only the final products span the full grid.
         # Octave 1: large features
-        noise1 = np.sin(x_coords * 0.2 + self.mask_phase) * \
-                 np.cos(y_coords * 0.2 - self.mask_phase * 0.7) * \
-                 np.sin(z_coords * 0.2 + self.mask_phase * 0.5)
+        xy1 = (np.sin(x_coords * 0.2 + self.mask_phase) * 0.5) * \
+              np.cos(y_coords * 0.2 - self.mask_phase * 0.7)
+        z1 = np.sin(z_coords * 0.2 + self.mask_phase * 0.5)
 
         # Octave 2: medium features
-        noise2 = np.sin(x_coords * 0.5 + self.mask_phase * 1.5) * \
-                 np.cos(y_coords * 0.5 + self.mask_phase * 1.2) * \
-                 np.sin(z_coords * 0.5 - self.mask_phase * 0.8)
+        xy2 = (np.sin(x_coords * 0.5 + self.mask_phase * 1.5) * 0.3) * \
+              np.cos(y_coords * 0.5 + self.mask_phase * 1.2)
+        z2 = np.sin(z_coords * 0.5 - self.mask_phase * 0.8)
 
         # Octave 3: fine features
-        noise3 = np.sin(x_coords * 1.0 - self.mask_phase * 2) * \
-                 np.cos(y_coords * 1.0 + self.mask_phase * 1.8) * \
-                 np.sin(z_coords * 1.0 + self.mask_phase * 1.5)
+        xy3 = (np.sin(x_coords * 1.0 - self.mask_phase * 2) * 0.2) * \
+              np.cos(y_coords * 1.0 + self.mask_phase * 1.8)
+        z3 = np.sin(z_coords * 1.0 + self.mask_phase * 1.5)
 
-        # Combine octaves with decreasing weights
-        noise = noise1 * 0.5 + noise2 * 0.3 + noise3 * 0.2
+        # Combine octaves into a single full-grid buffer
+        noise = np.multiply(xy1, z1, out=self._borrow(raster, np.float64))
+        octave = np.multiply(xy2, z2, out=self._borrow(raster, np.float64))
+        noise += octave
+        noise += np.multiply(xy3, z3, out=octave)
+        self._release(raster, octave)
 
         # Map thickness (0-20) to threshold (-1 to 1)
         threshold = -1.0 + (thickness / 20.0) * 2.0
-        return noise < threshold
+        mask = self._threshold(raster, noise, threshold)
+        self._release(raster, noise)
+        return mask
@@ -6,6 +6,9 @@ Full volume, dots, cross, and wireframe patterns
 import numpy as np
 from .shapes import generate_cross_grid
 
+# Last dot-grid distance field, reused across frames by generate_dots
+_dots_cache = {'coords': None, 'spacing': None, 'distance_sq': None}
+
 
 def generate_full(grid_shape):
     """
@@ -42,19 +45,24 @@ def generate_dots(coords, grid_shape, params, time):
     pulse = 1.0 + (params.scaling_amount * 0.1) * np.sin(time * params.scaling_speed)
     dot_radius = (0.5 + params.size * 2) * pulse  # 0.5-2.5 voxels
 
-    # Use modulo to create repeating pattern instead of loops
-    # This is much faster than iterating through each dot position
+    # The distance field only depends on the coordinates and spacing, so it
+    # is reused while neither changes (unrotated grids, steady density)
+    if _dots_cache['coords'] is not coords or _dots_cache['spacing'] != spacing:
+        # Use modulo to create repeating pattern instead of loops
+        # This is much faster than iterating through each dot position
 
-    # For each axis, find the distance to the nearest grid line
-    x_dist_to_grid = np.minimum(x_coords % spacing, spacing - (x_coords % spacing))
-    y_dist_to_grid = np.minimum(y_coords % spacing, spacing - (y_coords % spacing))
-    z_dist_to_grid = np.minimum(z_coords % spacing, spacing - (z_coords % spacing))
+        # For each axis, find the distance to the nearest grid line
+        x_dist_to_grid = np.minimum(x_coords % spacing, spacing - (x_coords % spacing))
+        y_dist_to_grid = np.minimum(y_coords % spacing, spacing - (y_coords % spacing))
+        z_dist_to_grid = np.minimum(z_coords % spacing, spacing - (z_coords % spacing))
 
-    # Distance from nearest grid intersection point (3D)
-    distance = np.sqrt(x_dist_to_grid**2 + y_dist_to_grid**2 + z_dist_to_grid**2)
+        # Squared distance from nearest grid intersection point (3D)
+        _dots_cache['coords'] = coords
+        _dots_cache['spacing'] = spacing
+        _dots_cache['distance_sq'] = x_dist_to_grid**2 + y_dist_to_grid**2 + z_dist_to_grid**2
 
-    # Create mask where distance is less than dot radius
-    mask = distance < dot_radius
+    # Create mask where distance is less than dot radius (both sides non-negative)
+    mask = _dots_cache['distance_sq'] < dot_radius * dot_radius
 
     return mask
 
@@ -117,6 +125,8 @@ def generate_wireframe(coords, grid_shape, params, time):
     mask = np.zeros(grid_shape, dtype=bool)
 
     # Draw 12 edges of the cube
+    # The slices only touch edge voxels of a lazily zeroed buffer; a fused
+    # full-grid kernel has to write every voxel and measures slower here.
     # Bottom face (4 edges)
     mask[z_min:z_min+thickness, y_min:y_min+thickness, x_min:x_max] = True  # Bottom-front edge
     mask[z_min:z_min+thickness, y_max-thickness:y_max, x_min:x_max] = True  # Bottom-back edge
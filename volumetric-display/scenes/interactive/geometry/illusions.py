@@ -31,8 +31,8 @@ def generate_infinite_corridor(coords, grid_shape, params, time):
 
     mask = np.zeros(grid_shape, dtype=bool)
 
-    # Collect all frame data first so we can sort by depth
-    frames_to_draw = []
+    center_x = width // 2
+    center_z = length // 2
 
     # Generate enough frames to fill the visible area plus wrapping buffer
     for frame in range(num_frames * 2):  # Double to handle wrapping
@@ -54,34 +54,21 @@ def generate_infinite_corridor(coords, grid_shape, params, time):
         frame_width = max(1, int(width / 2 * scale))
         depth = max(1, int(length / 2 * scale))
 
-        # Store frame data (scale is our depth key - smaller = farther)
-        frames_to_draw.append((scale, y, frame_width, depth))
-
-    # Sort frames by scale (smallest/farthest first, largest/nearest last)
-    # This ensures proper depth ordering - distant frames drawn first, near frames on top
-    frames_to_draw.sort(key=lambda f: f[0])
-
-    # Now draw frames in back-to-front order
-    center_x = width // 2
-    center_z = length // 2
+        # The mask is boolean, so frames need no depth ordering
+        x0 = max(0, center_x - frame_width)
+        x1 = min(width, center_x + frame_width + 1)
+        z0 = max(0, center_z - depth)
+        z1 = min(length, center_z + depth + 1)
 
-    for scale, y, frame_width, depth in frames_to_draw:
-        # Draw all four edges of the rectangle
         # Top and bottom edges (parallel to X axis)
-        for x in range(-frame_width, frame_width + 1):
-            for offset_z in [-depth, depth]:
-                wz = center_z + offset_z
-                wx = center_x + x
-                if 0 <= wx < width and 0 <= wz < length:
-                    mask[wz, y, wx] = True
+        for wz in (center_z - depth, center_z + depth):
+            if 0 <= wz < length:
+                mask[wz, y, x0:x1] = True
 
         # Left and right edges (parallel to Z axis)
-        for z in range(-depth, depth + 1):
-            for offset_x in [-frame_width, frame_width]:
-                wx = center_x + offset_x
-                wz = center_z + z
-                if 0 <= wx < width and 0 <= wz < length:
-                    mask[wz, y, wx] = True
+        for wx in (center_x - frame_width, center_x + frame_width):
+            if 0 <= wx < width:
+                mask[z0:z1, y, wx] = True
 
     return mask
 
@@ -105,21 +92,14 @@ def generate_waterfall(coords, grid_shape, params, time):
     offset = time * 10
     stripe_spacing = max(2, int(5 - params.density * 3))
 
-    mask = np.zeros(grid_shape, dtype=bool)
-
-    # Create moving stripes pattern along Z axis
-    for z in range(length):
-        pattern = (z + offset) % (stripe_spacing * 2)
-        is_stripe = pattern < stripe_spacing
-
-        if is_stripe:
-            # Fill this Z slice
-            mask[z, :, :] = True
+    # Create moving stripes pattern along Z axis, filling whole Z slices
+    zs = np.arange(length)
+    stripes_z = ((zs + offset) % (stripe_spacing * 2)) < stripe_spacing
+    mask = np.broadcast_to(stripes_z[:, None, None], grid_shape).copy()
 
     # Add horizontal marker lines every 5 units in Y
     # These create the reference frame that makes the illusion work
-    for y in range(0, height, 5):
-        mask[:, y, :] = True
+    mask[:, ::5, :] = True
 
     return mask
 
@@ -149,7 +129,18 @@ def generate_pulfrich(coords, grid_shape, params, time):
     center_y = height / 2
     center_z = length / 2
 
+    # Size controls sphere size (0.3-3.0 -> sphere radius 1-7)
+    # Using int to ensure at least 1 pixel radius
+    obj_size = max(1, int(1 + params.size * 2))
+
+    # Sphere stamp shared by every object
+    oz, oy, ox = np.ogrid[-obj_size:obj_size + 1,
+                          -obj_size:obj_size + 1,
+                          -obj_size:obj_size + 1]
+    sphere = ((ox * ox + oy * oy + oz * oz) <= obj_size * obj_size).astype(np.float32)
+
     mask = np.zeros(grid_shape, dtype=np.float32)
+    pz = int(center_z)
 
     for i in range(num_objects):
         obj_angle = time + (i / num_objects) * np.pi * 2
@@ -161,20 +152,18 @@ def generate_pulfrich(coords, grid_shape, params, time):
         # Brightness varies with position
         brightness = 0.5 + 0.5 * np.sin(obj_angle)
 
-        # Size controls sphere size (0.3-3.0 -> sphere radius 1-7)
-        # Using int to ensure at least 1 pixel radius
-        obj_size = max(1, int(1 + params.size * 2))
-
-        for dx in range(-obj_size, obj_size + 1):
-            for dy in range(-obj_size, obj_size + 1):
-                for dz in range(-obj_size, obj_size + 1):
-                    if dx*dx + dy*dy + dz*dz <= obj_size * obj_size:
-                        wx = px + dx
-                        wy = py + dy
-                        wz = int(center_z + dz)
+        # Clip the stamp's bounding box to the grid
+        z0, z1 = max(0, pz - obj_size), min(length, pz + obj_size + 1)
+        y0, y1 = max(0, py - obj_size), min(height, py + obj_size + 1)
+        x0, x1 = max(0, px - obj_size), min(width, px + obj_size + 1)
+        if z0 >= z1 or y0 >= y1 or x0 >= x1:
+            continue
 
-                        if 0 <= wx < width and 0 <= wy < height and 0 <= wz < length:
-                            mask[wz, wy, wx] = max(mask[wz, wy, wx], brightness)
+        stamp = sphere[z0 - pz + obj_size:z1 - pz + obj_size,
+                       y0 - py + obj_size:y1 - py + obj_size,
+                       x0 - px + obj_size:x1 - px + obj_size]
+        region = mask[z0:z1, y0:y1, x0:x1]
+        np.maximum(region, brightness * stamp, out=region)
 
     return mask > 0.3
 
@@ -198,30 +187,24 @@ def generate_moire(coords, grid_shape, params, time):
     grid_spacing = max(2, int(3 * (1 + params.density)))
     angle = time * 0.1
 
-    mask = np.zeros(grid_shape, dtype=bool)
-
     cos_angle = np.cos(angle)
     sin_angle = np.sin(angle)
 
     center_x = width / 2
     center_z = length / 2
 
-    # Draw first grid - vertical lines along X
-    for x in range(0, width, grid_spacing):
-        mask[:, :, x] = True
-
-    # Draw second grid - rotated in XZ plane
-    for z in range(length):
-        for x in range(width):
-            # Transform to center-origin coords
-            cx = x - center_x
-            cz = z - center_z
+    # First grid - vertical lines along X
+    cols = np.zeros(width, dtype=bool)
+    cols[::grid_spacing] = True
 
-            # Rotate
-            rx = cx * cos_angle - cz * sin_angle
+    # Second grid - rotated in XZ plane around the center
+    xs = np.arange(width) - center_x
+    zs = (np.arange(length) - center_z)[:, None]
+    rx = xs * cos_angle - zs * sin_angle
+    lines2d = (np.abs(rx).astype(np.int32) % grid_spacing) == 0
 
-            # Check if this point is on a grid line
-            if int(abs(rx)) % grid_spacing == 0:
-                mask[z, :, x] = True
+    # Both grids are constant along Y
+    mask = np.empty(grid_shape, dtype=bool)
+    mask[:] = (cols[None, :] | lines2d)[:, None, :]
 
     return mask
@@ -3,7 +3,118 @@ Particle Flow Geometry Generators
 Spiral/helix, galaxy, and explosion patterns
 """
 
+from functools import lru_cache
+
 import numpy as np
+from .utils import z_slabbed
+
+# Masks and temporaries here are allocated per call. Reusing module-level
+# full-grid scratch buffers (out= into dist_sq/hit) measured within noise at
+# 40^3 - allocation is not the cost at these sizes - and returned masks can
+# pass straight through copies/scrolling as the frame output, so stay fresh.
+# The mask |= accumulations stay on bool arrays: NumPy's bool OR is already
+# SIMD and bandwidth-bound, so ORing uint64 views measured the same, and
+# np.packbits on each condition costs more than the OR it would save.
+
+
+def _distance_sq(coords, px, py, pz, out):
+    """Squared distance from (px, py, pz) to every voxel, written into out"""
+    z_coords, y_coords, x_coords = coords
+    # Sum the x/y terms first so axis-aligned coords stay a (1,H,W) plane
+    # until the final add into the full-size buffer
+    dx = x_coords - px
+    dx *= dx
+    dy = y_coords - py
+    dy *= dy
+    dz = z_coords - pz
+    dz *= dz
+    dx = dx + dy
+    return np.add(dx, dz, out=out)
+
+
+def _particles_mask(coords, grid_shape, px, py, pz, particle_size, chunk_size=64):
+    """
+    Mask of voxels within particle_size of any particle position.
+
+    Args:
+        coords: Tuple of (z, y, x) coordinate arrays
+        grid_shape: Tuple of (length, height, width)
+        px, py, pz: (P,) particle positions
+        particle_size: Particle radius
+        chunk_size: Particles evaluated per batch
+
+    Returns:
+        Boolean mask of particle voxels
+    """
+    z_coords, y_coords, x_coords = coords
+    length, height, width = grid_shape
+    mask = np.zeros(grid_shape, dtype=bool)
+    particle_size_sq = particle_size * particle_size
+
+    axis_aligned = (np.shape(z_coords) == (length, 1, 1) and
+                    np.shape(y_coords) == (1, height, 1) and
+                    np.shape(x_coords) == (1, 1, width))
+
+    if not axis_aligned:
+        # Rotated coords are full grids; a dense (P,L,H,W) batch measured
+        # slower than one buffered pass per particle
+        dist_sq = np.empty(grid_shape)
+        hit = np.empty(grid_shape, dtype=bool)
+        for i in range(len(px)):
+            _distance_sq(coords, px[i], py[i], pz[i], out=dist_sq)
+            mask |= np.less(dist_sq, particle_size_sq, out=hit)
+        return mask
+
+    z_axis = z_coords.reshape(-1)
+    y_axis = y_coords.reshape(-1)
+    x_axis = x_coords.reshape(-1)
+
+    for start in range(0, len(px), chunk_size):
+        chunk = slice(start, start + chunk_size)
+
+        # Per-particle squared offsets along each axis, batched as (P, axis)
+        dx_sq = x_axis - px[chunk, None]
+        dx_sq *= dx_sq
+        dy_sq = y_axis - py[chunk, None]
+        dy_sq *= dy_sq
+        dz_sq = z_axis - pz[chunk, None]
+        dz_sq *= dz_sq
+
+        # A slab can only be hit where its z offset alone is inside the
+        # radius, so only those (particle, slab) pairs get an (H,W) plane
+        particle, slab = np.nonzero(dz_sq < particle_size_sq)
+        if len(slab) == 0:
+            continue
+
+        dist_sq = dx_sq[particle, None, :] + dy_sq[particle, :, None]
+        dist_sq += dz_sq[particle, slab, None, None]
+        hits = dist_sq < particle_size_sq
+
+        # OR together the planes that land on the same slab
+        order = np.argsort(slab, kind='stable')
+        slab = slab[order]
+        starts = np.flatnonzero(np.r_[True, slab[1:] != slab[:-1]])
+        mask[slab[starts]] |= np.logical_or.reduceat(hits[order], starts, axis=0)
+
+    return mask
+
+
+def _arc_bound(radius, width):
+    """
+    Bound on dx*cos(a) + dy*sin(a) for points within arc length width of
+    the ray at angle a.
+
+    The arc test |angle_diff| * r < width is |angle_diff| < width / r, and
+    as cos is decreasing on [0, pi] that is r*cos(angle_diff) > r*cos(width / r),
+    where r*cos(angle_diff) is the dot product of (dx, dy) with the ray
+    direction. Past pi every angle passes, so the bound is -inf there
+    (including r == 0).
+    """
+    max_angle = np.divide(width, radius, out=np.full(np.shape(radius), np.inf),
+                          where=radius > 0)
+    bound = radius * np.cos(np.minimum(max_angle, np.pi))
+    bound[max_angle > np.pi] = -np.inf
+    return bound
 
 
 def generate_spiral(coords, grid_shape, params, time):
@@ -39,34 +150,74 @@ def generate_spiral(coords, grid_shape, params, time):
     # Number of separate helix strands (controlled by objectCount)
     num_strands = max(1, params.objectCount)
 
-    mask = np.zeros(grid_shape, dtype=bool)
+    # Create helix path along Z axis (depth/length)
+    # For each Z position, calculate the expected X,Y based on helix equation
+    z_normalized = (z_coords - center_z) / length  # -0.5 to 0.5
+    base_angle = z_normalized * turns_per_length * 2 * np.pi + time * 2
+
+    # Each strand has a phase offset along a leading strand axis, so the
+    # helix trig runs batched and a running minimum picks the nearest
+    # strand. Axis-aligned coords make the angle a thin (L,1,1) column and
+    # every strand fits in one pass; rotated coords are full grids, so
+    # strands go one per pass to keep the working set cache-sized.
+    phase_offset = np.arange(num_strands) / num_strands * 2 * np.pi
+    phase_offset = phase_offset.reshape((num_strands,) + (1,) * np.ndim(base_angle))
+    per_pass = max(1, int(np.prod(grid_shape)) // max(1, np.size(base_angle)))
+
+    dist_sq = None
+    for start in range(0, num_strands, per_pass):
+        # Helix angle based on length position, animation, and strand phase
+        angle = base_angle + phase_offset[start:start + per_pass]
 
-    for strand in range(num_strands):
-        # Each strand has a phase offset
-        phase_offset = (strand / num_strands) * 2 * np.pi
+        # Expected helix positions (spiraling in XY plane as we move along Z)
+        helix_x = np.cos(angle)
+        helix_x *= radius
+        helix_x += center_x
+        helix_y = np.sin(angle, out=angle)
+        helix_y *= radius
+        helix_y += center_y
+
+        # Squared distance from the nearest strand's helix path
+        dx_sq = np.square(x_coords - helix_x)
+        dy_sq = np.square(y_coords - helix_y)
+        for strand in range(len(dx_sq)):
+            if dist_sq is None:
+                dist_sq = dx_sq[strand] + dy_sq[strand]
+            else:
+                np.minimum(dist_sq, dx_sq[strand] + dy_sq[strand], out=dist_sq)
+
+    # Particles along the helix paths (squared compare skips the sqrt)
+    mask = dist_sq < tube_thickness * tube_thickness
 
-        # Create helix path along Z axis (depth/length)
-        # For each Z position, calculate the expected X,Y based on helix equation
-        z_normalized = (z_coords - center_z) / length  # -0.5 to 0.5
+    return mask
 
-        # Helix angle based on length position and animation
-        angle = z_normalized * turns_per_length * 2 * np.pi + time * 2 + phase_offset
 
-        # Expected helix positions (spiraling in XY plane as we move along Z)
-        helix_x = center_x + radius * np.cos(angle)
-        helix_y = center_y + radius * np.sin(angle)
+@lru_cache(maxsize=8)
+def _halo_pattern(z_start, y_start, x_start, shape):
+    """(z + y + x) % 3 == 0 over a block of consecutive integer coords"""
+    z, y, x = np.ogrid[:shape[0], :shape[1], :shape[2]]
+    pattern = (x + y + z + (x_start + y_start + z_start)) % 3 == 0
+    pattern.setflags(write=False)
+    return pattern
 
-        # Distance from helix path
-        dx = x_coords - helix_x
-        dy = y_coords - helix_y
-        distance = np.sqrt(dx**2 + dy**2)
 
-        # Particles along the helix path
-        mask |= distance < tube_thickness
+def _halo_stencil(coords):
+    """
+    Galaxy halo sparseness pattern (int(x) + int(y) + int(z)) % 3 == 0.
 
-    return mask
+    For the unrotated index coords (including z-slabs of them) the pattern
+    is positional, so it is cached per block; rotated coords cast directly.
+    """
+    axes = [np.ravel(c) for c in coords]
+    if (all(np.shape(c)[i] == c.size for i, c in enumerate(coords)) and
+            all(a.dtype.kind in 'iu' and np.all(np.diff(a) == 1) for a in axes)):
+        return _halo_pattern(*(int(a[0]) for a in axes), tuple(a.size for a in axes))
+
+    z_coords, y_coords, x_coords = coords
+    return (x_coords.astype(int) + y_coords.astype(int) + z_coords.astype(int)) % 3 == 0
 
 
+@z_slabbed
 def generate_galaxy(coords, grid_shape, params, time):
     """
     Galaxy-style spiral arms - travels along Z axis with enhanced customization.
@@ -93,8 +244,8 @@ def generate_galaxy(coords, grid_shape, params, time):
     dy = y_coords - center_y
     dz = z_coords - center_z
 
-    radius_xy = np.sqrt(dx**2 + dy**2)
-    angle = np.arctan2(dy, dx)
+    radius_xy_sq = dx * dx + dy * dy
+    radius_xy = np.sqrt(radius_xy_sq)
 
     # Size controls overall galaxy diameter (0.1-2.0 scale)
     galaxy_radius = min(center_x, center_y) * params.size * 0.9
@@ -109,65 +260,74 @@ def generate_galaxy(coords, grid_shape, params, time):
     # Higher density = tight, compressed spiral
     spiral_tightness = 1.0 + params.density * 4  # 1-5
 
-    mask = np.zeros(grid_shape, dtype=bool)
+    mask = np.zeros(np.broadcast_shapes(dx.shape, dy.shape, dz.shape), dtype=bool)
 
     # Number of spiral arms (controlled by objectCount parameter)
     num_arms = max(2, min(6, params.objectCount))
 
+    # Arm width varies with radius - thicker at center, thinner at edges
+    # Also controlled by amplitude for more dramatic arms
+    radius_factor = np.clip(radius_xy / (galaxy_radius + 0.1), 0, 1)
+    arm_width = (2 + params.amplitude * 6) * (1.2 - radius_factor)
+
+    # Distance from disc plane (Z axis) - variable thickness
+    # Disc is thicker at center (bulge) and thinner at edges
+    disc_thickness_at_radius = base_disc_thickness * (1.5 - radius_factor)
+    disc_distance = np.abs(dz)
+
+    # Add density variation along arms (more particles toward center)
+    # This creates a more organic, cloud-like appearance
+    density_factor = 1.0 - 0.3 * radius_factor
+
+    # Near disc plane AND within galaxy radius, shared by every arm
+    in_disc_galaxy = (disc_distance < disc_thickness_at_radius) & (radius_xy < galaxy_radius)
+
+    # Arc-width bounds on the dot product with each arm's direction (see
+    # _arc_bound); these depend only on radius, so they are shared by all arms
+    arm_bound = _arc_bound(radius_xy, arm_width * density_factor)
+    # Dust lanes only add detail at higher frequency settings; the gate is
+    # per frame, so it is read once rather than on every arm
+    add_dust = params.frequency > 2.0
+    if add_dust:
+        dust_bound = _arc_bound(radius_xy, arm_width * 0.4 * density_factor)
+
+    # Logarithmic spiral: θ = a * ln(r), with time rotation for spinning
+    # galaxy. Arms differ only by a constant phase, so (dx, dy) is projected
+    # onto the unphased spiral direction once and each arm's dot product is
+    # that projection rotated by its phase.
+    spiral_angle = spiral_tightness * np.log(radius_xy + 1) - time * 0.3
+    cos_spiral = np.cos(spiral_angle)
+    sin_spiral = np.sin(spiral_angle)
+    along = dx * cos_spiral + dy * sin_spiral
+    across = dy * cos_spiral - dx * sin_spiral
+
+    # Arm and dust hits depend only on x/y, so they are gathered on that
+    # plane and clipped to the disc with a single full-grid AND afterwards
+    in_arms = np.zeros(along.shape, dtype=bool)
     for arm in range(num_arms):
         arm_phase = (arm / num_arms) * 2 * np.pi
 
-        # Logarithmic spiral: θ = a * ln(r)
-        # Expected angle at this radius for this arm
-        # Add time rotation for spinning galaxy
-        expected_angle = spiral_tightness * np.log(radius_xy + 1) + arm_phase - time * 0.3
-
-        # Angular distance from spiral arm (wrapping around)
-        angle_diff = ((angle - expected_angle + np.pi) % (2 * np.pi)) - np.pi
-
-        # Convert angular difference to linear distance at this radius
-        arm_distance = np.abs(angle_diff * radius_xy)
-
-        # Arm width varies with radius - thicker at center, thinner at edges
-        # Also controlled by amplitude for more dramatic arms
-        radius_factor = np.clip(radius_xy / (galaxy_radius + 0.1), 0, 1)
-        arm_width = (2 + params.amplitude * 6) * (1.2 - radius_factor)
-
-        # Distance from disc plane (Z axis) - variable thickness
-        # Disc is thicker at center (bulge) and thinner at edges
-        disc_thickness_at_radius = base_disc_thickness * (1.5 - radius_factor)
-        disc_distance = np.abs(dz)
-
-        # Add density variation along arms (more particles toward center)
-        # This creates a more organic, cloud-like appearance
-        density_factor = 1.0 - 0.3 * radius_factor
-
-        # Combine conditions: near spiral arm AND near disc plane AND within galaxy radius
-        in_arm = arm_distance < arm_width * density_factor
-        in_disc = disc_distance < disc_thickness_at_radius
-        in_galaxy = radius_xy < galaxy_radius
-
-        mask |= (in_arm & in_disc & in_galaxy)
+        # Near spiral arm
+        in_arms |= along * np.cos(arm_phase) + across * np.sin(arm_phase) > arm_bound
 
         # Add "dust lanes" - darker regions between arms
         # Create secondary, fainter structures
-        if params.frequency > 2.0:  # Only add detail at higher frequency settings
-            # Offset dust lane angle slightly
-            dust_angle = expected_angle + np.pi / num_arms
-            dust_angle_diff = ((angle - dust_angle + np.pi) % (2 * np.pi)) - np.pi
-            dust_distance = np.abs(dust_angle_diff * radius_xy)
+        if add_dust:
+            # Offset dust lane angle slightly; narrower than main arms
+            dust_phase = arm_phase + np.pi / num_arms
+            in_arms |= along * np.cos(dust_phase) + across * np.sin(dust_phase) > dust_bound
 
-            # Narrower than main arms
-            in_dust = dust_distance < arm_width * 0.4 * density_factor
-            mask |= (in_dust & in_disc & in_galaxy)
+    # Combine conditions: near an arm AND near disc plane AND within galaxy radius
+    mask |= in_arms & in_disc_galaxy
 
     # Add central bulge (spheroidal)
     # Size controlled by size parameter
     bulge_radius = galaxy_radius * (0.15 + params.size * 0.1)
     # Bulge is slightly elongated along Z
     bulge_z_factor = 0.7  # Flatter bulge
-    bulge_distance = np.sqrt(dx**2 + dy**2 + (dz * bulge_z_factor)**2)
-    mask |= bulge_distance < bulge_radius
+    # Compared squared, reusing the XY radius from above
+    bulge_dz = dz * bulge_z_factor
+    mask |= radius_xy_sq + bulge_dz * bulge_dz < bulge_radius * bulge_radius
 
     # Add outer halo particles for visual interest (if amplitude is high)
     if params.amplitude > 0.5:
@@ -175,18 +335,54 @@ def generate_galaxy(coords, grid_shape, params, time):
         halo_thickness = base_disc_thickness * 0.3
 
         # Sparse halo particles
-        halo_condition = (
+        in_halo = (
             (radius_xy > galaxy_radius * 0.9) &
             (radius_xy < halo_radius) &
-            (disc_distance < halo_thickness) &
-            # Make halo sparse using modulo pattern
-            ((x_coords.astype(int) + y_coords.astype(int) + z_coords.astype(int)) % 3 == 0)
+            (disc_distance < halo_thickness)
         )
-        mask |= halo_condition
+
+        # Make halo sparse using modulo pattern
+        mask |= in_halo & _halo_stencil(coords)
 
     return mask
 
 
+@lru_cache(maxsize=8)
+def _explosion_cycle(cycle_num, num_particles, grid_shape):
+    """
+    Center and particle direction terms for one explosion cycle.
+
+    Both are reseeded identically on every frame of a cycle, so they are
+    drawn once (from private RandomStates with the same seeds and draw
+    order as the global np.random calls they replace) and reused.
+
+    Returns:
+        (center_x, center_y, center_z), and read-only (P,) arrays
+        (sin_phi, cos_phi, sin_theta, cos_theta)
+    """
+    length, height, width = grid_shape
+
+    # Pseudo-random center position based on cycle number
+    rng = np.random.RandomState(cycle_num * 42)
+    center = (
+        rng.randint(width // 4, 3 * width // 4),
+        rng.randint(height // 4, 3 * height // 4),
+        rng.randint(length // 4, 3 * length // 4),
+    )
+
+    # Random direction for each particle (spherical coordinates); drawn as
+    # (theta, phi) pairs so the sequence matches one draw per particle
+    rng = np.random.RandomState(cycle_num * 42 + 1)  # Same seed for consistent directions
+    directions = rng.uniform(0, (2 * np.pi, np.pi), size=(num_particles, 2))
+    theta = directions[:, 0]
+    phi = directions[:, 1]
+
+    terms = (np.sin(phi), np.cos(phi), np.sin(theta), np.cos(theta))
+    for term in terms:
+        term.setflags(write=False)
+    return center, terms
+
+
 def generate_explode(coords, grid_shape, params, time):
     """
     Particles exploding from a random center point.
@@ -200,7 +396,6 @@ def generate_explode(coords, grid_shape, params, time):
     Returns:
         Boolean mask of explosion voxels
     """
-    z_coords, y_coords, x_coords = coords
     length, height, width = grid_shape
 
     # Use time to create explosion cycles
@@ -212,11 +407,14 @@ def generate_explode(coords, grid_shape, params, time):
     # Use floor division to get the cycle number
     cycle_num = int(time / explosion_cycle)
 
-    # Pseudo-random center position based on cycle number
-    np.random.seed(cycle_num * 42)
-    center_x = np.random.randint(width // 4, 3 * width // 4)
-    center_y = np.random.randint(height // 4, 3 * height // 4)
-    center_z = np.random.randint(length // 4, 3 * length // 4)
+    # Density controls number of particles
+    num_particles = int(50 + params.density * 200)
+
+    # Pseudo-random center and particle directions, fixed for the cycle
+    center, (sin_phi, cos_phi, sin_theta, cos_theta) = _explosion_cycle(
+        cycle_num, num_particles, grid_shape
+    )
+    center_x, center_y, center_z = center
 
     # Size controls the initial explosion size
     initial_radius = 2 + params.size * 3
@@ -229,40 +427,16 @@ def generate_explode(coords, grid_shape, params, time):
     # Shell thickness (ring of particles expanding)
     shell_thickness = 2 + params.size * 3
 
-    # Calculate distance from explosion center
-    dx = x_coords - center_x
-    dy = y_coords - center_y
-    dz = z_coords - center_z
-    distance = np.sqrt(dx**2 + dy**2 + dz**2)
+    # Particle size (small)
+    particle_size = 0.8 + params.size * 0.5
 
-    # Density controls number of particles
-    num_particles = int(50 + params.density * 200)
-
-    # Create particle spray using polar coordinates
-    mask = np.zeros(grid_shape, dtype=bool)
+    # Particle positions along their trajectories
+    px = center_x + current_radius * sin_phi * cos_theta
+    py = center_y + current_radius * sin_phi * sin_theta
+    pz = center_z + current_radius * cos_phi
 
-    np.random.seed(cycle_num * 42 + 1)  # Same seed for consistent directions
-
-    for i in range(num_particles):
-        # Random direction for each particle (spherical coordinates)
-        theta = np.random.uniform(0, 2 * np.pi)
-        phi = np.random.uniform(0, np.pi)
-
-        # Particle position along its trajectory
-        px = center_x + current_radius * np.sin(phi) * np.cos(theta)
-        py = center_y + current_radius * np.sin(phi) * np.sin(theta)
-        pz = center_z + current_radius * np.cos(phi)
-
-        # Particle size (small)
-        particle_size = 0.8 + params.size * 0.5
-
-        # Distance to this particle
-        pdx = x_coords - px
-        pdy = y_coords - py
-        pdz = z_coords - pz
-        pdist = np.sqrt(pdx**2 + pdy**2 + pdz**2)
-
-        mask |= pdist < particle_size
+    # Create particle spray from all positions at once
+    mask = _particles_mask(coords, grid_shape, px, py, pz, particle_size)
 
     return mask
 
@@ -280,24 +454,17 @@ def generate_flowing_particles(coords, grid_shape, params, time):
     Returns:
         Boolean mask of flowing particle voxels
     """
-    z_coords, y_coords, x_coords = coords
     length, height, width = grid_shape
 
-    mask = np.zeros(grid_shape, dtype=bool)
     num_particles = int(100 * params.density)
 
-    for i in range(num_particles):
-        seed = i * 12345
-        px = ((seed % width) + time * 5 * (1 + i % 3)) % width
-        py = ((seed * 7 % height) + time * 3 * (1 + i % 2)) % height
-        pz = ((seed * 13 % length) + time * 4 * (1 + i % 4)) % length
-
-        dx = x_coords - px
-        dy = y_coords - py
-        dz = z_coords - pz
-        distance = np.sqrt(dx**2 + dy**2 + dz**2)
+    i = np.arange(num_particles)
+    seed = i * 12345
+    px = ((seed % width) + time * 5 * (1 + i % 3)) % width
+    py = ((seed * 7 % height) + time * 3 * (1 + i % 2)) % height
+    pz = ((seed * 13 % length) + time * 4 * (1 + i % 4)) % length
 
-        particle_size = 2 * params.size
-        mask |= distance < particle_size
+    particle_size = 2 * params.size
+    mask = _particles_mask(coords, grid_shape, px, py, pz, particle_size)
 
     return mask
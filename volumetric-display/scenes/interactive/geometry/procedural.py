@@ -4,8 +4,51 @@ Noise, clouds, cellular, and fractal patterns
 """
 
 import numpy as np
+from ..jit import NUMBA_AVAILABLE, njit, prange
+from .utils import z_slabbed
 
 
+@njit(parallel=True, cache=True)
+def _cellular_kernel(mask, z_coords, y_coords, x_coords, centers, r2_inner, r2_outer):
+    """
+    Hollow-sphere cell walls r2_inner < d^2 < r2_outer around each center.
+
+    Coords are (possibly rotated) arrays broadcast to the mask shape and
+    centers is (N, 3) as (x, y, z). Each voxel stops at the first wall hit.
+    """
+    for z in prange(mask.shape[0]):
+        for y in range(mask.shape[1]):
+            for x in range(mask.shape[2]):
+                pz = z_coords[z, y, x]
+                py = y_coords[z, y, x]
+                px = x_coords[z, y, x]
+                hit = False
+                for c in range(centers.shape[0]):
+                    dx = px - centers[c, 0]
+                    dy = py - centers[c, 1]
+                    dz = pz - centers[c, 2]
+                    d2 = dx * dx + dy * dy + dz * dz
+                    if r2_inner < d2 < r2_outer:
+                        hit = True
+                        break
+                mask[z, y, x] = hit
+
+
+def _float32_coords(coords):
+    """Coords as float32 so the trig below runs on single-precision lanes"""
+    return tuple(c.astype(np.float32, copy=False) for c in coords)
+
+
+# The octave terms below call sin/cos on the phase-shifted argument directly.
+# Splitting sin(a + phase) into sin(a)*cos(phase) + cos(a)*sin(phase) can't be
+# cached across frames (scale pulses with time) and needs both sin(a) and
+# cos(a), so it measured ~2x slower per term than one float32 SIMD sin.
+# A fused numba kernel (prange over z, fastmath) fares worse still: without
+# SVML numba calls scalar libm per voxel, and it measured 8-50x slower than
+# these NumPy float32 expressions, whose axis-aligned trig runs on 1-D axes.
+
+
+@z_slabbed
 def generate_noise(coords, grid_shape, params, time, center, angles=None):
     """
     Multi-octave sine-based noise pattern.
@@ -21,11 +64,12 @@ def generate_noise(coords, grid_shape, params, time, center, angles=None):
     Returns:
         Boolean mask of noise voxels
     """
-    z_coords, y_coords, x_coords = coords
+    z_coords, y_coords, x_coords = _float32_coords(coords)
 
     # Apply pulsing/scaling effect to pattern scale
     pulse = 1.0 + (params.scaling_amount * 0.1) * np.sin(time * params.scaling_speed)
-    scale = params.size * 0.1 * pulse
+    scale = np.float32(params.size * 0.1 * pulse)
+    time = np.float32(time)
     threshold = params.amplitude * 0.5
 
     # Base noise
@@ -35,16 +79,17 @@ def generate_noise(coords, grid_shape, params, time, center, angles=None):
         np.sin(z_coords * scale + time * 0.3)
     )
 
-    # Second octave
-    noise += 0.5 * (
-        np.sin(x_coords * scale * 2 - time * 1.5) *
+    # Second octave (weight applied to the x factor before it spans the grid)
+    noise += (
+        (0.5 * np.sin(x_coords * scale * 2 - time * 1.5)) *
         np.cos(z_coords * scale * 2 + time)
     )
 
-    noise = (noise + 1.5) / 3.0
-    return noise > threshold
+    # (noise + 1.5) / 3 > threshold, rearranged onto the scalar side
+    return noise > threshold * 3.0 - 1.5
 
 
+@z_slabbed
 def generate_clouds(coords, grid_shape, params, time, center, angles=None):
     """
     Volumetric cloud-like patterns with soft billowing.
@@ -60,11 +105,12 @@ def generate_clouds(coords, grid_shape, params, time, center, angles=None):
     Returns:
         Boolean mask of cloud voxels
     """
-    z_coords, y_coords, x_coords = coords
+    z_coords, y_coords, x_coords = _float32_coords(coords)
 
     # Apply pulsing/scaling effect to pattern frequency
     pulse = 1.0 + (params.scaling_amount * 0.1) * np.sin(time * params.scaling_speed)
-    freq = 0.15 * params.size * pulse
+    freq = np.float32(0.15 * params.size * pulse)
+    time = np.float32(time)
 
     # Multiple octaves for cloud-like appearance
     # Octave 1: Large features
@@ -72,16 +118,19 @@ def generate_clouds(coords, grid_shape, params, time, center, angles=None):
             np.cos(y_coords * freq + time * 0.2) * \
             np.sin(z_coords * freq - time * 0.15)
 
+    # Octave weights are applied to the x factor, so with axis-aligned coords
+    # each octave makes one full-grid multiply (by z) plus the accumulate
+
     # Octave 2: Medium features
-    cloud += 0.5 * (
-        np.sin(x_coords * freq * 2.3 - time * 0.5) *
+    cloud += (
+        (0.5 * np.sin(x_coords * freq * 2.3 - time * 0.5)) *
         np.cos(y_coords * freq * 1.8 + time * 0.3) *
         np.sin(z_coords * freq * 2.1 + time * 0.25)
     )
 
     # Octave 3: Fine details
-    cloud += 0.25 * (
-        np.sin(x_coords * freq * 4.7 + time * 0.8) *
+    cloud += (
+        (0.25 * np.sin(x_coords * freq * 4.7 + time * 0.8)) *
         np.cos(y_coords * freq * 4.2 - time * 0.6) *
         np.sin(z_coords * freq * 4.5 + time * 0.7)
     )
@@ -115,41 +164,60 @@ def generate_cellular(coords, grid_shape, params, time):
     # Size controls cell size (ensure minimum scale to prevent empty grid)
     cell_scale = 1.0 / max(0.3, params.size + 0.1)
 
-    mask = np.zeros(grid_shape, dtype=bool)
-
-    # Generate pseudo-random cell centers that move over time
-    np.random.seed(42)  # Fixed seed for consistent cells
+    # Generate pseudo-random cell centers that move over time. A private
+    # fixed-seed stream keeps the cells consistent without reseeding the
+    # global RNG every frame; (x, y, z) rows match the old draw order
+    rng = np.random.RandomState(42)
+    base = rng.uniform(0, (width, height, length), size=(num_cells, 3))
 
+    centers = np.empty((num_cells, 3))
     for i in range(num_cells):
         # Base position
-        cx = np.random.uniform(0, width)
-        cy = np.random.uniform(0, height)
-        cz = np.random.uniform(0, length)
+        cx, cy, cz = base[i]
 
         # Animate cell centers in orbital patterns
         angle = time * 0.5 + i * np.pi * 2 / num_cells
         orbit_radius = 3 + i % 5
 
-        cx = (cx + np.cos(angle) * orbit_radius) % width
-        cy = (cy + np.sin(angle * 0.7) * orbit_radius) % height
-        cz = (cz + np.sin(angle * 0.5) * orbit_radius) % length
+        centers[i, 0] = (cx + np.cos(angle) * orbit_radius) % width
+        centers[i, 1] = (cy + np.sin(angle * 0.7) * orbit_radius) % height
+        centers[i, 2] = (cz + np.sin(angle * 0.5) * orbit_radius) % length
+
+    # Amplitude controls cell wall thickness
+    cell_radius = 8 * cell_scale
+    wall_thickness = 1.5 + params.amplitude * 3
+
+    # Cell walls are hollow spheres, tested on squared distance; a negative
+    # inner radius leaves no lower bound, which -1 encodes
+    inner_radius = cell_radius - wall_thickness
+    r2_inner = inner_radius * inner_radius if inner_radius >= 0 else -1.0
+    r2_outer = cell_radius * cell_radius
+
+    if NUMBA_AVAILABLE:
+        mask = np.empty(grid_shape, dtype=bool)
+        _cellular_kernel(
+            mask,
+            np.broadcast_to(z_coords, grid_shape),
+            np.broadcast_to(y_coords, grid_shape),
+            np.broadcast_to(x_coords, grid_shape),
+            centers, r2_inner, r2_outer
+        )
+        return mask
 
-        # Distance from cell center
+    mask = np.zeros(grid_shape, dtype=bool)
+    for cx, cy, cz in centers:
+        # Squared distance from cell center
         dx = x_coords - cx
         dy = y_coords - cy
         dz = z_coords - cz
-        distance = np.sqrt(dx**2 + dy**2 + dz**2)
+        dist_sq = dx * dx + dy * dy + dz * dz
 
-        # Amplitude controls cell wall thickness
-        cell_radius = 8 * cell_scale
-        wall_thickness = 1.5 + params.amplitude * 3
-
-        # Create cell walls (hollow spheres)
-        mask |= (distance < cell_radius) & (distance > (cell_radius - wall_thickness))
+        mask |= (dist_sq < r2_outer) & (dist_sq > r2_inner)
 
     return mask
 
 
+@z_slabbed
 def generate_fractals(coords, grid_shape, params, time, center, angles=None):
     """
     Fractal-like recursive patterns with self-similarity.
@@ -165,21 +233,22 @@ def generate_fractals(coords, grid_shape, params, time, center, angles=None):
     Returns:
         Boolean mask of fractal voxels
     """
-    z_coords, y_coords, x_coords = coords
+    z_coords, y_coords, x_coords = _float32_coords(coords)
     length, height, width = grid_shape
+    cx, cy, cz = (np.float32(c) for c in center)
 
     # Normalize coordinates to center
-    nx = (x_coords - center[0]) / width
-    ny = (y_coords - center[1]) / height
-    nz = (z_coords - center[2]) / length
+    nx = (x_coords - cx) / width
+    ny = (y_coords - cy) / height
+    nz = (z_coords - cz) / length
 
     # Apply pulsing/scaling effect to pattern scale
     pulse = 1.0 + (params.scaling_amount * 0.1) * np.sin(time * params.scaling_speed)
-    scale = params.size * 3 * pulse
+    scale = np.float32(params.size * 3 * pulse)
 
     # Create a 3D fractal pattern using recursive sine functions
     # Each iteration adds smaller details
-    fractal = np.zeros(grid_shape, dtype=np.float32)
+    fractal = np.zeros(np.broadcast_shapes(nx.shape, ny.shape, nz.shape), dtype=np.float32)
 
     # Density controls number of iterations (detail level)
     iterations = 2 + int(params.density * 4)  # 2-6 iterations
@@ -187,15 +256,32 @@ def generate_fractals(coords, grid_shape, params, time, center, angles=None):
     amplitude = 1.0
     frequency = 1.0
 
+    # Time phases are the same for every octave
+    t = np.float32(time)
+    phase_x = t
+    phase_y = t * 0.3
+    phase_z = t * 0.5
+
     for i in range(iterations):
-        # Add rotated pattern at each scale
+        # Add rotated pattern at each scale; the octave scale is folded into
+        # the scalar rotation terms so the rotated coords come out pre-scaled
         angle = time * 0.5 + i * np.pi / 3
-
-        fractal += amplitude * (
-            np.sin((nx * np.cos(angle) - nz * np.sin(angle)) * frequency * scale + time) *
-            np.cos(ny * frequency * scale - time * 0.3) *
-            np.sin((nx * np.sin(angle) + nz * np.cos(angle)) * frequency * scale + time * 0.5)
-        )
+        octave_scale = frequency * scale
+        cos_angle = np.float32(np.cos(angle) * octave_scale)
+        sin_angle = np.float32(np.sin(angle) * octave_scale)
+
+        # Rotated x/z projections, each built once in place and fed straight
+        # to its sine. For axis-aligned coords they share an (L,1,W) plane;
+        # weight and combine them there, then one multiply by the y factor
+        # spans the grid
+        rx = nx * cos_angle - nz * sin_angle
+        rx += phase_x
+        rz = nx * sin_angle + nz * cos_angle
+        rz += phase_z
+        xz = np.sin(rx, out=rx)
+        xz *= np.sin(rz, out=rz)
+        xz *= amplitude
+        fractal += xz * np.cos(ny * octave_scale - phase_y)
 
         # Reduce amplitude and increase frequency for next octave
         amplitude *= 0.5
@@ -2,8 +2,26 @@
 Geometry utilities for transformations
 """
 
+import functools
+
 import numpy as np
 
+# Voxels per z-slab for generators wrapped with z_slabbed. One float64 slab
+# is 512 KB, so a generator's handful of live temporaries stays cache
+# resident; grids at or under this size run in a single call.
+SLAB_VOXELS = 65536
+
+
+def _affine_component(weights, inputs, offset):
+    """Sum of weight * input over the non-zero weights, plus offset"""
+    total = None
+    for weight, coord in zip(weights, inputs):
+        if weight == 0:
+            continue
+        term = coord * weight if weight != 1 else coord
+        total = term if total is None else total + term
+    return total + offset
+
 
 def rotate_coordinates(coords, center, angles):
     """
@@ -25,41 +43,52 @@ def rotate_coordinates(coords, center, angles):
     if angle_x == 0 and angle_y == 0 and angle_z == 0:
         return coords
 
-    # Translate to origin
-    x = x_coords - cx
-    y = y_coords - cy
-    z = z_coords - cz
-
-    # Rotation around X axis (pitch)
-    if angle_x != 0:
-        cos_x = np.cos(angle_x)
-        sin_x = np.sin(angle_x)
-        y_new = y * cos_x - z * sin_x
-        z_new = y * sin_x + z * cos_x
-        y = y_new
-        z = z_new
-
-    # Rotation around Y axis (yaw)
-    if angle_y != 0:
-        cos_y = np.cos(angle_y)
-        sin_y = np.sin(angle_y)
-        x_new = x * cos_y + z * sin_y
-        z_new = -x * sin_y + z * cos_y
-        x = x_new
-        z = z_new
-
-    # Rotation around Z axis (roll)
-    if angle_z != 0:
-        cos_z = np.cos(angle_z)
-        sin_z = np.sin(angle_z)
-        x_new = x * cos_z - y * sin_z
-        y_new = x * sin_z + y * cos_z
-        x = x_new
-        y = y_new
-
-    # Translate back
-    x_rotated = x + cx
-    y_rotated = y + cy
-    z_rotated = z + cz
+    # Compose pitch (X), then yaw (Y), then roll (Z) into one matrix acting
+    # on (x, y, z) offsets from the center
+    cos_x, sin_x = np.cos(angle_x), np.sin(angle_x)
+    cos_y, sin_y = np.cos(angle_y), np.sin(angle_y)
+    cos_z, sin_z = np.cos(angle_z), np.sin(angle_z)
+    rot_x = np.array([[1, 0, 0], [0, cos_x, -sin_x], [0, sin_x, cos_x]])
+    rot_y = np.array([[cos_y, 0, sin_y], [0, 1, 0], [-sin_y, 0, cos_y]])
+    rot_z = np.array([[cos_z, -sin_z, 0], [sin_z, cos_z, 0], [0, 0, 1]])
+    matrix = rot_z @ rot_y @ rot_x
+
+    # Each output is an affine combination of the inputs. With sparse coords
+    # the x and y terms form an (H,W) plane first, so each rotated component
+    # is a single (L,H,W) array with no full-size temporaries, and components
+    # an axis rotation leaves alone keep their sparse shape.
+    center_xyz = np.array([cx, cy, cz], dtype=float)
+    offsets = center_xyz - matrix @ center_xyz
+    inputs = (x_coords, y_coords, z_coords)
+
+    x_rotated, y_rotated, z_rotated = (
+        _affine_component(matrix[row], inputs, offsets[row]) for row in range(3)
+    )
 
     return (z_rotated, y_rotated, x_rotated)
+
+
+def z_slabbed(generate):
+    """
+    Evaluate a generator(coords, grid_shape, ...) one z-slab at a time.
+
+    Each slab gets the coords sliced along z (axes of length 1 are passed
+    through) and the full grid_shape, so centers and normalization are
+    unchanged. The generator must size its output from the coords it is
+    given, not from grid_shape.
+    """
+    @functools.wraps(generate)
+    def wrapper(coords, grid_shape, *args, **kwargs):
+        length, height, width = grid_shape
+        slab = max(1, SLAB_VOXELS // (height * width))
+        if slab >= length:
+            return generate(coords, grid_shape, *args, **kwargs)
+
+        mask = np.empty(grid_shape, dtype=bool)
+        for z0 in range(0, length, slab):
+            z_slice = slice(z0, z0 + slab)
+            slab_coords = tuple(c[z_slice] if np.shape(c)[0] > 1 else c for c in coords)
+            mask[z_slice] = generate(slab_coords, grid_shape, *args, **kwargs)
+        return mask
+
+    return wrapper
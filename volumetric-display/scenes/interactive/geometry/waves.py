@@ -28,10 +28,10 @@ def generate_ripple_wave(coords, grid_shape, time, frequency=1.0, amplitude=0.5,
 
     cx, cy = width / 2, height / 2
 
-    # Broadcast to full grid
-    zz, yy, xx = np.meshgrid(np.arange(length), np.arange(height), np.arange(width), indexing='ij')
+    # Sparse axes; everything stays rank-reduced until the final comparison
+    zz, yy, xx = np.ogrid[:length, :height, :width]
 
-    # Calculate distance in XY plane
+    # Calculate distance in XY plane (shape (1, H, W))
     dx = xx - cx
     dy = yy - cy
     distance = np.sqrt(dx**2 + dy**2)
@@ -65,8 +65,8 @@ def generate_plane_wave(coords, grid_shape, time, amplitude=0.4, speed=3, direct
     z_coords, y_coords, x_coords = coords
     length, height, width = grid_shape
 
-    # Create full meshgrid for calculations
-    zz, yy, xx = np.meshgrid(np.arange(length), np.arange(height), np.arange(width), indexing='ij')
+    # Sparse axes; pos stays at most 2-D
+    zz, yy, xx = np.ogrid[:length, :height, :width]
 
     # Direction functions
     if direction == 'x':
@@ -92,8 +92,10 @@ def generate_plane_wave(coords, grid_shape, time, amplitude=0.4, speed=3, direct
     # Thickness based on amplitude
     thickness = 3 + amplitude * 4
 
-    # Create mask where position is within thickness of sweep
-    mask = np.abs(pos - sweep_pos * frequency) < thickness
+    # Create mask where position is within thickness of sweep,
+    # broadcasting the reduced-rank test over the full grid
+    mask = np.less(np.abs(pos - sweep_pos * frequency), thickness,
+                   out=np.empty(grid_shape, dtype=bool))
 
     return mask
 
@@ -120,20 +122,14 @@ def generate_standing_wave(coords, grid_shape, time, frequency=1.0, amplitude=0.
     time_sin = np.sin(time)
     threshold = 0.5
 
-    # Create a full grid for the XY pattern
-    mask = np.zeros(grid_shape, dtype=bool)
+    # Separable XY pattern: one sine per column and row, then an outer product
+    wave_x = np.sin(np.arange(width) * freq)
+    wave_y = np.sin(np.arange(height) * freq)
+    wave = wave_x[None, :] * wave_y[:, None] * time_sin
+    value = (wave + 1) * 0.5 * amplitude
 
-    # Calculate pattern for each XY position
-    for y in range(height):
-        for x in range(width):
-            wave_x = np.sin(x * freq)
-            wave_y = np.sin(y * freq)
-            wave = wave_x * wave_y * time_sin
-            value = (wave + 1) * 0.5 * amplitude
-
-            # If this XY position is active, fill entire Z column (vertical)
-            if value > threshold:
-                mask[:, y, x] = True
+    # Active XY positions fill their entire Z column (vertical)
+    mask = np.broadcast_to(value > threshold, grid_shape).copy()
 
     return mask
 
@@ -163,8 +159,8 @@ def generate_interference_wave(coords, grid_shape, time, frequency=1.0, amplitud
     source2_x = width * 0.7
     source2_y = height * 0.7
 
-    # Create full meshgrid
-    zz, yy, xx = np.meshgrid(np.arange(length), np.arange(height), np.arange(width), indexing='ij')
+    # Sparse axes; distances and waves stay (1, H, W)
+    zz, yy, xx = np.ogrid[:length, :height, :width]
 
     # Calculate distance from each point to each source in XY plane
     dx1 = xx - source1_x
@@ -192,7 +188,7 @@ def generate_interference_wave(coords, grid_shape, time, frequency=1.0, amplitud
     # Create mask for wave surface
     mask = np.abs(zz - z_pos) < threshold
 
-    # Create intensity field for color mapping
-    intensity = (total_wave + 1) / 2
+    # Create intensity field for color mapping (constant along Z)
+    intensity = np.broadcast_to((total_wave + 1) / 2, grid_shape)
 
     return mask, intensity
@@ -0,0 +1,23 @@
+"""
+Optional Numba JIT support
+
+Hot kernels import njit/prange from here. When numba is not installed the
+decorator is a pass-through and NUMBA_AVAILABLE is False, so callers keep
+dispatching to their NumPy implementation.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Pass-through stand-in for numba.njit (bare or with options)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+__all__ = ['NUMBA_AVAILABLE', 'njit', 'prange']
@@ -9,7 +9,37 @@ Constraint functions modify particle state to enforce physical rules:
 
 import numpy as np
 from .engine import PhysicsState
-from collections import defaultdict
+from ..jit import NUMBA_AVAILABLE, njit, prange
+
+# Spatial hash neighbor offsets: the cell itself, then the 13-cell half
+# shell of offsets lexicographically after (0, 0, 0). Every adjacent cell
+# pair is reached from exactly one side, so each particle pair comes up once
+_NEIGHBOR_OFFSETS = np.array(
+    [(0, 0, 0)] +
+    [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+     if (dx, dy, dz) > (0, 0, 0)],
+    dtype=np.int64
+)
+
+
+# Constraint kernels take bounds and restitution as arguments rather than
+# being specialized per factory call: the bouncing scene rebuilds its
+# boundary constraint every frame, so baked-in constants would recompile
+# each frame, while these compile once and are cached on disk.
+@njit(parallel=True, cache=True)
+def _boundary_collision_kernel(position, velocity, active, bounds_min, bounds_max, restitution):
+    """Clamp active particles into the bounds, reflecting velocity at walls"""
+    for i in prange(position.shape[0]):
+        if not active[i]:
+            continue
+        for axis in range(3):
+            p = position[i, axis]
+            if p < bounds_min[axis]:
+                position[i, axis] = bounds_min[axis]
+                velocity[i, axis] *= -restitution
+            elif p > bounds_max[axis]:
+                position[i, axis] = bounds_max[axis]
+                velocity[i, axis] *= -restitution
 
 
 def boundary_collision(bounds_min: np.ndarray, bounds_max: np.ndarray, restitution: float = 0.8):
@@ -41,28 +71,45 @@ def boundary_collision(bounds_min: np.ndarray, bounds_max: np.ndarray, restituti
     bounds_max = np.array(bounds_max, dtype=float)
 
     def constraint_func(state: PhysicsState) -> PhysicsState:
-        # Only process active particles
-        active_mask = state.active
+        if NUMBA_AVAILABLE:
+            _boundary_collision_kernel(state.position, state.velocity, state.active,
+                                       bounds_min, bounds_max, restitution)
+            return state
 
-        for axis in range(3):
-            # Check lower bound
-            below_min = active_mask & (state.position[:, axis] < bounds_min[axis])
-            if np.any(below_min):
-                state.position[below_min, axis] = bounds_min[axis]
-                state.velocity[below_min, axis] *= -restitution
-
-            # Check upper bound
-            above_max = active_mask & (state.position[:, axis] > bounds_max[axis])
-            if np.any(above_max):
-                state.position[above_max, axis] = bounds_max[axis]
-                state.velocity[above_max, axis] *= -restitution
+        # Only process active particles; all three axes are clamped at once
+        # against the (3,) bounds rather than column by column
+        active_mask = state.active[:, np.newaxis]
+
+        # Branchless: a coordinate hit a wall exactly when clamping moved it,
+        # and its velocity is scaled by -restitution (all others by 1)
+        clamped = np.clip(state.position, bounds_min, bounds_max)
+        hit = state.position != clamped
+        hit &= active_mask
+        state.position[...] = np.where(active_mask, clamped, state.position)
+        state.velocity *= np.where(hit, -restitution, 1.0)
 
         return state
 
     constraint_func.__name__ = 'boundary_collision'
+    # Lets the engine fold this constraint into its integration kernel
+    constraint_func.bounce = (bounds_min, bounds_max, restitution)
     return constraint_func
 
 
+@njit(parallel=True, cache=True)
+def _boundary_wrap_kernel(position, active, bounds_min, bounds_max, bounds_size):
+    """Wrap active particles that left the bounds to the opposite side"""
+    for i in prange(position.shape[0]):
+        if not active[i]:
+            continue
+        for axis in range(3):
+            p = position[i, axis]
+            if p < bounds_min[axis]:
+                position[i, axis] = p + bounds_size[axis]
+            elif p > bounds_max[axis]:
+                position[i, axis] = p - bounds_size[axis]
+
+
 def boundary_wrap(bounds_min: np.ndarray, bounds_max: np.ndarray):
     """
     Create boundary wrap constraint (toroidal topology).
@@ -89,19 +136,20 @@ def boundary_wrap(bounds_min: np.ndarray, bounds_max: np.ndarray):
     bounds_size = bounds_max - bounds_min
 
     def constraint_func(state: PhysicsState) -> PhysicsState:
-        # Only process active particles
-        active_mask = state.active
+        if NUMBA_AVAILABLE:
+            _boundary_wrap_kernel(state.position, state.active,
+                                  bounds_min, bounds_max, bounds_size)
+            return state
 
-        for axis in range(3):
-            # Wrap particles that go below min
-            below_min = active_mask & (state.position[:, axis] < bounds_min[axis])
-            if np.any(below_min):
-                state.position[below_min, axis] += bounds_size[axis]
+        # Only process active particles, all three axes at once
+        active_mask = state.active[:, np.newaxis]
 
-            # Wrap particles that go above max
-            above_max = active_mask & (state.position[:, axis] > bounds_max[axis])
-            if np.any(above_max):
-                state.position[above_max, axis] -= bounds_size[axis]
+        # Wrap particles that go below min or above max (a wrapped
+        # coordinate can't cross the opposite bound in the same step)
+        below_min = active_mask & (state.position < bounds_min)
+        above_max = active_mask & (state.position > bounds_max)
+        np.add(state.position, bounds_size, out=state.position, where=below_min)
+        np.subtract(state.position, bounds_size, out=state.position, where=above_max)
 
         return state
 
@@ -147,8 +195,39 @@ def particle_particle_collision(enabled: bool = True, restitution: float = 0.7,
         return _particle_collision_naive(restitution)
 
 
+def _sweep_candidate_pairs(positions, radii):
+    """
+    Broad phase: pairs whose x extents can overlap (sweep and prune on x).
+
+    Args:
+        positions: (N, 3) particle positions
+        radii: (N,) particle radii
+
+    Returns:
+        (K,) index arrays i < j into positions, in row-major pair order
+    """
+    order = np.argsort(positions[:, 0], kind='stable')
+    xs = positions[order, 0]
+
+    # Each particle is paired with the later ones in x that lie within the
+    # largest possible contact distance
+    reach = np.searchsorted(xs, xs + 2 * np.max(radii), side='right')
+    counts = reach - np.arange(len(xs)) - 1
+    first = np.repeat(np.arange(len(xs)), counts)
+    # Offsets 1..count within each particle's run
+    run_start = np.repeat(np.cumsum(counts) - counts, counts)
+    second = first + np.arange(len(first)) - run_start + 1
+
+    a = order[first]
+    b = order[second]
+    i = np.minimum(a, b)
+    j = np.maximum(a, b)
+    pair_order = np.lexsort((j, i))
+    return i[pair_order], j[pair_order]
+
+
 def _particle_collision_naive(restitution: float):
-    """Naive O(N^2) particle collision detection."""
+    """Sweep-and-prune particle collision detection (O(N^2) worst case)."""
 
     def constraint_func(state: PhysicsState) -> PhysicsState:
         active_indices = np.where(state.active)[0]
@@ -157,61 +236,168 @@ def _particle_collision_naive(restitution: float):
         if n < 2:
             return state  # Need at least 2 particles
 
-        # Compute pairwise distances (vectorized)
         positions = state.position[active_indices]
         radii = state.radius[active_indices]
 
-        # Broadcasting: (N, 1, 3) - (1, N, 3) = (N, N, 3)
-        diff = positions[:, np.newaxis, :] - positions[np.newaxis, :, :]
-        distances = np.linalg.norm(diff, axis=2)
-
-        # Sum of radii for each pair
-        radii_sum = radii[:, np.newaxis] + radii[np.newaxis, :]
+        # Broad phase on x, then exact squared distances for the candidates
+        i_indices, j_indices = _sweep_candidate_pairs(positions, radii)
+        diff = positions[j_indices] - positions[i_indices]
+        dist_sq = np.einsum('ij,ij->i', diff, diff)
+        radii_sum = radii[i_indices] + radii[j_indices]
 
         # Find colliding pairs (distance < sum of radii, exclude self-collision)
-        colliding = (distances < radii_sum) & (distances > 0)
-
-        # For each colliding pair, resolve collision
-        i_indices, j_indices = np.where(colliding)
+        colliding = (dist_sq < radii_sum * radii_sum) & (dist_sq > 0)
 
-        for idx in range(len(i_indices)):
-            i_local = i_indices[idx]
-            j_local = j_indices[idx]
+        # Resolve every colliding pair at once from the pre-collision
+        # velocities; np.add.at accumulates particles that sit in several pairs
+        i = active_indices[i_indices[colliding]]
+        j = active_indices[j_indices[colliding]]
+        distances = np.sqrt(dist_sq[colliding])
 
-            if i_local >= j_local:  # Only process each pair once
-                continue
+        # Collision normal (from i to j)
+        normal = diff[colliding] / distances[:, np.newaxis]
 
-            i = active_indices[i_local]
-            j = active_indices[j_local]
+        # Velocity along normal
+        rel_vel = state.velocity[j] - state.velocity[i]
+        vel_normal = np.einsum('ij,ij->i', rel_vel, normal)
 
-            # Collision normal (from i to j)
-            normal = diff[i_local, j_local] / distances[i_local, j_local]
+        # Only resolve if moving toward each other
+        approaching = vel_normal < 0
+        if not np.any(approaching):
+            return state
+        i = i[approaching]
+        j = j[approaching]
+        normal = normal[approaching]
+        # Massless particles use mass 1, as in the engine
+        mass_safe = np.where(state.mass > 0, state.mass, 1.0)
+        inv_mass_i = 1 / mass_safe[i]
+        inv_mass_j = 1 / mass_safe[j]
+
+        # Impulse magnitude (simplified elastic collision)
+        impulse = -(1 + restitution) * vel_normal[approaching] / (inv_mass_i + inv_mass_j)
+
+        # Apply impulse
+        impulse_vec = impulse[:, np.newaxis] * normal
+        np.add.at(state.velocity, i, -impulse_vec * inv_mass_i[:, np.newaxis])
+        np.add.at(state.velocity, j, impulse_vec * inv_mass_j[:, np.newaxis])
+
+        # Separate overlapping particles
+        overlap = radii_sum[colliding][approaching] - distances[approaching]
+        separation = normal * (overlap / 2)[:, np.newaxis]
+        np.add.at(state.position, i, -separation)
+        np.add.at(state.position, j, separation)
 
-            # Relative velocity
-            rel_vel = state.velocity[j] - state.velocity[i]
+        return state
 
-            # Velocity along normal
-            vel_normal = np.dot(rel_vel, normal)
+    constraint_func.__name__ = 'particle_particle_collision'
+    return constraint_func
 
-            # Only resolve if moving toward each other
-            if vel_normal < 0:
-                # Impulse magnitude (simplified elastic collision)
-                impulse = -(1 + restitution) * vel_normal / (1/state.mass[i] + 1/state.mass[j])
 
-                # Apply impulse
-                state.velocity[i] -= impulse * normal / state.mass[i]
-                state.velocity[j] += impulse * normal / state.mass[j]
+def _hash_cell_table(active_indices, positions, cell_size):
+    """
+    Flat spatial hash for the collision kernel.
 
-                # Separate overlapping particles
-                overlap = radii_sum[i_local, j_local] - distances[i_local, j_local]
-                separation = normal * overlap / 2
-                state.position[i] -= separation
-                state.position[j] += separation
+    Cells are numbered in order of first appearance among the active
+    particles, so cells and pairs are visited in a stable order.
 
-        return state
+    Returns:
+        cell_start: (C+1,) offsets of each cell's run in particle_idx
+        particle_idx: (n,) particle indices grouped by cell, in active order
+        neighbors: (C, 14) cell numbers of the cell itself and its half
+            shell of neighbors, -1 if empty
+    """
+    # Truncate toward zero like astype(int) on each position
+    cells = (positions / cell_size).astype(np.int64)
+
+    # Encode cells as scalar keys, padded by one so every neighbor encodes
+    lo = cells.min(axis=0) - 1
+    dims = cells.max(axis=0) - lo + 2
+    strides = np.array([dims[1] * dims[2], dims[2], 1], dtype=np.int64)
+    keys = (cells - lo) @ strides
+
+    unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    # Renumber cells by first appearance
+    rank = np.empty(len(first), dtype=np.int64)
+    rank[np.argsort(first, kind='stable')] = np.arange(len(first))
+    cell_of = rank[inverse]
+
+    order = np.argsort(cell_of, kind='stable')
+    particle_idx = active_indices[order]
+    cell_start = np.zeros(len(first) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(cell_of, minlength=len(first)), out=cell_start[1:])
+
+    # Look up each cell's half-shell neighbors among the occupied keys
+    cell_keys = np.empty(len(first), dtype=np.int64)
+    cell_keys[rank] = unique_keys
+    neighbor_keys = cell_keys[:, np.newaxis] + _NEIGHBOR_OFFSETS @ strides
+    slot = np.minimum(np.searchsorted(unique_keys, neighbor_keys), len(unique_keys) - 1)
+    neighbors = np.where(unique_keys[slot] == neighbor_keys, rank[slot], -1)
+
+    return cell_start, particle_idx, neighbors
+
+
+@njit(cache=True)
+def _resolve_hashed_collisions(position, velocity, mass, radius,
+                               cell_start, particle_idx, neighbors, restitution):
+    """
+    Resolve collisions pair by pair over the flat spatial hash, in place.
 
-    constraint_func.__name__ = 'particle_particle_collision'
-    return constraint_func
+    Pairs are resolved sequentially, so later pairs see the velocities
+    and positions earlier ones updated.
+    """
+    for c in range(neighbors.shape[0]):
+        for k in range(neighbors.shape[1]):
+            nb = neighbors[c, k]
+            if nb < 0:
+                continue
+            for a in range(cell_start[c], cell_start[c + 1]):
+                i = particle_idx[a]
+                # Within the cell itself only later particles pair with i;
+                # across cells the half shell already makes pairs unique
+                b_start = a + 1 if k == 0 else cell_start[nb]
+                for b in range(b_start, cell_start[nb + 1]):
+                    j = particle_idx[b]
+
+                    dx = position[j, 0] - position[i, 0]
+                    dy = position[j, 1] - position[i, 1]
+                    dz = position[j, 2] - position[i, 2]
+                    dist_sq = dx * dx + dy * dy + dz * dz
+                    radii_sum = radius[i] + radius[j]
+
+                    # Squared test; the root is only needed for a contact
+                    if dist_sq < radii_sum * radii_sum and dist_sq > 0:
+                        distance = np.sqrt(dist_sq)
+                        nx = dx / distance
+                        ny = dy / distance
+                        nz = dz / distance
+
+                        vel_normal = ((velocity[j, 0] - velocity[i, 0]) * nx +
+                                      (velocity[j, 1] - velocity[i, 1]) * ny +
+                                      (velocity[j, 2] - velocity[i, 2]) * nz)
+
+                        # Only resolve if moving toward each other
+                        if vel_normal < 0:
+                            # Massless particles use mass 1, as in the engine
+                            m_i = mass[i] if mass[i] > 0 else 1.0
+                            m_j = mass[j] if mass[j] > 0 else 1.0
+                            impulse = -(1 + restitution) * vel_normal / \
+                                      (1 / m_i + 1 / m_j)
+
+                            velocity[i, 0] -= impulse * nx / m_i
+                            velocity[i, 1] -= impulse * ny / m_i
+                            velocity[i, 2] -= impulse * nz / m_i
+                            velocity[j, 0] += impulse * nx / m_j
+                            velocity[j, 1] += impulse * ny / m_j
+                            velocity[j, 2] += impulse * nz / m_j
+
+                            # Separate overlapping particles
+                            overlap = radii_sum - distance
+                            position[i, 0] -= nx * overlap / 2
+                            position[i, 1] -= ny * overlap / 2
+                            position[i, 2] -= nz * overlap / 2
+                            position[j, 0] += nx * overlap / 2
+                            position[j, 1] += ny * overlap / 2
+                            position[j, 2] += nz * overlap / 2
 
 
 def _particle_collision_spatial_hash(restitution: float):
@@ -233,68 +419,18 @@ def _particle_collision_spatial_hash(restitution: float):
         max_radius = np.max(state.radius[active_indices])
         cell_size = max_radius * 2.5
 
-        # Build spatial hash grid
-        # Key: (cell_x, cell_y, cell_z), Value: list of particle indices
-        hash_grid = defaultdict(list)
-
-        for idx in active_indices:
-            pos = state.position[idx]
-            cell = tuple((pos / cell_size).astype(int))
-            hash_grid[cell].append(idx)
-
-        # Check collisions within each cell and neighbors
-        checked_pairs = set()
-
-        for cell, particles in hash_grid.items():
-            # Get neighboring cells (3x3x3 = 27 cells including self)
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    for dz in [-1, 0, 1]:
-                        neighbor_cell = (cell[0] + dx, cell[1] + dy, cell[2] + dz)
-                        if neighbor_cell not in hash_grid:
-                            continue
-
-                        neighbor_particles = hash_grid[neighbor_cell]
-
-                        # Check all pairs between cell and neighbor
-                        for i in particles:
-                            for j in neighbor_particles:
-                                if i >= j:  # Only check each pair once
-                                    continue
-
-                                pair = (i, j)
-                                if pair in checked_pairs:
-                                    continue
-                                checked_pairs.add(pair)
-
-                                # Check collision
-                                diff = state.position[j] - state.position[i]
-                                distance = np.linalg.norm(diff)
-                                radii_sum = state.radius[i] + state.radius[j]
-
-                                if distance < radii_sum and distance > 0:
-                                    # Collision detected - resolve
-                                    normal = diff / distance
-
-                                    # Relative velocity
-                                    rel_vel = state.velocity[j] - state.velocity[i]
-                                    vel_normal = np.dot(rel_vel, normal)
-
-                                    # Only resolve if moving toward each other
-                                    if vel_normal < 0:
-                                        # Impulse
-                                        impulse = -(1 + restitution) * vel_normal / \
-                                                 (1/state.mass[i] + 1/state.mass[j])
-
-                                        # Apply impulse
-                                        state.velocity[i] -= impulse * normal / state.mass[i]
-                                        state.velocity[j] += impulse * normal / state.mass[j]
-
-                                        # Separate overlapping particles
-                                        overlap = radii_sum - distance
-                                        separation = normal * overlap / 2
-                                        state.position[i] -= separation
-                                        state.position[j] += separation
+        # Flat table keyed by packed int64 cells (no per-particle tuples);
+        # without numba the same kernel runs as plain Python. The kernel
+        # reads particles in place: gathering them into cell order first
+        # measured ~10% slower even at 50k particles, and scenes rely on
+        # slot order, so the state arrays are never permuted
+        cell_start, particle_idx, neighbors = _hash_cell_table(
+            active_indices, state.position[active_indices], cell_size
+        )
+        _resolve_hashed_collisions(
+            state.position, state.velocity, state.mass, state.radius,
+            cell_start, particle_idx, neighbors, restitution
+        )
 
         return state
 
@@ -302,6 +438,41 @@ def _particle_collision_spatial_hash(restitution: float):
     return constraint_func
 
 
+@njit(parallel=True, cache=True)
+def _sphere_collision_kernel(position, velocity, active, center, radius, restitution, inside):
+    """Project stray particles onto the sphere surface and reflect velocity"""
+    radius_sq = radius * radius
+    for i in prange(position.shape[0]):
+        if not active[i]:
+            continue
+        rx = position[i, 0] - center[0]
+        ry = position[i, 1] - center[1]
+        rz = position[i, 2] - center[2]
+        r_sq = rx * rx + ry * ry + rz * rz
+
+        if inside:
+            stray = r_sq > radius_sq
+        else:
+            # A particle exactly at the center has no normal to push along
+            stray = 0 < r_sq < radius_sq
+        if not stray:
+            continue
+
+        r_mag = np.sqrt(r_sq)
+        nx = rx / r_mag
+        ny = ry / r_mag
+        nz = rz / r_mag
+        position[i, 0] = center[0] + nx * radius
+        position[i, 1] = center[1] + ny * radius
+        position[i, 2] = center[2] + nz * radius
+
+        # Reflect velocity (v' = v - 2(v·n)n) * restitution
+        v_dot_n = velocity[i, 0] * nx + velocity[i, 1] * ny + velocity[i, 2] * nz
+        velocity[i, 0] = (velocity[i, 0] - 2 * v_dot_n * nx) * restitution
+        velocity[i, 1] = (velocity[i, 1] - 2 * v_dot_n * ny) * restitution
+        velocity[i, 2] = (velocity[i, 2] - 2 * v_dot_n * nz) * restitution
+
+
 def sphere_collision(center: np.ndarray, radius: float, restitution: float = 0.9, inside: bool = False):
     """
     Create collision with spherical boundary.
@@ -337,33 +508,43 @@ def sphere_collision(center: np.ndarray, radius: float, restitution: float = 0.9
     center = np.array(center, dtype=float)
 
     def constraint_func(state: PhysicsState) -> PhysicsState:
+        if NUMBA_AVAILABLE:
+            _sphere_collision_kernel(state.position, state.velocity, state.active,
+                                     center, radius, restitution, inside)
+            return state
+
         active_mask = state.active
 
-        # Vector from center to particle
+        # Vector from center to particle, tested on squared distance
         r_vec = state.position - center
-        r_mag = np.linalg.norm(r_vec, axis=1, keepdims=True)
+        r_sq = np.einsum('ij,ij->i', r_vec, r_vec)
 
         if inside:
             # Particles outside sphere (should be inside)
-            outside = active_mask & (r_mag.squeeze() > radius)
+            outside = active_mask & (r_sq > radius * radius)
         else:
-            # Particles inside sphere (should be outside)
-            outside = active_mask & (r_mag.squeeze() < radius)
-
-        if np.any(outside):
-            # Normal vector at collision point
-            normal = r_vec[outside] / r_mag[outside]
-
-            if inside:
-                # Project position back onto sphere surface (from outside)
-                state.position[outside] = center + normal * radius
-            else:
-                # Push position away from sphere center (from inside)
-                state.position[outside] = center + normal * radius
-
-            # Reflect velocity (v' = v - 2(v·n)n) * restitution
-            v_dot_n = np.sum(state.velocity[outside] * normal, axis=1, keepdims=True)
-            state.velocity[outside] = (state.velocity[outside] - 2 * v_dot_n * normal) * restitution
+            # Particles inside sphere (should be outside); one exactly at
+            # the center has no normal and is skipped, as in the kernel
+            outside = active_mask & (r_sq < radius * radius) & (r_sq > 0)
+
+        # Only the stray rows need a root, a normal and a reflection
+        idx = np.flatnonzero(outside)
+        if len(idx) == 0:
+            return state
+
+        # Normal vector at collision point
+        normal = r_vec[idx] / np.sqrt(r_sq[idx])[:, np.newaxis]
+
+        # Project position back onto the sphere surface (from outside when
+        # containing, from inside when excluding)
+        state.position[idx] = center + normal * radius
+
+        # Reflect velocity (v' = v - 2(v·n)n) * restitution
+        velocity = state.velocity[idx]
+        v_dot_n = np.einsum('ij,ij->i', velocity, normal)
+        velocity -= (2 * v_dot_n)[:, np.newaxis] * normal
+        velocity *= restitution
+        state.velocity[idx] = velocity
 
         return state
 
@@ -9,6 +9,34 @@ Systems for spawning and managing particle lifecycle:
 
 import numpy as np
 from .engine import PhysicsState
+from ..jit import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(cache=True)
+def _free_slots_kernel(active, n):
+    """Indices of the first n inactive slots, stopping once they are found"""
+    slots = np.empty(n, dtype=np.int64)
+    found = 0
+    for i in range(active.shape[0]):
+        if found == n:
+            break
+        if not active[i]:
+            slots[found] = i
+            found += 1
+    return slots[:found]
+
+
+def _free_slots(state: PhysicsState, n: int) -> np.ndarray:
+    """
+    Up to n inactive particle slots, lowest index first.
+
+    Scenes and despawn helpers write state.active directly, so it stays the
+    source of truth over a separate free list; with numba the scan stops
+    as soon as n slots are found.
+    """
+    if NUMBA_AVAILABLE:
+        return _free_slots_kernel(state.active, n)
+    return np.where(~state.active)[0][:n]
 
 
 class ParticleEmitter:
@@ -24,7 +52,8 @@ class ParticleEmitter:
     def __init__(self, position: np.ndarray, rate: float = 10.0,
                  velocity_min: float = 3.0, velocity_max: float = 8.0,
                  direction: np.ndarray = None, spread_angle: float = 15.0,
-                 particle_lifetime: float = 10.0, particle_radius: float = 1.5):
+                 particle_lifetime: float = 10.0, particle_radius: float = 1.5,
+                 seed: int = None):
         """
         Initialize particle emitter.
 
@@ -38,6 +67,7 @@ class ParticleEmitter:
             spread_angle: Cone spread in degrees (0 = straight, 90 = hemisphere)
             particle_lifetime: Max lifetime in seconds before despawn
             particle_radius: Radius for newly spawned particles
+            seed: Seed for this emitter's random generator (None = fresh entropy)
 
         Example:
             # Upward fountain
@@ -65,6 +95,12 @@ class ParticleEmitter:
         self.particle_lifetime = particle_lifetime
         self.particle_radius = particle_radius
 
+        # Z-axis to emission direction rotation, fixed for the emitter's life
+        self._rotation = self._direction_rotation(self.direction)
+
+        # Private generator: no global RNG state, reproducible when seeded
+        self.rng = np.random.default_rng(seed)
+
         # Emission timing
         self.last_emit_time = 0.0
         self.emit_accumulator = 0.0
@@ -95,93 +131,101 @@ class ParticleEmitter:
             return 0
 
         # Find inactive particle slots
-        inactive_indices = np.where(~state.active)[0]
+        inactive_indices = _free_slots(state, n_to_emit)
 
         if len(inactive_indices) == 0:
-            # No free slots, recycle oldest particles
-            inactive_indices = np.argsort(state.age)[-n_to_emit:]
+            # No free slots, recycle oldest particles; a partition finds
+            # the n oldest without sorting the whole pool
+            n_recycle = min(n_to_emit, len(state.age))
+            inactive_indices = np.argpartition(state.age, -n_recycle)[-n_recycle:]
 
         # Limit to available slots
         n_to_emit = min(n_to_emit, len(inactive_indices))
         spawn_indices = inactive_indices[:n_to_emit]
 
-        # Spawn particles
-        for idx in spawn_indices:
-            # Random velocity magnitude
-            vel_mag = np.random.uniform(self.velocity_min, self.velocity_max)
-
-            # Random direction within cone
-            vel_dir = self._random_cone_direction()
-
-            # Set particle state
-            state.position[idx] = self.position
-            state.velocity[idx] = vel_dir * vel_mag
-            state.acceleration[idx] = [0, 0, 0]
-            state.radius[idx] = self.particle_radius
-            state.active[idx] = True
-            state.age[idx] = 0.0
-            state.prev_position[idx] = self.position
+        # Spawn particles in one batch; each row holds the magnitude, cone
+        # angle and cone rotation of one particle
+        draws = self.rng.uniform(
+            (self.velocity_min, 0, 0),
+            (self.velocity_max, self.spread_angle, 2 * np.pi),
+            size=(n_to_emit, 3)
+        )
+        vel_mag = draws[:, 0]
+        vel_dir = self._random_cone_directions(draws[:, 1], draws[:, 2])
+
+        # Set particle state
+        state.position[spawn_indices] = self.position
+        state.velocity[spawn_indices] = vel_dir * vel_mag[:, np.newaxis]
+        state.acceleration[spawn_indices] = 0.0
+        state.radius[spawn_indices] = self.particle_radius
+        state.active[spawn_indices] = True
+        state.age[spawn_indices] = 0.0
+        state.prev_position[spawn_indices] = self.position
 
         return n_to_emit
 
-    def _random_cone_direction(self) -> np.ndarray:
+    def _random_cone_directions(self, theta: np.ndarray, phi: np.ndarray) -> np.ndarray:
         """
-        Generate a random direction within the emission cone.
+        Directions within the emission cone for given cone angles.
+
+        Args:
+            theta: (n,) angles from the cone axis (0 to spread_angle)
+            phi: (n,) rotations around the cone axis
 
         Returns:
-            (3,) normalized direction vector
+            (n, 3) normalized direction vectors
         """
-        # Random angle from cone axis (0 to spread_angle)
-        theta = np.random.uniform(0, self.spread_angle)
-
-        # Random rotation around cone axis
-        phi = np.random.uniform(0, 2 * np.pi)
-
         # Convert to Cartesian (cone coordinates)
         # Start with cone pointing along Z-axis
-        cone_dir = np.array([
-            np.sin(theta) * np.cos(phi),
-            np.sin(theta) * np.sin(phi),
+        sin_theta = np.sin(theta)
+        cone_dir = np.stack([
+            sin_theta * np.cos(phi),
+            sin_theta * np.sin(phi),
             np.cos(theta)
-        ])
+        ], axis=1)
 
         # Rotate to align with emission direction
-        return self._rotate_to_direction(cone_dir)
+        return cone_dir @ self._rotation.T
 
-    def _rotate_to_direction(self, vec: np.ndarray) -> np.ndarray:
+    @staticmethod
+    def _direction_rotation(direction: np.ndarray) -> np.ndarray:
         """
-        Rotate a vector from Z-axis alignment to emission direction.
+        Rotation matrix taking the Z axis onto a unit direction.
 
         Args:
-            vec: (3,) vector in cone coordinates
+            direction: (3,) normalized emission direction
 
         Returns:
-            (3,) rotated vector
+            (3, 3) rotation matrix
         """
         # If direction is already Z-axis, no rotation needed
         z_axis = np.array([0.0, 0.0, 1.0])
-        if np.allclose(self.direction, z_axis):
-            return vec
+        if np.allclose(direction, z_axis):
+            return np.eye(3)
 
         # Rotation axis (perpendicular to both)
-        axis = np.cross(z_axis, self.direction)
+        axis = np.cross(z_axis, direction)
         axis_norm = np.linalg.norm(axis)
 
         if axis_norm < 1e-6:
             # Direction is opposite to Z (pointing down)
-            return -vec
+            return -np.eye(3)
 
         axis = axis / axis_norm
 
         # Rotation angle
-        angle = np.arccos(np.dot(z_axis, self.direction))
-
-        # Rodrigues' rotation formula
-        rotated = (vec * np.cos(angle) +
-                  np.cross(axis, vec) * np.sin(angle) +
-                  axis * np.dot(axis, vec) * (1 - np.cos(angle)))
-
-        return rotated
+        angle = np.arccos(np.dot(z_axis, direction))
+
+        # Rodrigues' rotation formula in matrix form:
+        # R = cos(a) I + sin(a) [axis]x + (1 - cos(a)) axis axis^T
+        cross_matrix = np.array([
+            [0.0, -axis[2], axis[1]],
+            [axis[2], 0.0, -axis[0]],
+            [-axis[1], axis[0], 0.0]
+        ])
+        return (np.cos(angle) * np.eye(3) +
+                np.sin(angle) * cross_matrix +
+                (1 - np.cos(angle)) * np.outer(axis, axis))
 
 
 class VolumeEmitter:
@@ -197,7 +241,7 @@ class VolumeEmitter:
     def __init__(self, bounds_min: np.ndarray, bounds_max: np.ndarray,
                  rate: float = 20.0, velocity_mean: np.ndarray = None,
                  velocity_variance: float = 1.0, particle_lifetime: float = 10.0,
-                 particle_radius: float = 1.5):
+                 particle_radius: float = 1.5, seed: int = None):
         """
         Initialize volume emitter.
 
@@ -209,6 +253,7 @@ class VolumeEmitter:
             velocity_variance: Random velocity variance
             particle_lifetime: Max lifetime before despawn
             particle_radius: Radius for newly spawned particles
+            seed: Seed for this emitter's random generator (None = fresh entropy)
 
         Example:
             # Rain from ceiling
@@ -233,6 +278,9 @@ class VolumeEmitter:
         self.particle_lifetime = particle_lifetime
         self.particle_radius = particle_radius
 
+        # Private generator: no global RNG state, reproducible when seeded
+        self.rng = np.random.default_rng(seed)
+
         # Emission timing
         self.emit_accumulator = 0.0
 
@@ -259,32 +307,31 @@ class VolumeEmitter:
             return 0
 
         # Find inactive particle slots
-        inactive_indices = np.where(~state.active)[0]
+        inactive_indices = _free_slots(state, n_to_emit)
 
         if len(inactive_indices) == 0:
             # No free slots, recycle oldest particles
-            inactive_indices = np.argsort(state.age)[-n_to_emit:]
+            n_recycle = min(n_to_emit, len(state.age))
+            inactive_indices = np.argpartition(state.age, -n_recycle)[-n_recycle:]
 
         # Limit to available slots
         n_to_emit = min(n_to_emit, len(inactive_indices))
         spawn_indices = inactive_indices[:n_to_emit]
 
         # Spawn particles at random positions in volume
-        for idx in spawn_indices:
-            # Random position in volume
-            pos = np.random.uniform(self.bounds_min, self.bounds_max)
-
-            # Random velocity (mean + variance)
-            vel = self.velocity_mean + np.random.randn(3) * self.velocity_variance
-
-            # Set particle state
-            state.position[idx] = pos
-            state.velocity[idx] = vel
-            state.acceleration[idx] = [0, 0, 0]
-            state.radius[idx] = self.particle_radius
-            state.active[idx] = True
-            state.age[idx] = 0.0
-            state.prev_position[idx] = pos
+        pos = self.rng.uniform(self.bounds_min, self.bounds_max, size=(n_to_emit, 3))
+
+        # Random velocity (mean + variance)
+        vel = self.velocity_mean + self.rng.standard_normal((n_to_emit, 3)) * self.velocity_variance
+
+        # Set particle state
+        state.position[spawn_indices] = pos
+        state.velocity[spawn_indices] = vel
+        state.acceleration[spawn_indices] = 0.0
+        state.radius[spawn_indices] = self.particle_radius
+        state.active[spawn_indices] = True
+        state.age[spawn_indices] = 0.0
+        state.prev_position[spawn_indices] = pos
 
         return n_to_emit
 
@@ -305,6 +352,19 @@ def despawn_old_particles(state: PhysicsState, max_lifetime: float):
     state.active[old_particles] = False
 
 
+@njit(parallel=True, cache=True)
+def _despawn_out_of_bounds_kernel(position, active, bounds_min, bounds_max):
+    """Deactivate active particles with any coordinate outside the bounds"""
+    for i in prange(position.shape[0]):
+        if not active[i]:
+            continue
+        for axis in range(3):
+            p = position[i, axis]
+            if p < bounds_min[axis] or p > bounds_max[axis]:
+                active[i] = False
+                break
+
+
 def despawn_out_of_bounds(state: PhysicsState, bounds_min: np.ndarray, bounds_max: np.ndarray):
     """
     Deactivate particles that leave the specified bounds.
@@ -323,6 +383,11 @@ def despawn_out_of_bounds(state: PhysicsState, bounds_min: np.ndarray, bounds_ma
     bounds_min = np.array(bounds_min, dtype=float)
     bounds_max = np.array(bounds_max, dtype=float)
 
+    if NUMBA_AVAILABLE:
+        # All six compares per particle in one pass, no temporaries
+        _despawn_out_of_bounds_kernel(state.position, state.active, bounds_min, bounds_max)
+        return
+
     out_of_bounds = state.active & (
         (state.position[:, 0] < bounds_min[0]) |
         (state.position[:, 0] > bounds_max[0]) |
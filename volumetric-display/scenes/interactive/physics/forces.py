@@ -10,9 +10,109 @@ Modular force functions for particle physics:
 """
 
 import numpy as np
+from ..jit import NUMBA_AVAILABLE, njit, prange
 from .engine import PhysicsState
 
 
+def _scratch(buffers, name, shape):
+    """Work array kept on a force closure, reallocated only when N changes"""
+    buf = buffers.get(name)
+    if buf is None or buf.shape != shape:
+        buf = buffers[name] = np.empty(shape)
+    return buf
+
+
+# Accumulating kernels: each adds its force into the engine's net_force
+# buffer in one pass over the particles, so a step makes no per-force (N, 3)
+# temporaries. The factories attach them as force_func.accumulate; the
+# returned callables stay plain (state, t) -> (N, 3) functions, so scenes
+# can keep building and swapping forces as before.
+
+@njit(parallel=True, cache=True)
+def _accumulate_gravity(net_force, mass, active, g, axis):
+    for i in prange(net_force.shape[0]):
+        if active[i]:
+            net_force[i, axis] += mass[i] * g
+
+
+@njit(parallel=True, cache=True)
+def _accumulate_drag(net_force, velocity, active, coefficient):
+    for i in prange(net_force.shape[0]):
+        if active[i]:
+            for k in range(3):
+                net_force[i, k] += -coefficient * velocity[i, k]
+
+
+@njit(parallel=True, cache=True)
+def _accumulate_wind(net_force, active, base_force, noise, noise_scale):
+    # An empty noise array means smooth wind
+    turbulent = noise.shape[0] > 0
+    for i in prange(net_force.shape[0]):
+        if active[i]:
+            for k in range(3):
+                if turbulent:
+                    net_force[i, k] += noise[i, k] * noise_scale + base_force[k]
+                else:
+                    net_force[i, k] += base_force[k]
+
+
+@njit(parallel=True, cache=True)
+def _accumulate_gravity_well(net_force, position, mass, active, center,
+                             strength, min_distance):
+    for i in prange(net_force.shape[0]):
+        if not active[i]:
+            continue
+        rx = center[0] - position[i, 0]
+        ry = center[1] - position[i, 1]
+        rz = center[2] - position[i, 2]
+        # One reciprocal serves both the 1/r^2 magnitude and the unit
+        # direction, instead of four divides per particle
+        inv_r = 1.0 / max(np.sqrt(rx * rx + ry * ry + rz * rz), min_distance)
+        scale = strength * mass[i] * (inv_r * inv_r * inv_r)
+        net_force[i, 0] += scale * rx
+        net_force[i, 1] += scale * ry
+        net_force[i, 2] += scale * rz
+
+
+@njit(parallel=True, cache=True)
+def _accumulate_spring(net_force, position, velocity, active, anchor_positions,
+                       stiffness, damping):
+    for i in prange(net_force.shape[0]):
+        if active[i]:
+            for k in range(3):
+                net_force[i, k] += (-stiffness * (position[i, k] - anchor_positions[i, k])
+                                    + -damping * velocity[i, k])
+
+
+@njit(parallel=True, cache=True)
+def _accumulate_vortex(net_force, position, active, center, axis, strength, radius):
+    ax, ay, az = axis[0], axis[1], axis[2]
+    inward_strength = strength * 0.3
+    inv_radius = 1.0 / radius
+    for i in prange(net_force.shape[0]):
+        if not active[i]:
+            continue
+        rx = position[i, 0] - center[0]
+        ry = position[i, 1] - center[1]
+        rz = position[i, 2] - center[2]
+
+        # Component perpendicular to the axis
+        d = rx * ax + ry * ay + rz * az
+        px = rx - d * ax
+        py = ry - d * ay
+        pz = rz - d * az
+        r_perp_mag = max(np.sqrt(px * px + py * py + pz * pz), 0.1)
+
+        falloff = np.exp(-r_perp_mag * inv_radius)
+        force_magnitude = strength * falloff
+        inward = inward_strength * falloff / r_perp_mag
+
+        # Swirl along axis x r_perp, minus the pull toward the axis
+        net_force[i, 0] += force_magnitude * (ay * pz - az * py) - inward * px
+        net_force[i, 1] += force_magnitude * (az * px - ax * pz) - inward * py
+        net_force[i, 2] += force_magnitude * (ax * py - ay * px) - inward * pz
+
+
 def gravity(g: float = -9.8, axis: int = 2):
     """
     Create a uniform gravity force in the specified axis direction.
@@ -39,6 +139,9 @@ def gravity(g: float = -9.8, axis: int = 2):
         return force
 
     force_func.__name__ = 'gravity'
+    if NUMBA_AVAILABLE:
+        force_func.accumulate = lambda state, t, net_force: _accumulate_gravity(
+            net_force, state.mass, state.active, g, axis)
     return force_func
 
 
@@ -73,6 +176,9 @@ def drag(coefficient: float = 0.1):
         return force
 
     force_func.__name__ = 'drag'
+    if NUMBA_AVAILABLE:
+        force_func.accumulate = lambda state, t, net_force: _accumulate_drag(
+            net_force, state.velocity, state.active, coefficient)
     return force_func
 
 
@@ -105,28 +211,56 @@ def gravity_well(center: np.ndarray, strength: float = 10.0, min_distance: float
     """
     center = np.array(center, dtype=float)
 
+    scratch = {}
+
     def force_func(state: PhysicsState, t: float) -> np.ndarray:
+        n = len(state.position)
+
         # Vector from particle to center
-        r_vec = center - state.position
-        r_mag = np.linalg.norm(r_vec, axis=1, keepdims=True)
+        r_vec = np.subtract(center, state.position, out=_scratch(scratch, 'r_vec', (n, 3)))
 
-        # Prevent division by zero
-        r_mag = np.maximum(r_mag, min_distance)
+        # Distance, clamped to prevent division by zero
+        r_mag = np.einsum('ij,ij->i', r_vec, r_vec, out=_scratch(scratch, 'r_mag', (n,)))
+        np.sqrt(r_mag, out=r_mag)
+        np.maximum(r_mag, min_distance, out=r_mag)
 
-        # F = G * m / r^2, direction toward center
-        force_magnitude = (strength * state.mass[:, np.newaxis]) / (r_mag ** 2)
-        force_direction = r_vec / r_mag
+        # F = G * m / r^2 along r_vec / r, folded into one per-row scale
+        scale = np.multiply(r_mag, r_mag, out=_scratch(scratch, 'scale', (n,)))
+        scale *= r_mag
+        np.divide(state.mass, scale, out=scale)
+        scale *= strength
 
-        force = force_magnitude * force_direction
+        force = r_vec * scale[:, np.newaxis]
 
         # Only apply to active particles
         force[~state.active] = 0
         return force
 
     force_func.__name__ = 'gravity_well'
+    if NUMBA_AVAILABLE:
+        force_func.accumulate = lambda state, t, net_force: _accumulate_gravity_well(
+            net_force, state.position, state.mass, state.active, center, strength, min_distance)
     return force_func
 
 
+# Unit-normal turbulence for the current wind noise pattern. The pattern
+# only changes ten times a second and scenes rebuild their wind force every
+# frame, so it is kept here and redrawn from a private generator when the
+# pattern index moves on, instead of reseeding the global RNG each step
+_wind_noise_cache = {'seed': None, 'noise': None}
+
+
+def _wind_noise(n_particles: int, t: float) -> np.ndarray:
+    noise_seed = int(t * 10)  # Change noise pattern over time
+    noise = _wind_noise_cache['noise']
+    if _wind_noise_cache['seed'] != noise_seed or len(noise) != n_particles:
+        noise = np.random.default_rng(noise_seed).standard_normal((n_particles, 3))
+        noise.setflags(write=False)
+        _wind_noise_cache['seed'] = noise_seed
+        _wind_noise_cache['noise'] = noise
+    return noise
+
+
 def wind(direction: np.ndarray, strength: float = 1.0, turbulence: float = 0.0):
     """
     Create directional wind force with optional turbulence.
@@ -156,26 +290,33 @@ def wind(direction: np.ndarray, strength: float = 1.0, turbulence: float = 0.0):
     direction = np.array(direction, dtype=float)
     direction = direction / np.linalg.norm(direction)  # Normalize
 
-    def force_func(state: PhysicsState, t: float) -> np.ndarray:
-        # Base wind force
-        base_force = direction * strength
+    # Base wind force
+    base_force = direction * strength
 
+    def force_func(state: PhysicsState, t: float) -> np.ndarray:
         n_particles = len(state.position)
-        force = np.tile(base_force, (n_particles, 1))
 
         # Add turbulence (Perlin-like noise)
         if turbulence > 0:
-            # Time-varying noise for organic motion
-            noise_seed = int(t * 10)  # Change noise pattern over time
-            np.random.seed(noise_seed)
-            noise = np.random.randn(n_particles, 3) * turbulence * strength
-            force += noise
+            force = _wind_noise(n_particles, t) * (turbulence * strength)
+            force += base_force
+        else:
+            force = np.tile(base_force, (n_particles, 1))
 
         # Only apply to active particles
         force[~state.active] = 0
         return force
 
+    def accumulate(state: PhysicsState, t: float, net_force: np.ndarray):
+        if turbulence > 0:
+            noise = _wind_noise(len(state.position), t)
+        else:
+            noise = np.empty((0, 3))
+        _accumulate_wind(net_force, state.active, base_force, noise, turbulence * strength)
+
     force_func.__name__ = 'wind'
+    if NUMBA_AVAILABLE:
+        force_func.accumulate = accumulate
     return force_func
 
 
@@ -228,6 +369,10 @@ def spring(anchor_positions: np.ndarray, stiffness: float = 10.0, damping: float
         return force
 
     force_func.__name__ = 'spring'
+    if NUMBA_AVAILABLE:
+        force_func.accumulate = lambda state, t, net_force: _accumulate_spring(
+            net_force, state.position, state.velocity, state.active,
+            anchor_positions, stiffness, damping)
     return force_func
 
 
@@ -259,35 +404,51 @@ def vortex(center: np.ndarray, axis: np.ndarray, strength: float = 5.0, radius:
     axis = np.array(axis, dtype=float)
     axis = axis / np.linalg.norm(axis)  # Normalize
 
+    scratch = {}
+
     def force_func(state: PhysicsState, t: float) -> np.ndarray:
+        n = len(state.position)
+
         # Vector from center to particle
-        r_vec = state.position - center
+        r_perp = np.subtract(state.position, center, out=_scratch(scratch, 'r_perp', (n, 3)))
 
-        # Project onto axis
-        r_parallel = np.dot(r_vec, axis)[:, np.newaxis] * axis
-        r_perp = r_vec - r_parallel
+        # Remove the component along the axis
+        r_axial = np.einsum('ij,j->i', r_perp, axis, out=_scratch(scratch, 'r_axial', (n,)))
+        r_perp -= np.multiply(r_axial[:, np.newaxis], axis, out=_scratch(scratch, 'r_parallel', (n, 3)))
 
         # Distance from axis
-        r_perp_mag = np.linalg.norm(r_perp, axis=1, keepdims=True)
-        r_perp_mag = np.maximum(r_perp_mag, 0.1)  # Prevent division by zero
-
-        # Tangential direction (perpendicular to both axis and radius)
-        tangent = np.cross(axis, r_perp)
+        r_perp_mag = np.einsum('ij,ij->i', r_perp, r_perp, out=_scratch(scratch, 'r_perp_mag', (n,)))
+        np.sqrt(r_perp_mag, out=r_perp_mag)
+        np.maximum(r_perp_mag, 0.1, out=r_perp_mag)  # Prevent division by zero
 
         # Force magnitude decreases with distance from axis
-        falloff = np.exp(-r_perp_mag / radius)
-        force_magnitude = strength * falloff
+        falloff = np.divide(r_perp_mag, -radius, out=_scratch(scratch, 'falloff', (n,)))
+        np.exp(falloff, out=falloff)
+
+        # Tangential direction axis x r_perp, expanded per component
+        force = np.empty((n, 3))
+        ax, ay, az = axis
+        px, py, pz = r_perp[:, 0], r_perp[:, 1], r_perp[:, 2]
+        np.subtract(ay * pz, az * py, out=force[:, 0])
+        np.subtract(az * px, ax * pz, out=force[:, 1])
+        np.subtract(ax * py, ay * px, out=force[:, 2])
 
         # Tangential force (swirl)
-        force = force_magnitude * tangent
+        force *= (strength * falloff)[:, np.newaxis]
 
         # Add inward pull toward axis
         inward_strength = strength * 0.3
-        force -= inward_strength * falloff * (r_perp / r_perp_mag)
+        falloff *= inward_strength
+        falloff /= r_perp_mag
+        r_perp *= falloff[:, np.newaxis]
+        force -= r_perp
 
         # Only apply to active particles
         force[~state.active] = 0
         return force
 
     force_func.__name__ = 'vortex'
+    if NUMBA_AVAILABLE:
+        force_func.accumulate = lambda state, t, net_force: _accumulate_vortex(
+            net_force, state.position, state.active, center, axis, strength, radius)
     return force_func
@@ -8,9 +8,127 @@ Convert particle positions to voxel masks with various rendering modes:
 """
 
 import numpy as np
+from functools import lru_cache
+from ..jit import NUMBA_AVAILABLE, njit, prange
 from .engine import PhysicsState
 
 
+@njit(cache=True)
+def _stamp_sphere_kernel(mask, cz, cy, cx, radius):
+    """
+    Set the voxels of one filled sphere in mask, in place.
+
+    Same bounding box and squared-distance test as draw_sphere's NumPy
+    path, with planes and rows outside the radius skipped early.
+    """
+    r2 = radius * radius
+    z0 = max(int(np.floor(cz - radius)), 0)
+    y0 = max(int(np.floor(cy - radius)), 0)
+    x0 = max(int(np.floor(cx - radius)), 0)
+    z1 = min(int(np.ceil(cz + radius)), mask.shape[0])
+    y1 = min(int(np.ceil(cy + radius)), mask.shape[1])
+    x1 = min(int(np.ceil(cx + radius)), mask.shape[2])
+    for z in range(z0, z1):
+        dz = z - cz
+        dz2 = dz * dz
+        if dz2 > r2:
+            continue
+        for y in range(y0, y1):
+            dy = y - cy
+            dy2 = dy * dy
+            if dy2 + dz2 > r2:
+                continue
+            for x in range(x0, x1):
+                dx = x - cx
+                if dx * dx + dy2 + dz2 <= r2:
+                    mask[z, y, x] = True
+
+
+@njit(cache=True)
+def _stamp_voxel(mask, z, y, x):
+    """Round a continuous position to its voxel and set it if in bounds."""
+    zi = int(np.rint(z))
+    yi = int(np.rint(y))
+    xi = int(np.rint(x))
+    if (0 <= zi < mask.shape[0] and 0 <= yi < mask.shape[1] and
+            0 <= xi < mask.shape[2]):
+        mask[zi, yi, xi] = True
+
+
+@njit(cache=True)
+def _stamp_line_kernel(mask, p0z, p0y, p0x, p1z, p1y, p1x):
+    """
+    Set the voxels of one line in mask, in place.
+
+    Same sampling as draw_line_3d's NumPy path: oversampled points at the
+    np.linspace(0, 1, n) parameters, rounded half to even.
+    """
+    L, H, W = mask.shape
+    z0, y0, x0 = int(np.rint(p0z)), int(np.rint(p0y)), int(np.rint(p0x))
+    z1, y1, x1 = int(np.rint(p1z)), int(np.rint(p1y)), int(np.rint(p1x))
+    if not (0 <= z0 < L and 0 <= y0 < H and 0 <= x0 < W) and \
+            not (0 <= z1 < L and 0 <= y1 < H and 0 <= x1 < W):
+        return  # Both out of bounds
+
+    dz = p1z - p0z
+    dy = p1y - p0y
+    dx = p1x - p0x
+    distance = np.sqrt(dz * dz + dy * dy + dx * dx)
+    if distance < 0.5:
+        # Very short line, just set start point
+        _stamp_voxel(mask, p0z, p0y, p0x)
+        return
+
+    num_steps = max(int(np.ceil(distance * 2)), 2)
+    step = 1.0 / (num_steps - 1)
+    for k in range(num_steps - 1):
+        t = k * step
+        _stamp_voxel(mask, p0z + t * dz, p0y + t * dy, p0x + t * dx)
+    _stamp_voxel(mask, p0z + dz, p0y + dy, p0x + dx)
+
+
+@njit(cache=True)
+def _stamp_lines_kernel(mask, starts, ends):
+    for i in range(starts.shape[0]):
+        _stamp_line_kernel(mask, starts[i, 0], starts[i, 1], starts[i, 2],
+                           ends[i, 0], ends[i, 1], ends[i, 2])
+
+
+@njit(cache=True)
+def _stamp_spheres_kernel(mask, centers, radii):
+    # Serial: neighbouring spheres overlap, and each one only touches a
+    # few dozen voxels
+    for i in range(centers.shape[0]):
+        _stamp_sphere_kernel(mask, centers[i, 0], centers[i, 1], centers[i, 2], radii[i])
+
+
+@njit(parallel=True, cache=True)
+def _stamp_particles_kernel(mask, position, prev_position, radius, active,
+                            spheres, motion_blur):
+    """
+    Stamp every active particle (sphere or point, plus its trail) in place.
+
+    Overlapping particles only ever write True, so the prange writes need
+    no synchronisation.
+    """
+    for i in prange(position.shape[0]):
+        if not active[i]:
+            continue
+        pz, py, px = position[i, 0], position[i, 1], position[i, 2]
+        if spheres:
+            _stamp_sphere_kernel(mask, pz, py, px, radius[i])
+        else:
+            _stamp_voxel(mask, pz, py, px)
+
+        if motion_blur:
+            qz, qy, qx = prev_position[i, 0], prev_position[i, 1], prev_position[i, 2]
+            dz = pz - qz
+            dy = py - qy
+            dx = px - qx
+            if np.sqrt(dz * dz + dy * dy + dx * dx) > 0.1:
+                _stamp_line_kernel(mask, qz, qy, qx, pz, py, px)
+
+
 def particles_to_voxels(state: PhysicsState, grid_shape: tuple,
                         render_mode: str = 'sphere',
                         motion_blur: bool = False) -> np.ndarray:
@@ -38,33 +156,145 @@ def particles_to_voxels(state: PhysicsState, grid_shape: tuple,
         )
     """
     mask = np.zeros(grid_shape, dtype=bool)
-    active_indices = np.where(state.active)[0]
 
-    if len(active_indices) == 0:
+    if NUMBA_AVAILABLE:
+        # One fused pass over the pool, straight from the active mask
+        _stamp_particles_kernel(mask, state.position, state.prev_position,
+                                state.radius, state.active,
+                                render_mode == 'sphere', motion_blur)
         return mask
 
-    for i in active_indices:
-        pos = state.position[i]
+    active_indices = np.flatnonzero(state.active)
 
-        # Render particle at current position
-        if render_mode == 'sphere':
-            mask |= draw_sphere(pos, state.radius[i], grid_shape)
-        else:  # 'point'
-            voxel = np.round(pos).astype(int)
-            if in_bounds(voxel, grid_shape):
-                mask[tuple(voxel)] = True
+    if len(active_indices) == 0:
+        return mask
 
-        # Add motion blur trail
-        if motion_blur:
-            prev_pos = state.prev_position[i]
-            # Only draw trail if particle moved significantly
-            movement = np.linalg.norm(pos - prev_pos)
-            if movement > 0.1:  # Lowered threshold for more visible trails
-                mask |= draw_line_3d(prev_pos, pos, grid_shape)
+    # All active particles are stamped in one vectorized write per mode,
+    # instead of a full-grid mask per particle OR-ed in
+    positions = state.position[active_indices]
+    if render_mode == 'sphere':
+        _stamp_spheres(mask, positions, state.radius[active_indices])
+    else:  # 'point'
+        _stamp_points(mask, np.round(positions).astype(int))
+
+    # Add motion blur trails where the particle moved significantly
+    if motion_blur:
+        prev_positions = state.prev_position[active_indices]
+        delta = positions - prev_positions
+        moved = np.linalg.norm(delta, axis=1) > 0.1  # Lowered threshold for more visible trails
+        if np.any(moved):
+            _stamp_lines(mask, prev_positions[moved], positions[moved])
 
     return mask
 
 
+def _stamp_points(mask: np.ndarray, voxels: np.ndarray):
+    """Set the in-bounds rows of an (M, 3) integer voxel array in mask."""
+    keep = np.all((voxels >= 0) & (voxels < mask.shape), axis=1)
+    voxels = voxels[keep]
+    mask[voxels[:, 0], voxels[:, 1], voxels[:, 2]] = True
+
+
+def _stamp_spheres(mask: np.ndarray, centers: np.ndarray, radii: np.ndarray):
+    """
+    Filled spheres for every (center, radius) pair, same voxels as draw_sphere.
+
+    Without numba, each distinct radius gets a cached offset template that
+    is fanned out over its centers by broadcasting.
+    """
+    if NUMBA_AVAILABLE:
+        _stamp_spheres_kernel(mask, centers, radii)
+        return
+
+    # Pools usually share one radius, so this is normally a single pass
+    for radius in np.unique(radii):
+        group = centers[radii == radius]
+
+        # Bounding boxes, as in draw_sphere (before grid clipping)
+        lo = np.floor(group - radius).astype(int)
+        hi = np.ceil(group + radius).astype(int)
+
+        # Candidate voxels as one (M, K) array per axis, so every
+        # broadcast runs along the long template axis
+        template = _sphere_template(float(radius))
+        keep = None
+        voxels = []
+        for axis in range(3):
+            v = lo[:, axis, np.newaxis] + template[axis]
+            inside = (v >= 0) & (v < hi[:, axis, np.newaxis]) & (v < mask.shape[axis])
+            keep = inside if keep is None else keep & inside
+            voxels.append(v)
+
+        # Squared distance from center, evaluated as in draw_sphere
+        dz, dy, dx = (v - group[:, axis, np.newaxis] for axis, v in enumerate(voxels))
+        keep &= dx**2 + dy**2 + dz**2 <= radius * radius
+
+        mask[voxels[0][keep], voxels[1][keep], voxels[2][keep]] = True
+
+
+@lru_cache(maxsize=32)
+def _sphere_template(radius: float) -> np.ndarray:
+    """
+    (3, K) bounding-box offsets that can fall inside a sphere of this radius.
+
+    Offsets are relative to floor(center - radius). Along each axis the
+    center sits between radius - o and radius - o + 1 from offset o, so
+    box corners that stay outside the sphere for every center are dropped
+    up front; the exact distance test still runs on what is left.
+    """
+    extent = int(np.floor(2 * radius)) + 2
+    o = np.arange(extent)
+    near, far = radius - o, radius - o + 1
+    closest = np.where(near >= 0, near, np.where(far <= 0, -far, 0.0))
+    closest_sq = closest * closest
+
+    offsets = np.indices((extent,) * 3).reshape(3, -1)
+    reach_sq = closest_sq[offsets].sum(axis=0)
+    template = np.ascontiguousarray(offsets[:, reach_sq <= radius * radius * (1 + 1e-9)])
+    template.setflags(write=False)
+    return template
+
+
+def _stamp_lines(mask: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+    """Lines from each start to end row, same voxels as draw_line_3d."""
+    if NUMBA_AVAILABLE:
+        _stamp_lines_kernel(mask, starts, ends)
+        return
+
+    grid_shape = mask.shape
+    start_voxels = np.round(starts).astype(int)
+    end_voxels = np.round(ends).astype(int)
+
+    def inside(voxels):
+        return np.all((voxels >= 0) & (voxels < grid_shape), axis=1)
+
+    # Skip lines whose endpoints are both out of bounds
+    start_in = inside(start_voxels)
+    visible = start_in | inside(end_voxels)
+
+    delta = ends - starts
+    distance = np.linalg.norm(delta, axis=1)
+
+    # Very short lines only set their start point
+    short = visible & (distance < 0.5)
+    _stamp_points(mask, start_voxels[short & start_in])
+
+    long_lines = np.flatnonzero(visible & ~short)
+    if len(long_lines) == 0:
+        return
+
+    # Oversampled points along each line, t matching np.linspace(0, 1, n)
+    num_steps = np.maximum(np.ceil(distance[long_lines] * 2).astype(int), 2)
+    line = np.repeat(long_lines, num_steps)
+    first = np.cumsum(num_steps) - num_steps
+    k = np.arange(len(line)) - np.repeat(first, num_steps)
+    t = k * np.repeat(1.0 / (num_steps - 1), num_steps)
+    t[first + num_steps - 1] = 1.0
+
+    positions = starts[line] + t[:, np.newaxis] * delta[line]
+    _stamp_points(mask, np.round(positions).astype(int))
+
+
 def draw_sphere(center: np.ndarray, radius: float, grid_shape: tuple) -> np.ndarray:
     """
     Draw a filled sphere in voxel space.
@@ -88,6 +318,11 @@ def draw_sphere(center: np.ndarray, radius: float, grid_shape: tuple) -> np.ndar
     """
     mask = np.zeros(grid_shape, dtype=bool)
 
+    if NUMBA_AVAILABLE:
+        _stamp_sphere_kernel(mask, float(center[0]), float(center[1]), float(center[2]),
+                             float(radius))
+        return mask
+
     # Bounding box (clipped to grid)
     min_bounds = np.maximum(np.floor(center - radius).astype(int), [0, 0, 0])
     max_bounds = np.minimum(np.ceil(center + radius).astype(int), grid_shape)
@@ -104,16 +339,18 @@ def draw_sphere(center: np.ndarray, radius: float, grid_shape: tuple) -> np.ndar
     if len(z_range) == 0 or len(y_range) == 0 or len(x_range) == 0:
         return mask
 
-    # Create meshgrid
-    zz, yy, xx = np.meshgrid(z_range, y_range, x_range, indexing='ij')
+    # Open grids: the squared distance broadcasts over the bounding box
+    zz = z_range[:, np.newaxis, np.newaxis]
+    yy = y_range[np.newaxis, :, np.newaxis]
+    xx = x_range[np.newaxis, np.newaxis, :]
 
-    # Distance from center
-    dist = np.sqrt((xx - center[2])**2 +
-                   (yy - center[1])**2 +
-                   (zz - center[0])**2)
+    # Squared distance from center
+    dist_sq = ((xx - center[2])**2 +
+               (yy - center[1])**2 +
+               (zz - center[0])**2)
 
     # Voxels within radius
-    sphere_voxels = dist <= radius
+    sphere_voxels = dist_sq <= radius * radius
 
     # Set mask
     mask[min_bounds[0]:max_bounds[0],
@@ -147,6 +384,11 @@ def draw_line_3d(p0: np.ndarray, p1: np.ndarray, grid_shape: tuple) -> np.ndarra
     """
     mask = np.zeros(grid_shape, dtype=bool)
 
+    if NUMBA_AVAILABLE:
+        _stamp_line_kernel(mask, float(p0[0]), float(p0[1]), float(p0[2]),
+                           float(p1[0]), float(p1[1]), float(p1[2]))
+        return mask
+
     # Convert to integer voxel coordinates
     p0_int = np.round(p0).astype(int)
     p1_int = np.round(p1).astype(int)
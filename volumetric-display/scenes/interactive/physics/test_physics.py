@@ -14,7 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from scenes.interactive.physics import (
     PhysicsEngine, PhysicsState, create_particle_pool,
-    gravity, drag, boundary_collision,
+    gravity, drag, boundary_collision, particle_particle_collision,
     particles_to_voxels
 )
 
@@ -132,9 +132,55 @@ def test_force_functions():
     return True
 
 
+def test_particle_collision_settles():
+    """Colliding balls lose energy, and both collision paths agree."""
+    print("\nTesting Particle Collisions...")
+
+    grid_shape = (20, 40, 40)
+    bounds_min = np.zeros(3)
+    bounds_max = np.array(grid_shape) - 1.0
+    n_balls = 60
+
+    def settle(spatial_hash):
+        engine = PhysicsEngine(bounds_min=bounds_min, bounds_max=bounds_max, dt=0.016)
+        engine.add_force(gravity(g=-9.8, axis=0))
+        engine.add_force(drag(coefficient=0.1))
+        engine.add_constraint(boundary_collision(bounds_min, bounds_max, restitution=0.8))
+        engine.add_constraint(particle_particle_collision(restitution=0.7,
+                                                          spatial_hash=spatial_hash))
+
+        state = create_particle_pool(max_particles=n_balls, grid_shape=grid_shape)
+        rng = np.random.default_rng(0)
+        state.position[:] = rng.uniform(bounds_min + 2, bounds_max - 2, (n_balls, 3))
+        state.velocity[:] = rng.normal(0, 3, (n_balls, 3))
+        state.active[:] = True
+
+        def kinetic_energy():
+            return 0.5 * np.sum(state.mass * np.sum(state.velocity ** 2, axis=1))
+
+        initial = kinetic_energy()
+        for i in range(600):
+            state = engine.step(state, t=i * 0.016)
+        return initial, kinetic_energy()
+
+    naive_initial, naive_final = settle(spatial_hash=False)
+    hash_initial, hash_final = settle(spatial_hash=True)
+    print(f"  Kinetic energy: naive {naive_initial:.1f} -> {naive_final:.1f}, "
+          f"hash {hash_initial:.1f} -> {hash_final:.1f}")
+
+    assert naive_final < naive_initial, "Naive collisions added energy"
+    assert hash_final < hash_initial, "Spatial hash collisions added energy"
+    assert np.isclose(naive_final, hash_final, rtol=0.5), \
+        f"Collision paths diverged: {naive_final} vs {hash_final}"
+
+    print("✓ Particle collision test passed!")
+    return True
+
+
 if __name__ == '__main__':
     try:
-        success = test_force_functions() and test_physics_engine()
+        success = (test_force_functions() and test_physics_engine() and
+                   test_particle_collision_settles())
         if success:
             print("\n✅ All physics tests passed!")
             sys.exit(0)
@@ -15,8 +15,7 @@ from .scenes import SCENE_REGISTRY
 
 # Import color utilities
 from .colors.utils import (
-    vectorized_hsv_to_rgb, parse_hex_color, parse_gradient,
-    interpolate_colors
+    parse_hex_color, parse_gradient, interpolate_colors, rainbow_color
 )
 
 # Import ColorEffects class for advanced color effects
@@ -261,8 +260,7 @@ class InteractiveScene(Scene):
         self._apply_colors(raster, mask, scaled_time)
 
         # LAYER 3: Apply global effects (strobe, pulse, invert)
-        self.global_effects.apply_strobe(raster, self.params, scaled_time)
-        self.global_effects.apply_pulse(raster, self.params, scaled_time)
+        self.global_effects.apply_strobe_pulse(raster, self.params, scaled_time)
 
         # LAYER 4: Apply scrolling mask
         self.masking_system.apply_mask(raster, self.params)
@@ -342,11 +340,8 @@ class InteractiveScene(Scene):
         hue = (x_coords + y_coords + z_coords) * 4 + self.color_time * 50
         hue = hue.astype(np.int32) % 256
 
-        saturation = np.full_like(hue, 255, dtype=np.uint8)
-        value = np.full_like(hue, 255, dtype=np.uint8)
-
-        colors = vectorized_hsv_to_rgb(hue, saturation, value)
-        raster.data[mask] = colors[mask]
+        # Constant saturation/value: a single gather from the rainbow table
+        raster.data[mask] = rainbow_color(hue[mask])
 
     def _apply_base_colors(self, raster, mask, time):
         """Apply solid or gradient base colors"""